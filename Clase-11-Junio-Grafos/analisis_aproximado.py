@@ -0,0 +1,344 @@
+"""
+╔════════════════════════════════════════════════════════════════════════════╗
+║                                                                            ║
+║  Análisis aproximado: diámetro, distancias y centralidad por muestreo      ║
+║  Versión: 1.0.0                                                            ║
+║                                                                            ║
+║  Descripción:                                                              ║
+║  Las respuestas exactas necesitan un BFS desde cada vértice (n BFS).       ║
+║  Estas funciones usan solo unos pocos, con el BFS por niveles de           ║
+║  bfs_vectorizado.py sobre el GrafoCompacto:                                ║
+║     • cotas_diametro: doble barrido para la cota inferior e iFUB para      ║
+║       ir bajando la superior hasta que coinciden (grafos no dirigidos).    ║
+║     • histograma_distancias: fracción de pares a cada distancia en         ║
+║       saltos, con BFS desde `muestras` orígenes al azar.                   ║
+║     • cercania_aproximada: cercanía armónica desde `pivotes` pivotes.      ║
+║     • intermediacion_aproximada: Brandes desde `pivotes` orígenes.         ║
+║                                                                            ║
+║  Los orígenes se eligen sin reposición con random.Random(semilla): con     ║
+║  la misma semilla y el mismo número de orígenes el resultado es el mismo.  ║
+║  Con `tiempo_limite` (segundos) se deja de muestrear al vencer el plazo    ║
+║  y se devuelve lo obtenido, con su cota de error. Los estimadores son      ║
+║  insesgados y 'error' es una cota de Hoeffding válida para todos los       ║
+║  valores a la vez con probabilidad `confianza`: baja como 1/sqrt(k) y es   ║
+║  0 cuando se usan los n orígenes (resultado exacto).                       ║
+║                                                                            ║
+║  Uso: python analisis_aproximado.py [num_vertices]                         ║
+║                                                                            ║
+╚════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import math
+import random
+import time
+
+from bfs_vectorizado import np, recorrer_niveles_buffers
+from grafo_compacto import GrafoCompacto
+
+MUESTRAS = 64
+CONFIANZA = 0.95
+
+
+def _compacto(grafo):
+    return grafo if isinstance(grafo, GrafoCompacto) else grafo.compactar()
+
+
+# Orden de visita por niveles y distancias en saltos desde el id `origen` (-1 = no alcanzado)
+def _recorrer(compacto, origen):
+    return recorrer_niveles_buffers(compacto.offsets, compacto.destinos, origen)
+
+
+# (excentricidad, id más lejano) a partir de las distancias de un BFS
+def _mas_lejano(distancias):
+    if np is not None:
+        lejano = int(distancias.argmax())
+    else:
+        lejano = max(range(len(distancias)), key=distancias.__getitem__)
+    return int(distancias[lejano]), lejano
+
+
+# Cota de Hoeffding para la media de k muestras con valores en [0, rango], simultánea
+# para `cantidad` estimaciones. Sin reposición y con k = n la media es exacta.
+def _error(k, n, cantidad, rango, confianza):
+    if k >= n:
+        return 0.0
+    return rango * math.sqrt(math.log(2 * cantidad / (1 - confianza)) / (2 * k))
+
+
+# Llama a `procesar(id)` para orígenes al azar sin reposición hasta completar `muestras`
+# o vencer `tiempo_limite` (siempre procesa al menos uno). Devuelve (orígenes usados, segundos).
+def _muestrear(n, muestras, semilla, tiempo_limite, procesar):
+    if muestras < 1:
+        raise ValueError("Se necesita al menos una muestra")
+    inicio = time.perf_counter()
+    usados = 0
+    for origen in random.Random(semilla).sample(range(n), min(muestras, n)):
+        procesar(origen)
+        usados += 1
+        if tiempo_limite is not None and time.perf_counter() - inicio > tiempo_limite:
+            break
+    return usados, time.perf_counter() - inicio
+
+
+# Cotas del diámetro (en saltos) de la componente conexa de `inicio`; por defecto, la del
+# vértice de mayor grado. Devuelve {'inferior', 'superior', 'exacto', 'extremos', 'recorridos',
+# 'segundos'}: 'extremos' es un par de vértices a distancia 'inferior'.
+def cotas_diametro(grafo, inicio=None, tiempo_limite=None):
+    compacto = _compacto(grafo)
+    if compacto.es_dirigido:
+        raise ValueError("cotas_diametro requiere un grafo no dirigido")
+    if len(compacto) == 0:
+        raise ValueError("El grafo está vacío")
+    if inicio is None:
+        offsets = compacto.offsets
+        r = max(range(len(compacto)), key=lambda i: offsets[i + 1] - offsets[i])
+    elif inicio not in compacto:
+        raise ValueError(f"El vértice {inicio} no existe en el grafo")
+    else:
+        r = compacto.id_de(inicio)
+    comienzo = time.perf_counter()
+
+    # Doble barrido: el vértice más lejano a desde r, y el más lejano b desde a
+    _, distancias_r = _recorrer(compacto, r)
+    _, a = _mas_lejano(distancias_r)
+    _, distancias_a = _recorrer(compacto, a)
+    inferior, b = _mas_lejano(distancias_a)
+    _, distancias_b = _recorrer(compacto, b)
+    extremos = (a, b)
+
+    # Centro: el punto medio de un camino mínimo a-b (suele tener excentricidad baja)
+    mitad = inferior // 2
+    if np is not None:
+        u = int(np.flatnonzero((distancias_a == mitad) & (distancias_a + distancias_b == inferior))[0])
+    else:
+        u = next(i for i, d in enumerate(distancias_a) if d == mitad and d + distancias_b[i] == inferior)
+    orden, distancias_u = _recorrer(compacto, u)
+    excentricidad_u, lejano = _mas_lejano(distancias_u)
+    if excentricidad_u > inferior:
+        inferior, extremos = excentricidad_u, (u, lejano)
+    superior = 2 * excentricidad_u
+    recorridos = 4
+
+    # iFUB: los vértices del nivel i de u, de afuera hacia adentro. Todo par dentro de los
+    # niveles <= i está a distancia <= 2i, y los pares con un extremo más lejos ya quedaron
+    # acotados por las excentricidades calculadas.
+    niveles = [[] for _ in range(excentricidad_u + 1)]
+    for v in (orden.tolist() if np is not None else orden):
+        niveles[distancias_u[v]].append(v)
+    i = excentricidad_u
+    while inferior < superior:
+        for v in niveles[i]:
+            if tiempo_limite is not None and time.perf_counter() - comienzo > tiempo_limite:
+                break
+            _, distancias_v = _recorrer(compacto, v)
+            recorridos += 1
+            excentricidad, lejano = _mas_lejano(distancias_v)
+            if excentricidad > inferior:
+                inferior, extremos = excentricidad, (v, lejano)
+        else:
+            superior = max(inferior, 2 * (i - 1))  # Nivel i completo
+            i -= 1
+            continue
+        break  # Venció el plazo
+
+    etiquetas = compacto.etiquetas
+    return {'inferior': inferior, 'superior': superior, 'exacto': inferior == superior,
+            'extremos': (etiquetas[extremos[0]], etiquetas[extremos[1]]), 'recorridos': recorridos,
+            'segundos': time.perf_counter() - comienzo}
+
+
+# Fracción de pares ordenados (u, v), u != v, a cada distancia en saltos. Devuelve
+# {'fracciones': {d: fracción}, 'inalcanzables', 'distancia_media', 'diametro_efectivo', 'error',
+# 'muestras', 'segundos'}. La distancia media y el diámetro efectivo (percentil 90) son entre
+# pares alcanzables; 'error' acota a la vez a todas las fracciones y a 'inalcanzables'.
+def histograma_distancias(grafo, muestras=MUESTRAS, semilla=42, tiempo_limite=None, confianza=CONFIANZA):
+    compacto = _compacto(grafo)
+    n = len(compacto)
+    if n < 2:
+        raise ValueError("Se necesitan al menos 2 vértices")
+    conteos = []  # conteos[d] = pares muestreados a distancia d
+
+    def procesar(origen):
+        _, distancias = _recorrer(compacto, origen)
+        if np is not None:
+            parcial = np.bincount(distancias[distancias >= 0]).tolist()
+        else:
+            parcial = [0] * (max(distancias) + 1)
+            for d in distancias:
+                if d >= 0:
+                    parcial[d] += 1
+        conteos.extend([0] * (len(parcial) - len(conteos)))
+        for d, cantidad in enumerate(parcial):
+            conteos[d] += cantidad
+
+    usados, segundos = _muestrear(n, muestras, semilla, tiempo_limite, procesar)
+    pares = usados * (n - 1)
+    alcanzables = sum(conteos) - conteos[0]  # Sin los pares (u, u)
+    fracciones = {d: conteos[d] / pares for d in range(1, len(conteos)) if conteos[d]}
+    distancia_media = diametro_efectivo = None
+    if alcanzables:
+        distancia_media = sum(d * conteos[d] for d in range(1, len(conteos))) / alcanzables
+        acumulado = 0
+        for d in range(1, len(conteos)):
+            acumulado += conteos[d]
+            if acumulado >= 0.9 * alcanzables:
+                diametro_efectivo = d
+                break
+    return {'fracciones': fracciones, 'inalcanzables': 1 - alcanzables / pares,
+            'distancia_media': distancia_media, 'diametro_efectivo': diametro_efectivo,
+            'error': _error(usados, n, len(conteos), 1.0, confianza), 'muestras': usados, 'segundos': segundos}
+
+
+# Cercanía armónica: c(v) = (1 / (n-1)) * suma de 1 / d(u, v) sobre u != v (0 si u no llega a v).
+# A diferencia de la cercanía clásica, está definida en grafos desconexos y dirigidos, y su
+# estimador desde pivotes es insesgado. Devuelve {'valores': {etiqueta: c}, 'error', 'pivotes',
+# 'segundos'}.
+def cercania_aproximada(grafo, pivotes=MUESTRAS, semilla=42, tiempo_limite=None, confianza=CONFIANZA):
+    compacto = _compacto(grafo)
+    n = len(compacto)
+    if n < 2:
+        raise ValueError("Se necesitan al menos 2 vértices")
+    sumas = np.zeros(n) if np is not None else [0.0] * n
+
+    def procesar(pivote):
+        _, distancias = _recorrer(compacto, pivote)  # d(pivote, v) para todo v
+        if np is not None:
+            alcanzados = distancias > 0
+            sumas[alcanzados] += 1.0 / distancias[alcanzados]
+        else:
+            for v, d in enumerate(distancias):
+                if d > 0:
+                    sumas[v] += 1.0 / d
+
+    usados, segundos = _muestrear(n, pivotes, semilla, tiempo_limite, procesar)
+    escala = n / (usados * (n - 1))
+    valores = sumas.tolist() if np is not None else sumas
+    etiquetas = compacto.etiquetas
+    return {'valores': {etiquetas[v]: valores[v] * escala for v in range(n)},
+            'error': _error(usados, n, n, n / (n - 1), confianza), 'pivotes': usados, 'segundos': segundos}
+
+
+# Dependencias de Brandes desde el id `origen`: delta[v] = suma sobre los destinos t de la
+# fracción de caminos mínimos origen -> t que pasan por v.
+def _dependencias(compacto, origen, aristas_numpy):
+    orden, distancias = _recorrer(compacto, origen)
+    n = len(compacto)
+    if np is not None:
+        # Aristas del DAG de caminos mínimos, agrupadas por el nivel de su origen
+        desde, hacia = aristas_numpy
+        nivel_desde = distancias[desde]
+        en_dag = (nivel_desde >= 0) & (distancias[hacia] == nivel_desde + 1)
+        desde, hacia, nivel_desde = desde[en_dag], hacia[en_dag], nivel_desde[en_dag]
+        ordenadas = np.argsort(nivel_desde, kind='stable')
+        desde, hacia = desde[ordenadas], hacia[ordenadas]
+        cortes = np.searchsorted(nivel_desde[ordenadas], np.arange(int(distancias.max()) + 1)).tolist()
+        cortes.append(len(desde))
+        caminos = np.zeros(n)
+        caminos[origen] = 1.0
+        for inicio, fin in zip(cortes, cortes[1:]):
+            np.add.at(caminos, hacia[inicio:fin], caminos[desde[inicio:fin]])
+        delta = np.zeros(n)
+        for inicio, fin in zip(reversed(cortes[:-1]), reversed(cortes[1:])):
+            u, w = desde[inicio:fin], hacia[inicio:fin]
+            np.add.at(delta, u, caminos[u] / caminos[w] * (1.0 + delta[w]))
+        delta[origen] = 0.0
+        return delta
+
+    offsets, destinos = compacto.offsets, compacto.vista_destinos
+    caminos = [0] * n
+    caminos[origen] = 1
+    for u in orden:
+        siguiente = distancias[u] + 1
+        for w in destinos[offsets[u]:offsets[u + 1]]:
+            if distancias[w] == siguiente:
+                caminos[w] += caminos[u]
+    delta = [0.0] * n
+    for u in reversed(orden):
+        siguiente = distancias[u] + 1
+        for w in destinos[offsets[u]:offsets[u + 1]]:
+            if distancias[w] == siguiente:
+                delta[u] += caminos[u] / caminos[w] * (1.0 + delta[w])
+    delta[origen] = 0.0
+    return delta
+
+
+# Intermediación normalizada: b(v) = suma sobre pares ordenados (s, t) con s, t != v de la
+# fracción de caminos mínimos s -> t que pasan por v, dividida por (n-1)(n-2). Devuelve
+# {'valores': {etiqueta: b}, 'error', 'pivotes', 'segundos'}.
+def intermediacion_aproximada(grafo, pivotes=MUESTRAS, semilla=42, tiempo_limite=None, confianza=CONFIANZA):
+    compacto = _compacto(grafo)
+    n = len(compacto)
+    if n < 3:
+        raise ValueError("Se necesitan al menos 3 vértices")
+    aristas_numpy = None
+    if np is not None:
+        offsets = np.frombuffer(compacto.offsets, dtype=np.int64)
+        aristas_numpy = (np.repeat(np.arange(n), np.diff(offsets)),
+                         np.frombuffer(compacto.destinos, dtype=np.int32 if compacto.destinos.itemsize == 4
+                                       else np.int64))
+    sumas = np.zeros(n) if np is not None else [0.0] * n
+
+    def procesar(origen):
+        delta = _dependencias(compacto, origen, aristas_numpy)
+        if np is not None:
+            np.add(sumas, delta, out=sumas)
+        else:
+            for v in range(n):
+                sumas[v] += delta[v]
+
+    usados, segundos = _muestrear(n, pivotes, semilla, tiempo_limite, procesar)
+    escala = n / (usados * (n - 1) * (n - 2))
+    valores = sumas.tolist() if np is not None else sumas
+    etiquetas = compacto.etiquetas
+    return {'valores': {etiquetas[v]: valores[v] * escala for v in range(n)},
+            'error': _error(usados, n, n, n / (n - 1), confianza), 'pivotes': usados, 'segundos': segundos}
+
+
+# Casos de prueba
+if __name__ == "__main__":
+    import sys
+
+    from generadores import barabasi_albert, erdos_renyi
+    from grafo import Grafo
+
+    # Camino A-B-C-D-E con una rama F colgando de C: diámetro 4, C es el más central
+    grafo = Grafo()
+    for u, v in [('A', 'B'), ('B', 'C'), ('C', 'D'), ('D', 'E'), ('C', 'F')]:
+        grafo.agregar_arista(u, v)
+    print("Cotas del diámetro:", cotas_diametro(grafo))
+    print("Histograma exacto (6 orígenes):", histograma_distancias(grafo, muestras=6)['fracciones'])
+    exacta = intermediacion_aproximada(grafo, pivotes=6)
+    print("Intermediación exacta:", {v: round(b, 3) for v, b in exacta['valores'].items()}, "error", exacta['error'])
+    print("Cercanía armónica exacta:",
+          {v: round(c, 3) for v, c in cercania_aproximada(grafo, pivotes=6)['valores'].items()})
+
+    # Grafo mediano: estimación frente al valor exacto (todos los orígenes)
+    mediano = Grafo()
+    for u, v in barabasi_albert(2_000, 3, semilla=1)[1]:
+        mediano.agregar_arista(u, v)
+    compacto = mediano.compactar()
+    for nombre, funcion in [("cercanía", cercania_aproximada), ("intermediación", intermediacion_aproximada)]:
+        exactos = funcion(compacto, pivotes=len(compacto))['valores']
+        print(f"\n{nombre} en Barabási-Albert de 2000 vértices (máximo exacto {max(exactos.values()):.4f}):")
+        for k in (16, 64, 256):
+            estimacion = funcion(compacto, pivotes=k, semilla=7)
+            desvio = max(abs(estimacion['valores'][v] - exactos[v]) for v in exactos)
+            print(f"  k={k:4}: error máximo observado {desvio:.4f}, cota {estimacion['error']:.4f}")
+
+    # Grafo grande con plazo
+    num_vertices = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    grande = Grafo()
+    for u, v in erdos_renyi(num_vertices, 3 * num_vertices, semilla=2)[1]:
+        grande.agregar_arista(u, v)
+    compacto = grande.compactar()
+    print(f"\nErdős–Rényi de {num_vertices} vértices y {3 * num_vertices} aristas:")
+    cotas = cotas_diametro(compacto, tiempo_limite=3.0)
+    print(f"  diámetro en [{cotas['inferior']}, {cotas['superior']}] con {cotas['recorridos']} BFS "
+          f"en {cotas['segundos']:.2f} s (plazo de 3 s)")
+    for k in (16, 64):
+        histograma = histograma_distancias(compacto, muestras=k)
+        print(f"  histograma con {histograma['muestras']} BFS ({histograma['segundos']:.2f} s): distancia media "
+              f"{histograma['distancia_media']:.3f}, diámetro efectivo {histograma['diametro_efectivo']}, "
+              f"error por fracción <= {histograma['error']:.3f}")
+    plazo = intermediacion_aproximada(compacto, pivotes=10_000, tiempo_limite=1.0)
+    print(f"  intermediación con plazo de 1 s: {plazo['pivotes']} pivotes, error <= {plazo['error']:.4f}")
@@ -0,0 +1,47 @@
+"""
+╔════════════════════════════════════════════════════════════════════════════╗
+║                                                                            ║
+║  Búsqueda de caminos: BFS unidireccional vs bidireccional                  ║
+║                                                                            ║
+║  Uso: python bench_bidireccional.py [num_vertices] [num_aristas] [pares]   ║
+║                                                                            ║
+╚════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import random
+import sys
+import time
+
+from grafo import Grafo
+
+
+if __name__ == "__main__":
+    num_vertices = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    num_aristas = int(sys.argv[2]) if len(sys.argv) > 2 else 300_000
+    num_pares = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+
+    azar = random.Random(42)
+    for es_dirigido in (False, True):
+        grafo = Grafo(es_dirigido=es_dirigido)
+        for _ in range(num_aristas):
+            grafo.agregar_arista(azar.randrange(num_vertices), azar.randrange(num_vertices))
+        vertices = grafo.vertices
+        pares = [(azar.choice(vertices), azar.choice(vertices)) for _ in range(num_pares)]
+        compacto = grafo.compactar()
+        compacto.transpuesto()  # Construir la adyacencia de entrada fuera de la medición
+
+        tiempos = {}
+        for nombre, buscar in [
+            ("unidireccional", lambda s, t: compacto.encontrar_camino(s, t, 'top-down')),
+            ("bidireccional", lambda s, t: compacto.encontrar_camino(s, t)),
+        ]:
+            inicio = time.perf_counter()
+            longitudes = [len(buscar(s, t)) for s, t in pares]
+            tiempos[nombre] = (time.perf_counter() - inicio, longitudes)
+
+        (t_uni, l_uni), (t_bi, l_bi) = tiempos["unidireccional"], tiempos["bidireccional"]
+        tipo = "dirigido" if es_dirigido else "no dirigido"
+        print(f"Grafo {tipo}: {num_vertices} vértices, {num_aristas} aristas, {num_pares} pares aleatorios")
+        print(f"  unidireccional: {t_uni / num_pares * 1000:8.2f} ms/consulta")
+        print(f"  bidireccional:  {t_bi / num_pares * 1000:8.2f} ms/consulta")
+        print(f"  aceleración:    {t_uni / t_bi:8.1f}x   (mismas longitudes: {l_uni == l_bi})\n")
@@ -0,0 +1,68 @@
+"""
+╔════════════════════════════════════════════════════════════════════════════╗
+║                                                                            ║
+║  Comparación de memoria y tiempo: Grafo (diccionario) vs GrafoCompacto     ║
+║                                                                            ║
+║  Uso: python bench_compacto.py [num_vertices] [num_aristas]                ║
+║                                                                            ║
+╚════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+
+from grafo import Grafo
+from grafo_compacto import GrafoCompacto
+from breadth_first_search import bfs, dfs
+
+
+# Grafo aleatorio no dirigido con semilla fija para que las mediciones sean reproducibles
+def grafo_aleatorio(num_vertices, num_aristas, semilla=42):
+    azar = random.Random(semilla)
+    grafo = Grafo()
+    for vertice in range(num_vertices):
+        grafo.agregar_vertice(vertice)
+    for _ in range(num_aristas):
+        grafo.agregar_arista(azar.randrange(num_vertices), azar.randrange(num_vertices))
+    return grafo
+
+
+# Ejecuta funcion() y devuelve (resultado, segundos, bytes asignados en el pico)
+def medir(funcion):
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    resultado = funcion()
+    segundos = time.perf_counter() - inicio
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, segundos, pico
+
+
+def cronometrar(funcion):
+    inicio = time.perf_counter()
+    funcion()
+    return time.perf_counter() - inicio
+
+
+if __name__ == "__main__":
+    num_vertices = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    num_aristas = int(sys.argv[2]) if len(sys.argv) > 2 else 500_000
+
+    grafo, t_dict, mem_dict = medir(lambda: grafo_aleatorio(num_vertices, num_aristas))
+    compacto, t_csr, mem_csr = medir(lambda: GrafoCompacto.desde_grafo(grafo))
+    ultimo = num_vertices - 1
+
+    print(f"Grafo aleatorio: {num_vertices} vértices, {num_aristas} aristas\n")
+    print(f"{'':22}{'diccionario':>14}{'compacto':>14}")
+    print(f"{'memoria (MB)':22}{mem_dict / 2**20:14.1f}{compacto.memoria_bytes() / 2**20:14.1f}")
+    print(f"{'construcción (s)':22}{t_dict:14.3f}{t_csr:14.3f}")
+    for nombre, funcion in [
+        ("bfs (s)", lambda g: bfs(g, 0)),
+        ("dfs (s)", lambda g: dfs(g, 0)),
+        ("es_conexo (s)", lambda g: g.es_conexo()),
+        ("encontrar_camino (s)", lambda g: g.encontrar_camino(0, ultimo)),
+    ]:
+        print(f"{nombre:22}{cronometrar(lambda: funcion(grafo)):14.3f}{cronometrar(lambda: funcion(compacto)):14.3f}")
+    print(f"\n(pico de memoria durante la compactación: {mem_csr / 2**20:.1f} MB)")
@@ -0,0 +1,222 @@
+"""
+╔════════════════════════════════════════════════════════════════════════════╗
+║                                                                            ║
+║  Benchmarks reproducibles de las tres implementaciones de Grafo            ║
+║  Versión: 1.0.0                                                            ║
+║                                                                            ║
+║  Implementaciones comparadas:                                              ║
+║     • grafo         Clase-11-Junio-Grafos/grafo.py (+ bfs/dfs de           ║
+║                     breadth_first_search.py)                               ║
+║     • grafos        grafos.py (raíz del repositorio)                       ║
+║     • conectividad  "conectividad y ruta simple.py" (raíz); no tiene dfs   ║
+║                     ni existe_arista, y su bfs es el método _bfs           ║
+║                                                                            ║
+║  Para cada generador de generadores.py y cada implementación se mide:      ║
+║  construcción, bfs, dfs, es_conexo, encontrar_camino y existe_arista.      ║
+║  Cada caso corre en un proceso nuevo para que el pico de RSS sea solo      ║
+║  suyo. La salida es JSON con mediana, p95, consultas/s, aristas/s (solo    ║
+║  para lo que recorre el grafo) y RSS.                                      ║
+║                                                                            ║
+║  Uso: python bench_grafos.py [--vertices N] [--repeticiones R]             ║
+║           [--semilla S] [--implementaciones a,b] [--generadores x,y]       ║
+║           [--salida resultados.json]                                       ║
+║                                                                            ║
+╚════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import argparse
+import importlib.util
+import json
+import math
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import statistics
+import sys
+import time
+
+from generadores import GENERADORES
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+IMPLEMENTACIONES = ('grafo', 'grafos', 'conectividad')
+CONSULTAS_POR_LOTE = 500  # existe_arista es demasiado rápida para cronometrarla de a una
+
+
+def _cargar_modulo(nombre, ruta):
+    especificacion = importlib.util.spec_from_file_location(nombre, ruta)
+    modulo = importlib.util.module_from_spec(especificacion)
+    especificacion.loader.exec_module(modulo)
+    return modulo
+
+
+# Clase del grafo y operaciones de una implementación. Cada operación es función(grafo, u, v);
+# None indica que la implementación no la ofrece.
+def cargar_implementacion(nombre):
+    if nombre == 'grafo':
+        from grafo import Grafo
+        from breadth_first_search import bfs, dfs
+        return Grafo, {
+            'bfs': lambda grafo, u, v: bfs(grafo, u),
+            'dfs': lambda grafo, u, v: dfs(grafo, u),
+            'es_conexo': lambda grafo, u, v: grafo.es_conexo(),
+            'encontrar_camino': lambda grafo, u, v: grafo.encontrar_camino(u, v),
+            'existe_arista': lambda grafo, u, v: grafo.existe_arista(u, v),
+        }
+    if nombre == 'grafos':
+        grafos = _cargar_modulo('grafos', os.path.join(RAIZ, 'grafos.py'))
+        return grafos.Grafo, {
+            'bfs': lambda grafo, u, v: grafo.bfs(u),
+            'dfs': lambda grafo, u, v: grafo.dfs(u),
+            'es_conexo': lambda grafo, u, v: grafo.es_conexo(),
+            'encontrar_camino': lambda grafo, u, v: grafo.encontrar_camino(u, v),
+            'existe_arista': lambda grafo, u, v: grafo.existe_arista(u, v),
+        }
+    if nombre == 'conectividad':
+        conectividad = _cargar_modulo('conectividad_y_ruta_simple',
+                                      os.path.join(RAIZ, 'conectividad y ruta simple.py'))
+        return conectividad.Grafo, {
+            'bfs': lambda grafo, u, v: grafo._bfs(u, set()),
+            'dfs': None,
+            'es_conexo': lambda grafo, u, v: grafo.es_conexo(),
+            'encontrar_camino': lambda grafo, u, v: grafo.encontrar_camino(u, v),
+            'existe_arista': None,
+        }
+    raise ValueError(f"Implementación desconocida: {nombre}. Use una de {IMPLEMENTACIONES}")
+
+
+def rss_pico_kb():
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico // 1024 if sys.platform == 'darwin' else pico  # macOS lo da en bytes, Linux en KB
+
+
+# Mediana y percentil 95 (por rango más cercano) de una lista de tiempos
+def resumir(tiempos):
+    ordenados = sorted(tiempos)
+    return statistics.median(ordenados), ordenados[math.ceil(0.95 * len(ordenados)) - 1]
+
+
+# Un caso completo (generador x implementación). Corre en un proceso propio.
+def ejecutar_caso(generador, implementacion, num_vertices, repeticiones, semilla):
+    n, aristas = GENERADORES[generador](num_vertices, semilla)
+    clase, operaciones = cargar_implementacion(implementacion)
+    azar = random.Random(semilla)
+    rss_inicial = rss_pico_kb()
+
+    def construir():
+        grafo = clase()
+        for vertice in range(n):  # Primero los vértices: "conectividad" ignora aristas con extremos nuevos
+            grafo.agregar_vertice(vertice)
+        for u, v in aristas:
+            grafo.agregar_arista(u, v)
+        return grafo
+
+    def cronometrar(funcion, *argumentos):
+        inicio = time.perf_counter()
+        funcion(*argumentos)
+        return time.perf_counter() - inicio
+
+    tiempos = {'construccion': [cronometrar(construir) for _ in range(repeticiones)]}
+    grafo = construir()
+    for nombre in ('bfs', 'dfs', 'es_conexo'):
+        if operaciones[nombre] is not None:
+            tiempos[nombre] = [cronometrar(operaciones[nombre], grafo, 0, None) for _ in range(repeticiones)]
+    if operaciones['encontrar_camino'] is not None:
+        # Pares distintos en cada repetición (los mismos para todas las implementaciones)
+        pares = [(azar.randrange(n), azar.randrange(n)) for _ in range(repeticiones)]
+        tiempos['encontrar_camino'] = [cronometrar(operaciones['encontrar_camino'], grafo, u, v) for u, v in pares]
+    if operaciones['existe_arista'] is not None:
+        existe = operaciones['existe_arista']
+        tiempos['existe_arista'] = []
+        for _ in range(repeticiones):
+            # Mitad aristas existentes, mitad pares al azar
+            lote = [azar.choice(aristas) if i % 2 else (azar.randrange(n), azar.randrange(n))
+                    for i in range(CONSULTAS_POR_LOTE)]
+            inicio = time.perf_counter()
+            for u, v in lote:
+                existe(grafo, u, v)
+            tiempos['existe_arista'].append((time.perf_counter() - inicio) / CONSULTAS_POR_LOTE)
+
+    rss = rss_pico_kb()
+    resultados = []
+    for operacion in ('construccion', 'bfs', 'dfs', 'es_conexo', 'encontrar_camino', 'existe_arista'):
+        resultado = {
+            'generador': generador, 'implementacion': implementacion, 'operacion': operacion,
+            'vertices': n, 'aristas': len(aristas), 'repeticiones': repeticiones,
+            'mediana_s': None, 'p95_s': None, 'consultas_por_s': None, 'aristas_por_s': None,
+            'rss_inicial_kb': rss_inicial, 'rss_pico_kb': rss,
+        }
+        if operacion in tiempos:
+            mediana, p95 = resumir(tiempos[operacion])
+            resultado['mediana_s'], resultado['p95_s'] = mediana, p95
+            resultado['consultas_por_s'] = 1 / mediana if mediana > 0 else None
+            # Solo las operaciones que recorren todo el grafo. es_conexo de "grafo" responde con
+            # su índice Union-Find sin recorrer nada: ahí aristas/s no tendría sentido
+            recorre = operacion in ('construccion', 'bfs', 'dfs', 'es_conexo') \
+                and not (operacion == 'es_conexo' and implementacion == 'grafo')
+            if recorre:
+                resultado['aristas_por_s'] = len(aristas) / mediana if mediana > 0 else None
+        resultados.append(resultado)
+    return resultados
+
+
+def _tabla(resultados):
+    lineas = [f"{'generador':16}{'implementación':15}{'operación':18}{'mediana (µs)':>14}"
+              f"{'p95 (µs)':>12}{'consultas/s':>15}{'aristas/s':>17}{'RSS pico (MB)':>15}"]
+    for r in resultados:
+        if r['mediana_s'] is None:
+            continue
+        consultas_por_s = f"{r['consultas_por_s']:15,.0f}" if r['consultas_por_s'] else f"{'':15}"
+        aristas_por_s = f"{r['aristas_por_s']:17,.0f}" if r['aristas_por_s'] else f"{'':17}"
+        lineas.append(f"{r['generador']:16}{r['implementacion']:15}{r['operacion']:18}"
+                      f"{r['mediana_s'] * 1e6:14.1f}{r['p95_s'] * 1e6:12.1f}{consultas_por_s}{aristas_por_s}"
+                      f"{r['rss_pico_kb'] / 1024:15.1f}")
+    return "\n".join(lineas)
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de las implementaciones de Grafo")
+    parser.add_argument('--vertices', type=int, default=20_000)
+    parser.add_argument('--repeticiones', type=int, default=7)
+    parser.add_argument('--semilla', type=int, default=42)
+    parser.add_argument('--implementaciones', default=','.join(IMPLEMENTACIONES))
+    parser.add_argument('--generadores', default=','.join(GENERADORES))
+    parser.add_argument('--salida', help="archivo JSON (por defecto, la salida estándar)")
+    opciones = parser.parse_args(argumentos)
+
+    implementaciones = opciones.implementaciones.split(',')
+    generadores = opciones.generadores.split(',')
+    for nombre in generadores:
+        if nombre not in GENERADORES:
+            parser.error(f"generador desconocido: {nombre}")
+    for nombre in implementaciones:
+        if nombre not in IMPLEMENTACIONES:
+            parser.error(f"implementación desconocida: {nombre}")
+
+    # 'spawn': cada caso parte de un intérprete limpio, así su RSS no hereda el del proceso principal
+    contexto = multiprocessing.get_context('spawn')
+    resultados = []
+    for generador in generadores:
+        for implementacion in implementaciones:
+            print(f"{generador} / {implementacion}...", file=sys.stderr)
+            with contexto.Pool(1) as pool:
+                resultados += pool.apply(ejecutar_caso, (generador, implementacion, opciones.vertices,
+                                                         opciones.repeticiones, opciones.semilla))
+
+    informe = {
+        'python': platform.python_version(), 'plataforma': platform.platform(),
+        'vertices': opciones.vertices, 'repeticiones': opciones.repeticiones, 'semilla': opciones.semilla,
+        'resultados': resultados,
+    }
+    texto = json.dumps(informe, indent=2, ensure_ascii=False)
+    if opciones.salida:
+        with open(opciones.salida, 'w', encoding='utf-8') as archivo:
+            archivo.write(texto + "\n")
+    else:
+        print(texto)
+    print(_tabla(resultados), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+╔════════════════════════════════════════════════════════════════════════════╗
+║                                                                            ║
+║  Vistas de vecinos vs listas: tiempo y memoria por recorrido               ║
+║                                                                            ║
+║  Compara los recorridos que copian los vecinos de cada vértice a una       ║
+║  lista nueva (obtener_vecinos, rebanadas de array) con los que usan        ║
+║  vistas sin copia (iterar_vecinos, rebanadas de memoryview).               ║
+║  La memoria se mide sobre el recorrido real, en una ejecución aparte del   ║
+║  cronómetro: el pico con tracemalloc por encima de lo ya asignado, los     ║
+║  bloques netos con sys.getallocatedblocks() y lo retenido al terminar con  ║
+║  la diferencia entre dos instantáneas de tracemalloc. Cada copia de        ║
+║  vecinos se libera antes de la siguiente, así que solo sube el pico        ║
+║  cuando una lista es grande (la estrella).                                 ║
+║                                                                            ║
+║  Uso: python bench_vecinos.py [num_vertices] [num_aristas]                 ║
+║                                                                            ║
+╚════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+from bench_compacto import grafo_aleatorio
+from breadth_first_search import bfs, dfs
+from grafo import Grafo
+
+
+# Recorridos como eran antes: una lista nueva de vecinos por cada vértice visitado
+def bfs_con_listas(grafo, inicio):
+    visitados = {inicio}
+    cola = deque([inicio])
+    orden_visita = []
+    while cola:
+        actual = cola.popleft()
+        orden_visita.append(actual)
+        for vecino in grafo.obtener_vecinos(actual):
+            if vecino not in visitados:
+                visitados.add(vecino)
+                cola.append(vecino)
+    return orden_visita
+
+
+def dfs_con_listas(grafo, inicio):
+    visitados = set()
+    pila = [inicio]
+    orden_visita = []
+    while pila:
+        actual = pila.pop()
+        if actual not in visitados:
+            visitados.add(actual)
+            orden_visita.append(actual)
+            for vecino in reversed(grafo.obtener_vecinos(actual)):
+                if vecino not in visitados:
+                    pila.append(vecino)
+    return orden_visita
+
+
+def bfs_compacto_con_copias(compacto, origen):
+    offsets, destinos = compacto.offsets, compacto.destinos  # Rebanadas de array: copian los ids
+    visitados = bytearray(len(compacto))
+    visitados[origen] = 1
+    cola = [origen]
+    for actual in cola:
+        for vecino in destinos[offsets[actual]:offsets[actual + 1]]:
+            if not visitados[vecino]:
+                visitados[vecino] = 1
+                cola.append(vecino)
+    etiquetas = compacto.etiquetas
+    return [etiquetas[i] for i in cola]
+
+
+def cronometrar(funcion):
+    tiempos = []
+    for _ in range(3):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    return min(tiempos)
+
+
+# Memoria del recorrido real: (KB pico, bloques netos, KB retenidos). El pico se cuenta por
+# encima de lo ya asignado antes de la llamada; bloques y KB retenidos incluyen el resultado.
+def memoria(funcion):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        antes = tracemalloc.take_snapshot()
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        bloques = sys.getallocatedblocks()
+        resultado = funcion()
+        bloques = sys.getallocatedblocks() - bloques
+        pico = tracemalloc.get_traced_memory()[1] - base
+        despues = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del resultado
+    retenidos = sum(estadistica.size_diff for estadistica in despues.compare_to(antes, 'filename'))
+    return pico / 1024, bloques, retenidos / 1024
+
+
+def comparar(nombre, grafo, origen):
+    compacto = grafo.compactar()
+    visitados = bfs(grafo, origen)
+    print(f"\n{nombre}: {len(grafo.grafo)} vértices, {len(visitados)} alcanzados desde {origen}\n")
+    print(f"{'':30}{'tiempo (s)':>11}{'KB pico':>10}{'bloques':>10}{'KB retenidos':>14}")
+    for etiqueta, recorrido in [
+        ("bfs con obtener_vecinos", lambda: bfs_con_listas(grafo, origen)),
+        ("bfs con iterar_vecinos", lambda: bfs(grafo, origen)),
+        ("dfs con obtener_vecinos", lambda: dfs_con_listas(grafo, origen)),
+        ("dfs con iterar_vecinos", lambda: dfs(grafo, origen)),
+        ("compacto, rebanada de array", lambda: bfs_compacto_con_copias(compacto, compacto.id_de(origen))),
+        ("compacto, memoryview", lambda: bfs(compacto, origen)),
+    ]:
+        pico, bloques, retenidos = memoria(recorrido)
+        print(f"{etiqueta:30}{cronometrar(recorrido):11.3f}{pico:10.1f}{bloques:>10,}{retenidos:14.1f}")
+
+
+if __name__ == "__main__":
+    num_vertices = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    num_aristas = int(sys.argv[2]) if len(sys.argv) > 2 else 500_000
+
+    comparar(f"Grafo aleatorio con {num_aristas} aristas", grafo_aleatorio(num_vertices, num_aristas), 0)
+
+    # Estrella: un vértice con todos los demás como vecinos (una sola lista enorme)
+    estrella = Grafo()
+    for hoja in range(1, num_vertices):
+        estrella.agregar_arista(0, hoja)
+    comparar("Estrella", estrella, 0)
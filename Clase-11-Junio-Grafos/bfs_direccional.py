@@ -0,0 +1,140 @@
+"""
+╔════════════════════════════════════════════════════════════════════════════╗
+║                                                                            ║
+║  BFS de dirección optimizada (top-down / bottom-up)                        ║
+║  Versión: 1.0.0                                                            ║
+║                                                                            ║
+║  Descripción:                                                              ║
+║  • top-down: cada vértice de la frontera revisa todas sus aristas de       ║
+║    salida (el BFS clásico de breadth_first_search.py).                     ║
+║  • bottom-up: cada vértice NO visitado busca entre sus aristas de entrada  ║
+║    un padre que esté en la frontera y se detiene en el primero que         ║
+║    encuentra. Es mucho más barato cuando la frontera es enorme.            ║
+║  • hibrida: empieza top-down, pasa a bottom-up cuando las aristas que      ║
+║    saldrían de la frontera superan (aristas sin visitar) / alfa, y vuelve  ║
+║    a top-down cuando la frontera baja de n / beta vértices.                ║
+║                                                                            ║
+║  Todas las estrategias producen un árbol BFS válido (mismas distancias),   ║
+║  aunque el padre elegido para cada vértice puede diferir.                  ║
+║                                                                            ║
+╚════════════════════════════════════════════════════════════════════════════╝
+"""
+
+from array import array
+
+from grafo_compacto import GrafoCompacto, tipo_indice
+
+# Parámetros de la heurística (valores sugeridos por Beamer et al.)
+ALFA = 14
+BETA = 24
+
+ESTRATEGIAS = ('top-down', 'bottom-up', 'hibrida')
+
+
+# BFS desde el id `origen`.
+# Devuelve (padres, estadisticas):
+#   padres[v] = id del padre de v en el árbol BFS (origen es su propio padre, -1 si no se alcanzó)
+#   estadisticas = {'aristas_inspeccionadas': int, 'niveles': [(modo, tamaño_frontera, aristas), ...]}
+# Si se indica `destino`, el recorrido termina al completar el nivel en el que se descubre.
+def bfs_direccional(grafo: GrafoCompacto, origen, estrategia='hibrida', alfa=ALFA, beta=BETA, destino=None):
+    if estrategia not in ESTRATEGIAS:
+        raise ValueError(f"Estrategia desconocida: {estrategia}. Use una de {ESTRATEGIAS}")
+
+    n = len(grafo)
+    offsets, destinos = grafo.offsets, grafo.vista_destinos
+    entrada = grafo.transpuesto()  # Aristas de entrada para el paso bottom-up
+    offsets_entrada, destinos_entrada = entrada.offsets, entrada.vista_destinos
+
+    padres = array(tipo_indice(n), [-1]) * n
+    padres[origen] = origen
+    frontera = [origen]
+    no_visitados = None  # Se calcula al entrar en modo bottom-up
+    aristas_sin_visitar = len(destinos_entrada) - (offsets_entrada[origen + 1] - offsets_entrada[origen])
+    modo = 'bottom-up' if estrategia == 'bottom-up' else 'top-down'
+    estadisticas = {'aristas_inspeccionadas': 0, 'niveles': []}
+
+    while frontera:
+        if estrategia == 'hibrida':
+            if modo == 'top-down':
+                aristas_frontera = sum(offsets[u + 1] - offsets[u] for u in frontera)
+                if aristas_frontera > aristas_sin_visitar / alfa:
+                    modo = 'bottom-up'
+            elif len(frontera) < n / beta:
+                modo = 'top-down'
+
+        inspeccionadas = 0
+        siguiente = []
+        if modo == 'top-down':
+            no_visitados = None
+            for actual in frontera:
+                for vecino in destinos[offsets[actual]:offsets[actual + 1]]:
+                    inspeccionadas += 1
+                    if padres[vecino] == -1:
+                        padres[vecino] = actual
+                        siguiente.append(vecino)
+        else:
+            if no_visitados is None:
+                no_visitados = [v for v in range(n) if padres[v] == -1]
+            en_frontera = bytearray(n)
+            for u in frontera:
+                en_frontera[u] = 1
+            restantes = []
+            for v in no_visitados:
+                for u in destinos_entrada[offsets_entrada[v]:offsets_entrada[v + 1]]:
+                    inspeccionadas += 1
+                    if en_frontera[u]:
+                        padres[v] = u
+                        siguiente.append(v)
+                        break
+                else:
+                    restantes.append(v)
+            no_visitados = restantes
+
+        for v in siguiente:
+            aristas_sin_visitar -= offsets_entrada[v + 1] - offsets_entrada[v]
+        estadisticas['aristas_inspeccionadas'] += inspeccionadas
+        estadisticas['niveles'].append((modo, len(frontera), inspeccionadas))
+
+        if destino is not None and padres[destino] != -1:
+            break
+        frontera = siguiente
+
+    return padres, estadisticas
+
+
+# Casos de prueba y comparación de estrategias
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    from grafo import Grafo
+
+    grafo = Grafo()
+    for origen, destino in [('A', 'B'), ('A', 'C'), ('B', 'D'), ('B', 'E'), ('C', 'D'), ('D', 'E')]:
+        grafo.agregar_arista(origen, destino)
+    for estrategia in (None,) + ESTRATEGIAS:
+        print(f"{str(estrategia):10} conexo={grafo.es_conexo(estrategia)} camino A-E={grafo.encontrar_camino('A', 'E', estrategia)}")
+
+    # Grafo tipo red social: preferencia por vértices de grado alto (diámetro pequeño)
+    num_vertices = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    aristas_por_vertice = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    azar = random.Random(7)
+    social = Grafo()
+    extremos = []
+    for v in range(num_vertices):
+        social.agregar_vertice(v)
+        for _ in range(aristas_por_vertice if v else 0):
+            u = azar.choice(extremos) if extremos and azar.random() < 0.8 else azar.randrange(v)
+            social.agregar_arista(v, u)
+            extremos += (u, v)
+    compacto = social.compactar()
+
+    print(f"\nGrafo social: {num_vertices} vértices, {compacto.num_aristas // 2} aristas")
+    print(f"{'estrategia':12}{'aristas inspeccionadas':>24}{'tiempo (s)':>12}  niveles")
+    for estrategia in ESTRATEGIAS:
+        inicio = time.perf_counter()
+        padres, estadisticas = bfs_direccional(compacto, 0, estrategia)
+        segundos = time.perf_counter() - inicio
+        modos = ' '.join(modo[0].upper() for modo, _, _ in estadisticas['niveles'])
+        print(f"{estrategia:12}{estadisticas['aristas_inspeccionadas']:>24,}{segundos:>12.3f}  {modos}")
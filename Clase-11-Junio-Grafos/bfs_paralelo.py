@@ -0,0 +1,150 @@
+"""
+╔════════════════════════════════════════════════════════════════════════════╗
+║                                                                            ║
+║  BFS desde muchas fuentes en paralelo (memoria compartida)                 ║
+║  Versión: 1.0.0                                                            ║
+║                                                                            ║
+║  Descripción:                                                              ║
+║  distancias_multiples(grafo, fuentes) reparte las fuentes entre los        ║
+║  procesos de un ProcessPoolExecutor. La adyacencia (offsets y destinos)    ║
+║  se copia UNA vez a un bloque de multiprocessing.shared_memory; cada       ║
+║  proceso se conecta a ese bloque al arrancar, en lugar de recibir el       ║
+║  grafo serializado con pickle.                                             ║
+║                                                                            ║
+║  Los resultados se entregan a medida que terminan (generador). Como        ║
+║  mucho hay `max_pendientes` tareas en vuelo, así que la memoria usada      ║
+║  está acotada aunque haya miles de fuentes: cada proceso solo guarda el    ║
+║  grafo compartido y las distancias de la fuente que está calculando.       ║
+║                                                                            ║
+╚════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import os
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+
+from bfs_vectorizado import np, recorrer_niveles_buffers
+from grafo_compacto import GrafoCompacto
+
+# Estado de cada proceso trabajador (se llena en _inicializar_trabajador)
+_memoria = None
+_offsets = None
+_destinos = None
+
+
+# Copia offsets y destinos a un bloque de memoria compartida.
+# Devuelve (bloque, descripcion) donde descripcion permite a otro proceso reconstruir las vistas.
+def compartir_adyacencia(grafo: GrafoCompacto):
+    tamano_offsets = len(grafo.offsets) * 8
+    tamano_destinos = len(grafo.destinos) * grafo.destinos.itemsize
+    bloque = shared_memory.SharedMemory(create=True, size=max(tamano_offsets + tamano_destinos, 1))
+    with memoryview(grafo.offsets) as origen:
+        bloque.buf[:tamano_offsets] = origen.cast('B')
+    with memoryview(grafo.destinos) as origen:
+        bloque.buf[tamano_offsets:tamano_offsets + tamano_destinos] = origen.cast('B')
+    tipo = 'i' if grafo.destinos.itemsize == 4 else 'q'
+    return bloque, (bloque.name, tamano_offsets, tamano_destinos, tipo)
+
+
+def _inicializar_trabajador(descripcion):
+    global _memoria, _offsets, _destinos
+    nombre, tamano_offsets, tamano_destinos, tipo = descripcion
+    # Los trabajadores comparten el resource_tracker del proceso principal, que es quien
+    # elimina el bloque (unlink) al terminar
+    _memoria = shared_memory.SharedMemory(name=nombre)
+    _offsets = _memoria.buf[:tamano_offsets].cast('q')
+    _destinos = _memoria.buf[tamano_offsets:tamano_offsets + tamano_destinos].cast(tipo)
+
+
+# Tarea de un trabajador: distancias en saltos desde `origen`, como bytes de un array('i')
+def _distancias_desde(origen):
+    _, distancias = recorrer_niveles_buffers(_offsets, _destinos, origen)
+    if np is not None:
+        return origen, distancias.astype(np.int32).tobytes()
+    return origen, array('i', distancias).tobytes()
+
+
+# Distancias BFS desde cada fuente, calculadas en `procesos` procesos.
+# Genera pares (fuente, distancias) en el orden en que terminan; distancias es un array('i')
+# indexado por id de vértice (grafo.etiquetas[i]) con -1 para los no alcanzables.
+def distancias_multiples(grafo, fuentes, procesos=None, max_pendientes=None):
+    compacto = grafo if isinstance(grafo, GrafoCompacto) else grafo.compactar()
+    ids = []
+    for fuente in fuentes:
+        if fuente not in compacto:
+            raise ValueError(f"El vértice {fuente} no existe en el grafo")
+        ids.append(compacto.id_de(fuente))
+    procesos = procesos or os.cpu_count() or 1
+    max_pendientes = max_pendientes or 2 * procesos
+    etiquetas = compacto.etiquetas
+
+    bloque, descripcion = compartir_adyacencia(compacto)
+    try:
+        with ProcessPoolExecutor(procesos, initializer=_inicializar_trabajador,
+                                 initargs=(descripcion,)) as ejecutor:
+            pendientes = set()
+            siguiente = iter(ids)
+            while True:
+                # Mantener como mucho max_pendientes tareas en vuelo
+                for origen in siguiente:
+                    pendientes.add(ejecutor.submit(_distancias_desde, origen))
+                    if len(pendientes) >= max_pendientes:
+                        break
+                if not pendientes:
+                    break
+                terminadas, pendientes = wait(pendientes, return_when=FIRST_COMPLETED)
+                for tarea in terminadas:
+                    origen, datos = tarea.result()
+                    distancias = array('i')
+                    distancias.frombytes(datos)
+                    yield etiquetas[origen], distancias
+    finally:
+        bloque.close()
+        bloque.unlink()
+
+
+# Centralidad de cercanía de cada fuente: vértices alcanzados (sin contar la fuente) / suma de distancias
+def centralidad_cercania(grafo, fuentes, procesos=None):
+    resultado = {}
+    for fuente, distancias in distancias_multiples(grafo, fuentes, procesos):
+        alcanzables = [d for d in distancias if d > 0]
+        resultado[fuente] = len(alcanzables) / sum(alcanzables) if alcanzables else 0.0
+    return resultado
+
+
+# Casos de prueba y escalado
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    from grafo import Grafo
+    from bfs_vectorizado import distancias_bfs
+
+    grafo = Grafo()
+    for origen, destino in [('A', 'B'), ('A', 'C'), ('B', 'D'), ('B', 'E'), ('C', 'D'), ('D', 'E')]:
+        grafo.agregar_arista(origen, destino)
+    grafo.agregar_vertice('F')
+    compacto = grafo.compactar()
+    for fuente, distancias in distancias_multiples(grafo, ['A', 'E', 'F'], procesos=2):
+        print(f"Distancias desde {fuente}:", dict(zip(compacto.etiquetas, distancias)))
+        assert {v: d for v, d in zip(compacto.etiquetas, distancias) if d >= 0} == distancias_bfs(grafo, fuente)
+    print("Cercanía:", centralidad_cercania(grafo, ['A', 'B', 'C', 'D', 'E']))
+
+    num_vertices = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    num_fuentes = int(sys.argv[2]) if len(sys.argv) > 2 else 64
+    azar = random.Random(3)
+    grande = Grafo()
+    for _ in range(num_vertices * 4):
+        grande.agregar_arista(azar.randrange(num_vertices), azar.randrange(num_vertices))
+    fuentes = azar.sample(grande.vertices, num_fuentes)
+
+    print(f"\n{num_fuentes} fuentes sobre {num_vertices} vértices ({os.cpu_count()} CPU disponibles)")
+    base = None
+    for procesos in sorted({1, 2, 4, os.cpu_count() or 1}):
+        inicio = time.perf_counter()
+        total = sum(1 for _ in distancias_multiples(grande, fuentes, procesos))
+        segundos = time.perf_counter() - inicio
+        base = base or segundos
+        print(f"  {procesos} procesos: {segundos:6.2f} s  ({total / segundos:6.1f} fuentes/s, aceleración {base / segundos:.2f}x)")
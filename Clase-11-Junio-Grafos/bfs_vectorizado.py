@@ -0,0 +1,174 @@
+"""
+╔════════════════════════════════════════════════════════════════════════════╗
+║                                                                            ║
+║  BFS por niveles (vectorizado) sobre el GrafoCompacto                      ║
+║  Versión: 1.0.0                                                            ║
+║                                                                            ║
+║  Descripción:                                                              ║
+║  En lugar de sacar un vértice a la vez de una cola, cada paso expande la   ║
+║  frontera completa con NumPy:                                              ║
+║     1. Se reúnen los vecinos de todos los vértices de la frontera          ║
+║        (segmentos offsets[i]..offsets[i+1] de destinos).                   ║
+║     2. Se descartan los ya visitados con una máscara booleana.             ║
+║     3. Se eliminan duplicados conservando la primera aparición.            ║
+║  Conservar la primera aparición reproduce exactamente el orden FIFO de     ║
+║  bfs(), por lo que el orden de visita y las distancias son idénticos.      ║
+║                                                                            ║
+║  Si NumPy no está instalado se usa la misma estrategia en Python puro.     ║
+║                                                                            ║
+╚════════════════════════════════════════════════════════════════════════════╝
+"""
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional
+    np = None
+
+from grafo_compacto import GrafoCompacto
+
+
+# Vistas NumPy (sin copia) de los buffers offsets/destinos de un grafo compacto
+def arreglos_numpy(offsets, destinos):
+    return (np.frombuffer(offsets, dtype=np.int64),
+            np.frombuffer(destinos, dtype=np.int32 if destinos.itemsize == 4 else np.int64))
+
+
+# Vecinos de todos los vértices de la frontera, concatenados en orden
+def reunir_vecinos(offsets, destinos, frontera):
+    inicios = offsets[frontera]
+    longitudes = offsets[frontera + 1] - inicios
+    total = int(longitudes.sum())
+    if total == 0:
+        return destinos[:0]
+    desplazamientos = np.repeat(inicios - (np.cumsum(longitudes) - longitudes), longitudes)
+    return destinos[np.arange(total) + desplazamientos]
+
+
+# BFS por niveles desde el id `origen`.
+# Devuelve (orden, distancias): ids en orden de visita y distancia en saltos por id (-1 = no alcanzado).
+def recorrer_niveles(grafo: GrafoCompacto, origen):
+    return recorrer_niveles_buffers(grafo.offsets, grafo.destinos, origen)
+
+
+# Igual que recorrer_niveles, pero directamente sobre los buffers offsets/destinos
+# (array, memoryview o memoria compartida), sin necesitar la tabla de etiquetas.
+def recorrer_niveles_buffers(offsets, destinos, origen):
+    if np is None:
+        return _recorrer_niveles_python(offsets, destinos, origen)
+
+    offsets, destinos = arreglos_numpy(offsets, destinos)
+    n = len(offsets) - 1
+    distancias = np.full(n, -1, dtype=np.int64)
+    visitados = np.zeros(n, dtype=bool)
+    frontera = np.array([origen], dtype=np.int64)
+    visitados[origen] = True
+    distancias[origen] = 0
+    niveles = [frontera]
+    nivel = 0
+
+    while frontera.size:
+        nivel += 1
+        candidatos = reunir_vecinos(offsets, destinos, frontera)
+        candidatos = candidatos[~visitados[candidatos]]
+        if candidatos.size == 0:
+            break
+        # Deduplicar conservando la primera aparición (orden FIFO)
+        _, primeros = np.unique(candidatos, return_index=True)
+        frontera = candidatos[np.sort(primeros)].astype(np.int64)
+        visitados[frontera] = True
+        distancias[frontera] = nivel
+        niveles.append(frontera)
+
+    return np.concatenate(niveles), distancias
+
+
+def _recorrer_niveles_python(offsets, destinos, origen):
+    destinos = memoryview(destinos)  # Las rebanadas de una vista no copian los ids
+    distancias = [-1] * (len(offsets) - 1)
+    distancias[origen] = 0
+    frontera = [origen]
+    orden = [origen]
+    nivel = 0
+    while frontera:
+        nivel += 1
+        siguiente = []
+        for actual in frontera:
+            for vecino in destinos[offsets[actual]:offsets[actual + 1]]:
+                if distancias[vecino] == -1:
+                    distancias[vecino] = nivel
+                    siguiente.append(vecino)
+        orden.extend(siguiente)
+        frontera = siguiente
+    return orden, distancias
+
+
+# Misma interfaz que bfs(): recibe un Grafo o GrafoCompacto y devuelve las etiquetas en orden de visita
+def bfs_vectorizado(grafo, inicio):
+    compacto = grafo if isinstance(grafo, GrafoCompacto) else grafo.compactar()
+    if inicio not in compacto:
+        raise ValueError(f"El vértice {inicio} no existe en el grafo")
+    orden, _ = recorrer_niveles(compacto, compacto.id_de(inicio))
+    if np is not None:
+        orden = orden.tolist()
+    etiquetas = compacto.etiquetas
+    return [etiquetas[i] for i in orden]
+
+
+# Distancia en saltos desde `inicio` a cada vértice alcanzable: {etiqueta: distancia}
+def distancias_bfs(grafo, inicio):
+    compacto = grafo if isinstance(grafo, GrafoCompacto) else grafo.compactar()
+    if inicio not in compacto:
+        raise ValueError(f"El vértice {inicio} no existe en el grafo")
+    orden, distancias = recorrer_niveles(compacto, compacto.id_de(inicio))
+    if np is not None:
+        orden, distancias = orden.tolist(), distancias.tolist()
+    etiquetas = compacto.etiquetas
+    return {etiquetas[i]: distancias[i] for i in orden}
+
+
+# Casos de prueba
+if __name__ == "__main__":
+    import random
+    import time
+
+    from grafo import Grafo
+    from breadth_first_search import bfs
+
+    grafo = Grafo()
+    for origen, destino in [('A', 'B'), ('A', 'C'), ('B', 'D'), ('B', 'E'), ('C', 'D'), ('D', 'E')]:
+        grafo.agregar_arista(origen, destino)
+    grafo.agregar_vertice('F')
+
+    print("BFS clásico desde 'A':    ", bfs(grafo, 'A'))
+    print("BFS vectorizado desde 'A':", bfs_vectorizado(grafo, 'A'))
+    print("Distancias desde 'A':", distancias_bfs(grafo, 'A'))
+    print("BFS vectorizado desde 'F':", bfs_vectorizado(grafo, 'F'))
+
+    # Rejilla 300x300: muchos niveles con fronteras medianas, como una red de carreteras
+    lado = 300
+    rejilla = Grafo()
+    for fila in range(lado):
+        for columna in range(lado):
+            if columna + 1 < lado:
+                rejilla.agregar_arista((fila, columna), (fila, columna + 1))
+            if fila + 1 < lado:
+                rejilla.agregar_arista((fila, columna), (fila + 1, columna))
+
+    # Y un grafo aleatorio de diámetro pequeño
+    azar = random.Random(1)
+    aleatorio = Grafo()
+    for _ in range(500_000):
+        aleatorio.agregar_arista(azar.randrange(100_000), azar.randrange(100_000))
+
+    for nombre, g, inicio in [("rejilla 300x300", rejilla, (0, 0)), ("aleatorio 100k/500k", aleatorio, aleatorio.vertices[0])]:
+        t0 = time.perf_counter()
+        clasico = bfs(g, inicio)
+        t1 = time.perf_counter()
+        compacto = g.compactar()
+        t2 = time.perf_counter()
+        vectorizado = bfs_vectorizado(compacto, inicio)
+        t3 = time.perf_counter()
+        print(f"\n{nombre}: mismo orden = {clasico == vectorizado}")
+        print(f"  bfs() sobre diccionario: {t1 - t0:.3f} s")
+        print(f"  compactar (una vez):     {t2 - t1:.3f} s")
+        print(f"  bfs_vectorizado:         {t3 - t2:.3f} s")
@@ -27,14 +27,35 @@
 """
 
 from collections import deque
+
+import instrumentacion
 from grafo import Grafo
+from grafo_compacto import GrafoCompacto
+from grafo_internado import GrafoInternado
+
+# Grado de salida para las estadísticas de instrumentacion.py: directo en Grafo,
+# contando los vecinos en otras estructuras (p. ej. una Instantanea)
+def _funcion_grado(grafo):
+    if isinstance(grafo, Grafo):
+        return lambda vertice: len(grafo.grafo[vertice])
+    return lambda vertice: sum(1 for _ in grafo.iterar_vecinos(vertice))
 
-def bfs(grafo: Grafo, inicio):
+# estadisticas: la pasa instrumentacion.medir; el recorrido anota en ella cada vértice expandido
+def bfs(grafo: Grafo, inicio, estadisticas=None):
+    if instrumentacion.activa is not None:  # Ver instrumentacion.py
+        return instrumentacion.medir(bfs, grafo, inicio)
     
     # Verificar que el vértice inicial existe en el grafo
-    if inicio not in grafo.vertices:
+    if inicio not in grafo:
         raise ValueError(f"El vértice {inicio} no existe en el grafo")
     
+    # En el grafo compacto se recorre directamente sobre ids enteros
+    if isinstance(grafo, GrafoCompacto):
+        return _bfs_compacto(grafo, grafo.id_de(inicio), estadisticas)
+    if isinstance(grafo, GrafoInternado):
+        return _bfs_internado(grafo, grafo.id_de(inicio), estadisticas)
+    grado = _funcion_grado(grafo) if estadisticas is not None else None
+    
     # Inicializar estructuras de datos
     visitados = set()  # Set para mantener registro de vértices visitados
     cola = deque([inicio])  # Cola para el recorrido BFS
@@ -48,9 +69,11 @@ def bfs(grafo: Grafo, inicio):
         # Obtener el siguiente vértice de la cola
         vertice_actual = cola.popleft()
         orden_visita.append(vertice_actual)
+        if estadisticas is not None:  # Ver instrumentacion.py
+            estadisticas.expandir_en_cola(vertice_actual, grado(vertice_actual), len(visitados))
         
         # Obtener todos los vecinos del vértice actual
-        for vecino in grafo.obtener_vecinos(vertice_actual):
+        for vecino in grafo.iterar_vecinos(vertice_actual):  # Sin copiar la lista de vecinos
             # Si el vecino no ha sido visitado
             if vecino not in visitados:
                 # Marcarlo como visitado y agregarlo a la cola
@@ -59,12 +82,21 @@ def bfs(grafo: Grafo, inicio):
     
     return orden_visita
 
-def dfs(grafo: Grafo, inicio):
+def dfs(grafo: Grafo, inicio, estadisticas=None):
+    if instrumentacion.activa is not None:
+        return instrumentacion.medir(dfs, grafo, inicio)
     
     # Verificar que el vértice inicial existe en el grafo
-    if inicio not in grafo.vertices:
+    if inicio not in grafo:
         raise ValueError(f"El vértice {inicio} no existe en el grafo")
     
+    # En el grafo compacto se recorre directamente sobre ids enteros
+    if isinstance(grafo, GrafoCompacto):
+        return _dfs_compacto(grafo, grafo.id_de(inicio), estadisticas)
+    if isinstance(grafo, GrafoInternado):
+        return _dfs_internado(grafo, grafo.id_de(inicio), estadisticas)
+    grado = _funcion_grado(grafo) if estadisticas is not None else None
+    
     # Inicializar estructuras de datos
     visitados = set()  # Set para mantener registro de vértices visitados
     pila = [inicio]  # Pila para el recorrido DFS. Se usa una lista como pila para ahorrar tiempo, con los metodos de append y pop. 
@@ -80,15 +112,75 @@ def dfs(grafo: Grafo, inicio):
             # Marcarlo como visitado y agregarlo al orden de visita
             visitados.add(vertice_actual)
             orden_visita.append(vertice_actual)
+            if estadisticas is not None:  # Ver instrumentacion.py
+                estadisticas.expandir_en_pila(vertice_actual, grado(vertice_actual), len(pila) + 1)
             
             # Agregar los vecinos a la pila en orden inverso
             # para mantener el orden correcto de visita
-            for vecino in reversed(grafo.obtener_vecinos(vertice_actual)):
+            for vecino in grafo.iterar_vecinos(vertice_actual, invertido=True):
                 if vecino not in visitados:
                     pila.append(vecino)
     
     return orden_visita
 
+# BFS sobre un GrafoCompacto: visitados es un bytearray indexado por id
+def _bfs_compacto(grafo: GrafoCompacto, origen, estadisticas=None):
+    offsets, destinos = grafo.offsets, grafo.vista_destinos  # Las rebanadas de la vista no copian
+    visitados = bytearray(len(grafo))
+    visitados[origen] = 1
+    cola = [origen]  # La lista crece mientras se recorre: funciona como cola FIFO
+    for actual in cola:
+        if estadisticas is not None:  # Ver instrumentacion.py
+            estadisticas.expandir_en_cola(actual, offsets[actual + 1] - offsets[actual], len(cola))
+        for vecino in destinos[offsets[actual]:offsets[actual + 1]]:
+            if not visitados[vecino]:
+                visitados[vecino] = 1
+                cola.append(vecino)
+    etiquetas = grafo.etiquetas
+    return [etiquetas[i] for i in cola]
+
+# DFS sobre un GrafoCompacto, con el mismo orden de visita que dfs()
+def _dfs_compacto(grafo: GrafoCompacto, origen, estadisticas=None):
+    offsets, destinos = grafo.offsets, grafo.vista_destinos
+    visitados = bytearray(len(grafo))
+    pila = [origen]
+    orden_visita = []
+    while pila:
+        actual = pila.pop()
+        if not visitados[actual]:
+            visitados[actual] = 1
+            orden_visita.append(actual)
+            if estadisticas is not None:  # Ver instrumentacion.py
+                estadisticas.expandir_en_pila(actual, offsets[actual + 1] - offsets[actual], len(pila) + 1)
+            for vecino in reversed(destinos[offsets[actual]:offsets[actual + 1]]):
+                if not visitados[vecino]:
+                    pila.append(vecino)
+    etiquetas = grafo.etiquetas
+    return [etiquetas[i] for i in orden_visita]
+
+# BFS sobre un GrafoInternado (recorre las cadenas de aristas de cada id)
+def _bfs_internado(grafo: GrafoInternado, origen, estadisticas=None):
+    etiquetas = grafo.etiquetas
+    return [etiquetas[i] for i in grafo._recorrer_bfs(origen, estadisticas)]
+
+# DFS sobre un GrafoInternado, con el mismo orden de visita que dfs()
+def _dfs_internado(grafo: GrafoInternado, origen, estadisticas=None):
+    visitados = bytearray(len(grafo.etiquetas))  # Incluye los ids de vértices eliminados
+    pila = [origen]
+    orden_visita = []
+    while pila:
+        actual = pila.pop()
+        if not visitados[actual]:
+            visitados[actual] = 1
+            orden_visita.append(actual)
+            if estadisticas is not None:  # Ver instrumentacion.py
+                estadisticas.expandir_en_pila(actual, grafo.grado_id(actual), len(pila) + 1)
+            for vecino in reversed(grafo.vecinos_id(actual)):
+                if not visitados[vecino]:
+                    pila.append(vecino)
+    etiquetas = grafo.etiquetas
+    return [etiquetas[i] for i in orden_visita]
+
 # Casos de prueba
 if __name__ == "__main__":
     # Crear un grafo no dirigido
@@ -120,3 +212,9 @@ if __name__ == "__main__":
     print("\nPrueba con vértice aislado 'F':")
     print("BFS desde 'F':", bfs(grafo, 'F'))
     print("DFS desde 'F':", dfs(grafo, 'F'))
+    
+    # Los mismos recorridos sobre la versión compacta (CSR)
+    compacto = grafo.compactar()
+    print("\nPrueba sobre el grafo compacto:")
+    print("BFS desde 'A':", bfs(compacto, 'A'))
+    print("DFS desde 'A':", dfs(compacto, 'A'))
@@ -0,0 +1,172 @@
+"""
+╔════════════════════════════════════════════════════════════════════════════╗
+║                                                                            ║
+║  Caché de consultas de caminos (LRU con presupuesto de memoria)            ║
+║  Versión: 1.0.0                                                            ║
+║                                                                            ║
+║  Descripción:                                                              ║
+║  Para orígenes que se consultan una y otra vez entre cambios del grafo:    ║
+║     • Camino: clave (inicio, fin, versión) -> lista de vértices.           ║
+║     • Árbol BFS: clave (inicio, versión) -> array de padres por id. Con    ║
+║       él, cualquier otro destino desde el mismo inicio se responde         ║
+║       siguiendo los padres, sin volver a recorrer el grafo.                ║
+║  Ambas clases de entrada comparten un orden LRU y un presupuesto de        ║
+║  memoria (bytes estimados); al superarlo se desalojan las menos usadas.    ║
+║                                                                            ║
+║  Grafo aumenta su `version` en cada cambio (agregar o eliminar); al        ║
+║  ver una versión nueva la caché descarta todas sus entradas.               ║
+║                                                                            ║
+╚════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import sys
+from array import array
+from collections import OrderedDict
+
+from grafo_compacto import tipo_indice
+
+MEMORIA_MAXIMA = 64 * 2**20  # Presupuesto por defecto: 64 MB
+
+
+# Árbol BFS completo desde el id origen: padres[v] es el id del padre (origen para sí mismo, -1 si no se alcanza)
+def arbol_bfs(compacto, origen):
+    offsets, destinos = compacto.offsets, compacto.vista_destinos
+    padres = array(tipo_indice(len(compacto)), [-1]) * len(compacto)
+    padres[origen] = origen
+    cola = [origen]
+    for actual in cola:  # La lista crece mientras se recorre: funciona como cola FIFO
+        for vecino in destinos[offsets[actual]:offsets[actual + 1]]:
+            if padres[vecino] == -1:
+                padres[vecino] = actual
+                cola.append(vecino)
+    return padres
+
+
+# Clase CacheCaminos
+class CacheCaminos:
+    def __init__(self, memoria_maxima=MEMORIA_MAXIMA):
+        if memoria_maxima <= 0:
+            raise ValueError("El presupuesto de memoria debe ser positivo")
+        self.memoria_maxima = memoria_maxima
+        self.memoria_usada = 0
+        self.version = None  # Versión del grafo a la que corresponden las entradas
+        self._entradas = OrderedDict()  # clave -> (valor, bytes); la más reciente al final
+        self.aciertos = 0  # Camino ya guardado
+        self.aciertos_arbol = 0  # Camino reconstruido desde un árbol BFS guardado
+        self.fallos = 0  # Hubo que recorrer el grafo
+        self.desalojos = 0
+        self.invalidaciones = 0
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def estadisticas(self):
+        return {
+            'aciertos': self.aciertos, 'aciertos_arbol': self.aciertos_arbol, 'fallos': self.fallos,
+            'desalojos': self.desalojos, 'invalidaciones': self.invalidaciones,
+            'entradas': len(self._entradas), 'memoria_usada': self.memoria_usada,
+            'memoria_maxima': self.memoria_maxima,
+        }
+
+    # Descarta todas las entradas
+    def limpiar(self):
+        self._entradas.clear()
+        self.memoria_usada = 0
+
+    # Si el grafo cambió de versión, las entradas guardadas ya no valen
+    def _sincronizar(self, version):
+        if version != self.version:
+            if self._entradas:
+                self.invalidaciones += 1
+                self.limpiar()
+            self.version = version
+
+    def _obtener(self, clave):
+        entrada = self._entradas.get(clave)
+        if entrada is None:
+            return None
+        self._entradas.move_to_end(clave)
+        return entrada[0]
+
+    def _guardar(self, clave, valor, tamano):
+        if tamano > self.memoria_maxima:
+            return  # No cabe ni con la caché vacía: se responde sin guardarlo
+        anterior = self._entradas.pop(clave, None)
+        if anterior is not None:
+            self.memoria_usada -= anterior[1]
+        self._entradas[clave] = (valor, tamano)
+        self.memoria_usada += tamano
+        while self.memoria_usada > self.memoria_maxima:
+            _, (_, liberados) = self._entradas.popitem(last=False)
+            self.memoria_usada -= liberados
+            self.desalojos += 1
+
+    # Camino mínimo (en saltos) de inicio a fin en `grafo`, que debe tener `version` y compactar().
+    # Ambos vértices deben existir. Devuelve [] si no hay camino.
+    def encontrar_camino(self, grafo, inicio, fin):
+        self._sincronizar(grafo.version)
+        version = self.version
+        camino = self._obtener(('camino', inicio, fin, version))
+        if camino is not None:
+            self.aciertos += 1
+            return list(camino)
+
+        compacto = grafo.compactar()
+        padres = self._obtener(('arbol', inicio, version))
+        if padres is not None:
+            self.aciertos_arbol += 1
+        else:
+            self.fallos += 1
+            padres = arbol_bfs(compacto, compacto.id_de(inicio))
+            self._guardar(('arbol', inicio, version), padres, sys.getsizeof(padres))
+
+        destino = compacto.id_de(fin)
+        if padres[destino] == -1:
+            camino = []
+        else:
+            camino = compacto._reconstruir_camino(padres, compacto.id_de(inicio), destino)
+        self._guardar(('camino', inicio, fin, version), camino, sys.getsizeof(camino))
+        return list(camino)  # Copia: quien llama puede modificar su lista sin tocar la caché
+
+
+# Casos de prueba
+if __name__ == "__main__":
+    import random
+    import time
+
+    from grafo import Grafo
+
+    grafo = Grafo()
+    for u, v in [('A', 'B'), ('A', 'C'), ('B', 'D'), ('B', 'E'), ('C', 'D'), ('D', 'E')]:
+        grafo.agregar_arista(u, v)
+    grafo.agregar_vertice('F')
+    cache = grafo.activar_cache_caminos()
+    print("Camino de A a E:", grafo.encontrar_camino('A', 'E'))
+    print("Camino de A a E (otra vez):", grafo.encontrar_camino('A', 'E'))
+    print("Camino de A a D (desde el árbol de A):", grafo.encontrar_camino('A', 'D'))
+    print("Camino de A a F:", grafo.encontrar_camino('A', 'F'))
+    grafo.agregar_arista('E', 'F')
+    print("Tras agregar E-F, camino de A a F:", grafo.encontrar_camino('A', 'F'))
+    print("Estadísticas:", cache.estadisticas())
+
+    # Consultas repetidas desde unos pocos orígenes populares, con y sin caché
+    azar = random.Random(7)
+    num_vertices = 50_000
+    grande = Grafo()
+    for _ in range(num_vertices * 4):
+        grande.agregar_arista(azar.randrange(num_vertices), azar.randrange(num_vertices))
+    populares = azar.sample(grande.vertices, 10)
+    consultas = [(azar.choice(populares), azar.choice(grande.vertices)) for _ in range(20_000)]
+    grande.compactar()  # La versión compacta se construye una vez para ambas mediciones
+
+    inicio = time.perf_counter()
+    sin_cache = [len(grande.encontrar_camino(u, v)) for u, v in consultas]
+    t_sin = time.perf_counter() - inicio
+    cache = grande.activar_cache_caminos(memoria_maxima=4 * 2**20)
+    inicio = time.perf_counter()
+    con_cache = [len(grande.encontrar_camino(u, v)) for u, v in consultas]
+    t_con = time.perf_counter() - inicio
+    assert sin_cache == con_cache  # Misma longitud: ambos son caminos mínimos
+    print(f"\n{len(consultas)} consultas desde {len(populares)} orígenes sobre {num_vertices} vértices:")
+    print(f"  sin caché: {t_sin:.2f} s   con caché: {t_con:.2f} s")
+    print("  Estadísticas:", cache.estadisticas())
@@ -0,0 +1,93 @@
+"""
+╔════════════════════════════════════════════════════════════════════════════╗
+║                                                                            ║
+║  Registros de cambios: aplicar muchas ediciones de una vez                 ║
+║  Versión: 1.0.0                                                            ║
+║                                                                            ║
+║  Descripción:                                                              ║
+║  Un registro de cambios es una secuencia de tuplas, cada una con el        ║
+║  nombre de la operación seguido de sus argumentos:                         ║
+║     ('agregar_vertice', v)        ('agregar_arista', u, v[, peso])         ║
+║     ('eliminar_vertice', v)       ('eliminar_arista', u, v)                ║
+║  Grafo.aplicar_cambios y GrafoInternado.aplicar_cambios los aplican en     ║
+║  orden y dejan el mantenimiento caro para el final del lote (el índice     ║
+║  de componentes en Grafo, la purga de lápidas en GrafoInternado). Si un    ║
+║  cambio falla, se lanza ValueError indicando cuál; los anteriores quedan   ║
+║  aplicados.                                                                ║
+║                                                                            ║
+║  Uso: python cambios.py [num_vertices] [num_cambios]                       ║
+║                                                                            ║
+╚════════════════════════════════════════════════════════════════════════════╝
+"""
+
+OPERACIONES = ('agregar_vertice', 'agregar_arista', 'eliminar_vertice', 'eliminar_arista')
+ELIMINACIONES = ('eliminar_vertice', 'eliminar_arista')
+
+
+# Aplica los cambios uno por uno llamando al método del mismo nombre. Devuelve cuántos se aplicaron.
+def aplicar_cambios(grafo, cambios):
+    aplicados = 0
+    for cambio in cambios:
+        operacion, *argumentos = cambio
+        if operacion not in OPERACIONES:
+            raise ValueError(f"Cambio {aplicados}: operación desconocida {operacion!r}. Use una de {OPERACIONES}")
+        try:
+            getattr(grafo, operacion)(*argumentos)
+        except (ValueError, TypeError) as error:
+            raise ValueError(f"Cambio {aplicados} {cambio!r}: {error}") from error
+        aplicados += 1
+    return aplicados
+
+
+# Casos de prueba y comparación con reconstruir el grafo desde cero
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    from generadores import erdos_renyi
+    from grafo import Grafo
+    from grafo_internado import GrafoInternado
+
+    grafo = Grafo()
+    grafo.aplicar_cambios([('agregar_arista', 'A', 'B'), ('agregar_arista', 'B', 'C'),
+                           ('agregar_arista', 'C', 'D'), ('agregar_vertice', 'E')])
+    print("Componentes:", grafo.num_componentes(), grafo.tamanos_componentes())
+    grafo.aplicar_cambios([('eliminar_arista', 'B', 'C'), ('eliminar_vertice', 'E')])
+    print("Tras eliminar B-C y E:", grafo.aristas, "componentes:", grafo.tamanos_componentes())
+    try:
+        grafo.aplicar_cambios([('agregar_arista', 'D', 'E'), ('eliminar_arista', 'A', 'Z')])
+    except ValueError as error:
+        print("Registro con un error:", error)
+    print("El primer cambio sí se aplicó:", grafo.existe_arista('D', 'E'))
+
+    # Un grafo grande que recibe registros de cambios pequeños, frente a reconstruirlo cada vez
+    num_vertices = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    num_cambios = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000
+    _, aristas = erdos_renyi(num_vertices, 4 * num_vertices, semilla=3)
+    azar = random.Random(3)
+    registro = []
+    vigentes = list(aristas)
+    for _ in range(num_cambios):
+        if azar.random() < 0.5:
+            registro.append(('eliminar_arista', *vigentes.pop(azar.randrange(len(vigentes)))))
+        else:
+            registro.append(('agregar_arista', azar.randrange(num_vertices), azar.randrange(num_vertices)))
+
+    for clase in (Grafo, GrafoInternado):
+        def construir(lista):
+            nuevo = clase()
+            for u, v in lista:
+                nuevo.agregar_arista(u, v)
+            return nuevo
+        incremental = construir(aristas)
+        inicio = time.perf_counter()
+        incremental.aplicar_cambios(registro)
+        t_lote = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        desde_cero = construir(vigentes + [(u, v) for operacion, u, v in registro if operacion == 'agregar_arista'])
+        t_cero = time.perf_counter() - inicio
+        assert sorted(map(sorted, ((u, v) for u, v, _ in incremental.aristas))) == \
+            sorted(map(sorted, ((u, v) for u, v, _ in desde_cero.aristas)))
+        print(f"{clase.__name__}: {num_cambios} cambios sobre {len(aristas)} aristas: "
+              f"aplicar_cambios {t_lote:.3f} s, reconstruir {t_cero:.3f} s")
@@ -0,0 +1,196 @@
+"""
+╔════════════════════════════════════════════════════════════════════════════╗
+║                                                                            ║
+║  Caminos más cortos ponderados: Dijkstra y A*                              ║
+║  Versión: 1.0.0                                                            ║
+║                                                                            ║
+║  Descripción:                                                              ║
+║  Usan el `peso` que Grafo.agregar_arista guarda en cada arista.            ║
+║     • dijkstra(grafo, inicio): distancias mínimas desde inicio             ║
+║     • camino_mas_corto(grafo, inicio, fin, heuristica=None): camino y      ║
+║       costo; con heurística se comporta como A*                            ║
+║                                                                            ║
+║  Detalles:                                                                 ║
+║     • Montículo binario (heapq) con borrado perezoso: en lugar de          ║
+║       actualizar una entrada se inserta otra y las viejas se ignoran       ║
+║       al salir del montículo.                                              ║
+║     • Salida temprana al llegar a `fin` y radio de búsqueda opcional.      ║
+║     • EspacioTrabajo reutilizable: los arreglos de distancias y padres     ║
+║       se reservan una vez y se "limpian" en O(1) con un sello por          ║
+║       consulta, así las consultas repetidas no vuelven a reservar memoria. ║
+║     • Los pesos deben ser no negativos: antes de buscar se revisa el       ║
+║       peso mínimo del grafo (calculado una vez por versión compacta) y     ║
+║       con uno negativo se lanza ValueError.                                ║
+║                                                                            ║
+╚════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import heapq
+from array import array
+
+from grafo_compacto import GrafoCompacto, tipo_indice
+
+INFINITO = float('inf')
+
+
+# Arreglos de distancias/padres reutilizables entre consultas sobre el mismo grafo
+class EspacioTrabajo:
+    def __init__(self, grafo):
+        n = len(grafo)
+        self.distancias = array('d', [INFINITO]) * n
+        self.padres = array(tipo_indice(n), [-1]) * n
+        self.sellos = array('q', [0]) * n  # Consulta en la que se escribió cada posición
+        self.sello = 0
+
+    def __len__(self):
+        return len(self.distancias)
+
+    # Invalida todos los valores de la consulta anterior en O(1)
+    def nueva_consulta(self):
+        self.sello += 1
+
+    def distancia(self, v):
+        return self.distancias[v] if self.sellos[v] == self.sello else INFINITO
+
+
+def _compacto(grafo):
+    return grafo if isinstance(grafo, GrafoCompacto) else grafo.compactar()
+
+
+# Con un peso negativo Dijkstra y A* pueden devolver un camino que no es el mínimo, y la
+# salida temprana haría que se note o no según las aristas examinadas: se revisan todas antes
+def _validar_pesos(compacto):
+    if compacto.peso_minimo() < 0:
+        raise ValueError("Dijkstra y A* requieren pesos no negativos")
+
+
+def _preparar_espacio(compacto, espacio):
+    if espacio is None:
+        espacio = EspacioTrabajo(compacto)
+    elif len(espacio) != len(compacto):
+        raise ValueError("El espacio de trabajo fue creado para un grafo de otro tamaño")
+    espacio.nueva_consulta()
+    return espacio
+
+
+# Núcleo común de Dijkstra y A* sobre ids enteros.
+# heuristica: función id -> cota inferior del costo restante (None = Dijkstra).
+# Devuelve los ids asentados (distancia definitiva) en el orden en que salieron del montículo.
+def _buscar(compacto, origen, destino, heuristica, radio, espacio):
+    offsets, destinos, pesos = compacto.offsets, compacto.destinos, compacto.pesos
+    distancias, padres, sellos, sello = espacio.distancias, espacio.padres, espacio.sellos, espacio.sello
+
+    distancias[origen] = 0.0
+    padres[origen] = origen
+    sellos[origen] = sello
+    monticulo = [(heuristica(origen) if heuristica else 0.0, 0.0, origen)]
+    asentados = []
+
+    while monticulo:
+        _, distancia, actual = heapq.heappop(monticulo)
+        if distancia > distancias[actual]:
+            continue  # Entrada obsoleta (borrado perezoso)
+        asentados.append(actual)
+        if actual == destino:
+            break
+
+        for k in range(offsets[actual], offsets[actual + 1]):
+            vecino = destinos[k]
+            nueva = distancia + pesos[k]
+            if radio is not None and nueva > radio:
+                continue
+            if sellos[vecino] != sello or nueva < distancias[vecino]:
+                distancias[vecino] = nueva
+                padres[vecino] = actual
+                sellos[vecino] = sello
+                prioridad = nueva + heuristica(vecino) if heuristica else nueva
+                heapq.heappush(monticulo, (prioridad, nueva, vecino))
+
+    return asentados
+
+
+# Distancias mínimas desde `inicio`: {etiqueta: distancia}.
+# Con `fin` se detiene al asentarlo; con `radio` ignora los vértices más lejanos.
+def dijkstra(grafo, inicio, fin=None, radio=None, espacio=None):
+    compacto = _compacto(grafo)
+    _validar_pesos(compacto)
+    if inicio not in compacto:
+        raise ValueError(f"El vértice {inicio} no existe en el grafo")
+    espacio = _preparar_espacio(compacto, espacio)
+    destino = compacto.indices.get(fin) if fin is not None else None
+    asentados = _buscar(compacto, compacto.id_de(inicio), destino, None, radio, espacio)
+    etiquetas, distancias = compacto.etiquetas, espacio.distancias
+    return {etiquetas[v]: distancias[v] for v in asentados}
+
+
+# Camino de menor costo entre inicio y fin. Devuelve (camino, costo); ([], inf) si no hay camino.
+# heuristica(vertice, fin) debe ser una cota inferior del costo restante (A*); sin ella es Dijkstra.
+def camino_mas_corto(grafo, inicio, fin, heuristica=None, radio=None, espacio=None):
+    compacto = _compacto(grafo)
+    _validar_pesos(compacto)
+    if inicio not in compacto or fin not in compacto:
+        return [], INFINITO
+    espacio = _preparar_espacio(compacto, espacio)
+    origen, destino = compacto.id_de(inicio), compacto.id_de(fin)
+
+    heuristica_id = None
+    if heuristica is not None:
+        etiquetas = compacto.etiquetas
+        heuristica_id = lambda v: heuristica(etiquetas[v], fin)
+
+    _buscar(compacto, origen, destino, heuristica_id, radio, espacio)
+    costo = espacio.distancia(destino)
+    if costo == INFINITO:
+        return [], INFINITO
+    return compacto._reconstruir_camino(espacio.padres, origen, destino), costo
+
+
+# A* con la heurística obligatoria
+def a_estrella(grafo, inicio, fin, heuristica, radio=None, espacio=None):
+    return camino_mas_corto(grafo, inicio, fin, heuristica, radio, espacio)
+
+
+# Casos de prueba
+if __name__ == "__main__":
+    import math
+
+    from grafo import Grafo
+
+    # Ciudades de Nicaragua con distancias aproximadas por carretera (km)
+    coordenadas = {
+        'Managua': (12.13, -86.25), 'Masaya': (11.97, -86.09), 'León': (12.43, -86.88),
+        'Granada': (11.93, -85.96), 'Rivas': (11.44, -85.83), 'Jinotepe': (11.85, -86.20),
+    }
+    grafo = Grafo()
+    for u, v, km in [
+        ('Managua', 'Masaya', 28), ('Managua', 'León', 93), ('Masaya', 'Granada', 17),
+        ('Granada', 'Rivas', 69), ('Managua', 'Granada', 45), ('Managua', 'Jinotepe', 46),
+        ('Jinotepe', 'Rivas', 65), ('Masaya', 'Jinotepe', 30),
+    ]:
+        grafo.agregar_arista(u, v, km)
+
+    # Distancia en línea recta: nunca sobreestima la distancia por carretera
+    def linea_recta(ciudad, destino):
+        (lat1, lon1), (lat2, lon2) = coordenadas[ciudad], coordenadas[destino]
+        return math.hypot(lat1 - lat2, (lon1 - lon2) * math.cos(math.radians(lat1))) * 111
+
+    print("Dijkstra desde Managua:", dijkstra(grafo, 'Managua'))
+    print("Dijkstra desde Managua (radio 50 km):", dijkstra(grafo, 'Managua', radio=50))
+    print("Camino Managua -> Rivas (Dijkstra):", camino_mas_corto(grafo, 'Managua', 'Rivas'))
+    print("Camino Managua -> Rivas (A*):", a_estrella(grafo, 'Managua', 'Rivas', linea_recta))
+    print("Camino León -> Rivas (radio 100 km):", camino_mas_corto(grafo, 'León', 'Rivas', radio=100))
+
+    # Un mismo espacio de trabajo para muchas consultas
+    espacio = EspacioTrabajo(grafo.compactar())
+    for origen in ['León', 'Granada', 'Rivas']:
+        print(f"Camino {origen} -> Jinotepe:", camino_mas_corto(grafo, origen, 'Jinotepe', espacio=espacio))
+
+    # Un peso negativo se rechaza aunque la salida temprana no llegue a examinar esa arista
+    negativo = Grafo(es_dirigido=True)
+    for u, v, peso in [('A', 'B', 1), ('A', 'C', 2), ('C', 'B', -5)]:
+        negativo.agregar_arista(u, v, peso)
+    try:
+        camino_mas_corto(negativo, 'A', 'B')
+        raise AssertionError("Se aceptó un peso negativo")
+    except ValueError as error:
+        print("Pesos negativos:", error)
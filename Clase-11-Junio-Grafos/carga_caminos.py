@@ -0,0 +1,169 @@
+"""
+╔════════════════════════════════════════════════════════════════════════════╗
+║                                                                            ║
+║  Generador de carga para servidor_caminos.py                               ║
+║  Versión: 1.0.0                                                            ║
+║                                                                            ║
+║  Para cada modo del servidor ('directo' y 'lotes'), arranca el servidor    ║
+║  en un proceso aparte y abre --conexiones conexiones, cada una con         ║
+║  --en-vuelo consultas pendientes en todo momento (lazo cerrado). Los       ║
+║  inicios salen de un conjunto de --fuentes vértices populares y los        ║
+║  fines son uniformes. Mide rendimiento (respuestas/s), latencias p50,      ║
+║  p95, p99 y máxima, tiempos agotados y errores; la salida es JSON y una    ║
+║  tabla en stderr.                                                          ║
+║                                                                            ║
+║  Uso: python carga_caminos.py [--vertices N] [--duracion S]                ║
+║           [--conexiones C] [--en-vuelo K] [--modos directo,lotes]          ║
+║           [--salida resultados.json]                                       ║
+║                                                                            ║
+╚════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+from bench_grafos import resumir
+
+
+# Una conexión en lazo cerrado. Devuelve (latencias en s, tiempos agotados, errores).
+async def _cliente(host, puerto, azar, fuentes, num_vertices, en_vuelo, inicio_medicion, fin):
+    lector, escritor = await asyncio.open_connection(host, puerto)
+    enviadas = {}  # id -> instante de envío
+    latencias = []
+    agotadas = errores = 0
+    siguiente_id = 0
+
+    def enviar():
+        nonlocal siguiente_id
+        consulta = {'id': siguiente_id, 'tipo': 'camino' if azar.random() < 0.9 else 'alcanzable',
+                    'inicio': azar.choice(fuentes), 'fin': azar.randrange(num_vertices)}
+        enviadas[siguiente_id] = time.perf_counter()
+        escritor.write(json.dumps(consulta).encode('utf-8') + b"\n")
+        siguiente_id += 1
+
+    for _ in range(en_vuelo):
+        enviar()
+    await escritor.drain()
+    while enviadas:
+        linea = await lector.readline()
+        if not linea:
+            break
+        ahora = time.perf_counter()
+        respuesta = json.loads(linea)
+        enviado = enviadas.pop(respuesta['id'])
+        if enviado >= inicio_medicion:  # Las consultas del calentamiento no cuentan
+            if respuesta.get('error') == "tiempo agotado":
+                agotadas += 1
+            elif 'error' in respuesta:
+                errores += 1
+            else:
+                latencias.append(ahora - enviado)
+        if ahora < fin:
+            enviar()
+            await escritor.drain()
+    escritor.close()
+    return latencias, agotadas, errores
+
+
+async def _medir(host, puerto, opciones):
+    fuentes_azar = random.Random(opciones.semilla)
+    num_fuentes = min(opciones.fuentes or opciones.vertices, opciones.vertices)
+    fuentes = fuentes_azar.sample(range(opciones.vertices), num_fuentes)
+    inicio_medicion = time.perf_counter() + opciones.calentamiento
+    fin = inicio_medicion + opciones.duracion
+    resultados = await asyncio.gather(*[
+        _cliente(host, puerto, random.Random(opciones.semilla + i), fuentes, opciones.vertices,
+                 opciones.en_vuelo, inicio_medicion, fin)
+        for i in range(opciones.conexiones)])
+    latencias = sorted(latencia for parcial, _, _ in resultados for latencia in parcial)
+    segundos = time.perf_counter() - inicio_medicion
+
+    # Estadísticas del propio servidor
+    lector, escritor = await asyncio.open_connection(host, puerto)
+    escritor.write(b'{"id": 0, "tipo": "estadisticas"}\n')
+    estadisticas = json.loads(await lector.readline())['estadisticas']
+    escritor.close()
+
+    resultado = {
+        'respuestas': len(latencias), 'segundos': segundos, 'respuestas_por_s': len(latencias) / segundos,
+        'agotadas': sum(agotadas for _, agotadas, _ in resultados),
+        'errores': sum(errores for _, _, errores in resultados),
+        'servidor': estadisticas,
+    }
+    if latencias:
+        mediana, p95 = resumir(latencias)
+        resultado.update(p50_ms=mediana * 1e3, p95_ms=p95 * 1e3,
+                         p99_ms=latencias[int(0.99 * (len(latencias) - 1))] * 1e3, max_ms=latencias[-1] * 1e3)
+    return resultado
+
+
+# Arranca el servidor en otro proceso y devuelve (proceso, puerto)
+def arrancar_servidor(modo, opciones):
+    comando = [sys.executable, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'servidor_caminos.py'),
+               '--vertices', str(opciones.vertices), '--generador', opciones.generador,
+               '--semilla', str(opciones.semilla), '--modo', modo,
+               '--tiempo-limite', str(opciones.tiempo_limite)]
+    if opciones.procesos:
+        comando += ['--procesos', str(opciones.procesos)]
+    proceso = subprocess.Popen(comando, stdout=subprocess.PIPE, text=True)
+    linea = proceso.stdout.readline()  # "Escuchando en host:puerto"
+    if not linea.startswith("Escuchando en "):
+        proceso.kill()
+        raise RuntimeError(f"El servidor no arrancó: {linea!r}")
+    return proceso, int(linea.rsplit(':', 1)[1])
+
+
+def _tabla(resultados):
+    lineas = [f"{'modo':10}{'resp/s':>10}{'p50 (ms)':>10}{'p95 (ms)':>10}{'p99 (ms)':>10}"
+              f"{'máx (ms)':>10}{'agotadas':>10}{'por lote':>10}"]
+    for modo, r in resultados.items():
+        lineas.append(f"{modo:10}{r['respuestas_por_s']:10.0f}{r.get('p50_ms', 0):10.1f}{r.get('p95_ms', 0):10.1f}"
+                      f"{r.get('p99_ms', 0):10.1f}{r.get('max_ms', 0):10.1f}{r['agotadas']:10}"
+                      f"{r['servidor']['consultas_por_lote']:10.1f}")
+    return "\n".join(lineas)
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Carga para servidor_caminos.py")
+    parser.add_argument('--vertices', type=int, default=100_000)
+    parser.add_argument('--generador', default='erdos_renyi')
+    parser.add_argument('--semilla', type=int, default=42)
+    parser.add_argument('--modos', default='directo,lotes')
+    parser.add_argument('--procesos', type=int, default=None)
+    parser.add_argument('--conexiones', type=int, default=32)
+    parser.add_argument('--en-vuelo', type=int, default=8, help="consultas pendientes por conexión")
+    parser.add_argument('--fuentes', type=int, default=100, help="inicios distintos (0 = cualquier vértice)")
+    parser.add_argument('--duracion', type=float, default=10.0)
+    parser.add_argument('--calentamiento', type=float, default=1.0)
+    parser.add_argument('--tiempo-limite', type=float, default=2.0)
+    parser.add_argument('--salida', help="archivo JSON (por defecto, la salida estándar)")
+    opciones = parser.parse_args(argumentos)
+
+    resultados = {}
+    for modo in opciones.modos.split(','):
+        print(f"modo {modo}...", file=sys.stderr)
+        proceso, puerto = arrancar_servidor(modo, opciones)
+        try:
+            resultados[modo] = asyncio.run(_medir('127.0.0.1', puerto, opciones))
+        finally:
+            proceso.terminate()
+            proceso.wait()
+
+    informe = {'opciones': vars(opciones), 'cpus': os.cpu_count(), 'resultados': resultados}
+    texto = json.dumps(informe, indent=2, ensure_ascii=False)
+    if opciones.salida:
+        with open(opciones.salida, 'w', encoding='utf-8') as archivo:
+            archivo.write(texto + "\n")
+    else:
+        print(texto)
+    print(_tabla(resultados), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+╔════════════════════════════════════════════════════════════════════════════╗
+║                                                                            ║
+║  Carga masiva de listas de aristas (CSV/TSV, opcionalmente .gz)            ║
+║  Versión: 1.0.0                                                            ║
+║                                                                            ║
+║  Descripción:                                                              ║
+║  Construye un GrafoCompacto directamente desde un archivo, sin pasar por   ║
+║  un Grafo de diccionarios ni por llamadas a agregar_arista:                ║
+║     1. Primera pasada: se leen lotes de líneas, se internan las            ║
+║        etiquetas a ids enteros y se cuenta el grado de cada vértice.       ║
+║     2. Con los grados se calculan los offsets (suma acumulada).            ║
+║     3. Segunda pasada: se rellenan destinos y pesos en su posición final.  ║
+║  La memoria usada es la del grafo final más un lote de líneas.             ║
+║                                                                            ║
+║  Formato: una arista por línea "origen<sep>destino[<sep>peso]". Las        ║
+║  líneas vacías y las que empiezan con '#' se ignoran. El orden de          ║
+║  vértices y vecinos es el mismo que daría agregar_arista en ese orden.     ║
+║                                                                            ║
+╚════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import gzip
+import sys
+import time
+from array import array
+
+from grafo_compacto import GrafoCompacto, ceros, tipo_indice
+
+TAMANO_LOTE = 1 << 20  # Bytes aproximados por lote de líneas
+INTERVALO_PROGRESO = 2.0  # Segundos entre reportes de progreso
+
+
+def _abrir(ruta):
+    with open(ruta, 'rb') as archivo:
+        comprimido = archivo.read(2) == b'\x1f\x8b'  # Número mágico de gzip
+    return gzip.open(ruta, 'rb') if comprimido else open(ruta, 'rb')
+
+
+# Separador por defecto según la extensión: ',' para .csv, espacios/tabuladores en otro caso
+def _separador_por_extension(ruta):
+    nombre = str(ruta).lower()
+    if nombre.endswith('.gz'):
+        nombre = nombre[:-3]
+    return b',' if nombre.endswith('.csv') else None
+
+
+# Reporte de progreso por defecto (a stderr)
+def imprimir_progreso(fase, bytes_leidos, aristas, segundos):
+    segundos = max(segundos, 1e-9)
+    print(f"[{fase}] {bytes_leidos / 2**20:10.1f} MB  {aristas:>12,} aristas  "
+          f"{bytes_leidos / 2**20 / segundos:8.1f} MB/s  {aristas / segundos:>12,.0f} aristas/s",
+          file=sys.stderr)
+
+
+# Recorre el archivo por lotes y entrega, por cada lote, una lista de aristas (origen, destino, peso).
+# origen y destino son bytes; peso es float (1.0 si la línea no lo trae).
+# Llama a progreso() como mucho cada INTERVALO_PROGRESO segundos y una vez al final.
+def _leer_lotes(ruta, separador, encabezado, fase, progreso):
+    inicio = ultimo_reporte = time.perf_counter()
+    bytes_leidos = 0
+    aristas = 0
+    with _abrir(ruta) as archivo:
+        if encabezado:
+            bytes_leidos += len(archivo.readline())
+        for lineas in iter(lambda: archivo.readlines(TAMANO_LOTE), []):
+            lote = []
+            for linea in lineas:
+                campos = linea.split(separador)
+                if separador is not None:
+                    campos = [campo.strip() for campo in campos]
+                if not campos or not campos[0] or campos[0].startswith(b'#'):
+                    continue
+                if len(campos) < 2:
+                    raise ValueError(f"Línea de arista inválida: {linea!r}")
+                lote.append((campos[0], campos[1], float(campos[2]) if len(campos) > 2 and campos[2] else 1.0))
+            bytes_leidos += sum(map(len, lineas))
+            aristas += len(lote)
+            yield lote
+            ahora = time.perf_counter()
+            if progreso and ahora - ultimo_reporte >= INTERVALO_PROGRESO:
+                progreso(fase, bytes_leidos, aristas, ahora - inicio)
+                ultimo_reporte = ahora
+    if progreso:
+        progreso(fase, bytes_leidos, aristas, time.perf_counter() - inicio)
+
+
+# Cargar una lista de aristas y devolver un GrafoCompacto.
+#   separador: bytes o str; None usa espacios/tabuladores ('.csv' usa ',' por defecto)
+#   tipo_etiqueta: función aplicada a cada etiqueta (str por defecto, p. ej. int para ids numéricos)
+#   progreso: función(fase, bytes, aristas, segundos); por defecto imprime en stderr. False la desactiva.
+def cargar_lista_aristas(ruta, es_dirigido=False, separador=None, encabezado=False,
+                         tipo_etiqueta=str, progreso=None):
+    if separador is None:
+        separador = _separador_por_extension(ruta)
+    elif isinstance(separador, str):
+        separador = separador.encode()
+    if progreso is None:
+        progreso = imprimir_progreso
+
+    # Primera pasada: internar etiquetas y contar grados
+    indices = {}  # bytes de la etiqueta -> id
+    grados = array('q')
+    total = 0
+    for lote in _leer_lotes(ruta, separador, encabezado, "conteo", progreso):
+        for origen, destino, _ in lote:
+            u = indices.get(origen)
+            if u is None:
+                u = indices[origen] = len(grados)
+                grados.append(0)
+            v = indices.get(destino)
+            if v is None:
+                v = indices[destino] = len(grados)
+                grados.append(0)
+            grados[u] += 1
+            if not es_dirigido:
+                grados[v] += 1
+        total += len(lote) if es_dirigido else 2 * len(lote)
+
+    n = len(indices)
+    offsets = array('q', [0]) * (n + 1)
+    for i in range(n):
+        offsets[i + 1] = offsets[i] + grados[i]
+    siguiente = grados  # Se reutiliza el buffer de grados como "próxima posición libre" de cada fila
+    for i in range(n):
+        siguiente[i] = offsets[i]
+
+    # Segunda pasada: rellenar destinos y pesos
+    destinos = ceros(tipo_indice(n), total)
+    pesos = ceros('d', total)
+    for lote in _leer_lotes(ruta, separador, encabezado, "relleno", progreso):
+        for origen, destino, peso in lote:
+            u, v = indices[origen], indices[destino]
+            k = siguiente[u]
+            destinos[k] = v
+            pesos[k] = peso
+            siguiente[u] = k + 1
+            if not es_dirigido:
+                k = siguiente[v]
+                destinos[k] = u
+                pesos[k] = peso
+                siguiente[v] = k + 1
+
+    etiquetas = [tipo_etiqueta(etiqueta.decode()) for etiqueta in indices]
+    return GrafoCompacto(etiquetas, offsets, destinos, pesos, es_dirigido)
+
+
+# Uso: python cargador.py archivo.csv[.gz] [--dirigido]
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    if len(sys.argv) > 1:
+        inicio = time.perf_counter()
+        grafo = cargar_lista_aristas(sys.argv[1], es_dirigido='--dirigido' in sys.argv)
+        print(f"{len(grafo)} vértices, {grafo.num_aristas} entradas de adyacencia "
+              f"en {time.perf_counter() - inicio:.2f} s ({grafo.memoria_bytes() / 2**20:.1f} MB)")
+    else:
+        # Casos de prueba: el mismo grafo cargado desde CSV plano y desde TSV comprimido
+        from grafo import Grafo
+
+        aristas = [('Managua', 'Masaya', 28), ('Managua', 'León', 93), ('Masaya', 'Granada', 17),
+                   ('Granada', 'Rivas', 69), ('Managua', 'Granada', 45)]
+        esperado = Grafo()
+        for u, v, peso in aristas:
+            esperado.agregar_arista(u, v, peso)
+
+        with tempfile.TemporaryDirectory() as carpeta:
+            ruta_csv = os.path.join(carpeta, 'ciudades.csv')
+            with open(ruta_csv, 'w', encoding='utf-8') as archivo:
+                archivo.write("origen,destino,km\n")
+                archivo.writelines(f"{u},{v},{peso}\n" for u, v, peso in aristas)
+            ruta_gz = os.path.join(carpeta, 'ciudades.tsv.gz')
+            with gzip.open(ruta_gz, 'wt', encoding='utf-8') as archivo:
+                archivo.write("# lista de aristas\n")
+                archivo.writelines(f"{u}\t{v}\t{peso}\n" for u, v, peso in aristas)
+
+            desde_csv = cargar_lista_aristas(ruta_csv, encabezado=True)
+            desde_gz = cargar_lista_aristas(ruta_gz, progreso=False)
+
+        print("Aristas (CSV):", desde_csv.aristas)
+        print("¿Igual que agregar_arista? (CSV):", desde_csv.aristas == esperado.compactar().aristas)
+        print("¿Igual que agregar_arista? (TSV.gz):", desde_gz.aristas == esperado.compactar().aristas)
+        print("Camino de León a Rivas:", desde_gz.encontrar_camino('León', 'Rivas'))
@@ -0,0 +1,97 @@
+"""
+╔════════════════════════════════════════════════════════════════════════════╗
+║                                                                            ║
+║  Índice de componentes conexas (Union-Find)                                ║
+║  Versión: 1.0.0                                                            ║
+║                                                                            ║
+║  Descripción:                                                              ║
+║  Estructura de conjuntos disjuntos con compresión de caminos y unión por   ║
+║  rango. Cada operación cuesta O(α(n)) amortizado (prácticamente            ║
+║  constante), así que responder "¿están u y v conectados?" no necesita      ║
+║  recorrer el grafo. Grafo la mantiene al día en agregar_arista; al         ║
+║  eliminar aristas, una componente puede partirse en dos y Union-Find no    ║
+║  sabe separar conjuntos, así que Grafo descarta el índice y lo reconstruye ║
+║  en la próxima consulta.                                                   ║
+║                                                                            ║
+╚════════════════════════════════════════════════════════════════════════════╝
+"""
+
+
+# Clase UnionFind
+class UnionFind:
+    def __init__(self, elementos=()):
+        self.padre = {}
+        self.rango = {}
+        self.tamano = {}  # Solo es válido para las raíces
+        self.num_conjuntos = 0
+        for elemento in elementos:
+            self.agregar(elemento)
+
+    def __contains__(self, elemento):
+        return elemento in self.padre
+
+    def __len__(self):
+        return len(self.padre)
+
+    # Agregar un elemento como conjunto unitario. Si ya existe, no hace nada.
+    def agregar(self, elemento):
+        if elemento not in self.padre:
+            self.padre[elemento] = elemento
+            self.rango[elemento] = 0
+            self.tamano[elemento] = 1
+            self.num_conjuntos += 1
+
+    # Quitar un elemento que forma un conjunto unitario (p. ej. un vértice aislado que se elimina).
+    # Union-Find no sabe separar conjuntos, así que para cualquier otro elemento lanza ValueError.
+    def quitar(self, elemento):
+        if self.padre.get(elemento) != elemento or self.tamano[elemento] != 1:
+            raise ValueError(f"{elemento} no forma un conjunto unitario")
+        del self.padre[elemento], self.rango[elemento], self.tamano[elemento]
+        self.num_conjuntos -= 1
+
+    # Raíz del conjunto del elemento, comprimiendo el camino recorrido
+    def encontrar(self, elemento):
+        padre = self.padre
+        raiz = elemento
+        while padre[raiz] != raiz:
+            raiz = padre[raiz]
+        while padre[elemento] != raiz:  # Compresión de caminos (iterativa, sin recursión)
+            padre[elemento], elemento = raiz, padre[elemento]
+        return raiz
+
+    # Unir los conjuntos de a y b. Devuelve False si ya estaban unidos.
+    def unir(self, a, b):
+        raiz_a, raiz_b = self.encontrar(a), self.encontrar(b)
+        if raiz_a == raiz_b:
+            return False
+        # Unión por rango: el árbol más bajo cuelga del más alto
+        if self.rango[raiz_a] < self.rango[raiz_b]:
+            raiz_a, raiz_b = raiz_b, raiz_a
+        self.padre[raiz_b] = raiz_a
+        self.tamano[raiz_a] += self.tamano.pop(raiz_b)
+        if self.rango[raiz_a] == self.rango[raiz_b]:
+            self.rango[raiz_a] += 1
+        self.num_conjuntos -= 1
+        return True
+
+    def conectados(self, a, b):
+        return self.encontrar(a) == self.encontrar(b)
+
+    # Tamaño del conjunto que contiene al elemento
+    def tamano_conjunto(self, elemento):
+        return self.tamano[self.encontrar(elemento)]
+
+    # Tamaños de todos los conjuntos, de mayor a menor
+    def tamanos(self):
+        return sorted(self.tamano.values(), reverse=True)
+
+
+if __name__ == "__main__":
+    conjuntos = UnionFind('ABCDEF')
+    conjuntos.unir('A', 'B')
+    conjuntos.unir('C', 'D')
+    conjuntos.unir('B', 'D')
+    print("¿A y C conectados?:", conjuntos.conectados('A', 'C'))
+    print("¿A y F conectados?:", conjuntos.conectados('A', 'F'))
+    print("Número de conjuntos:", conjuntos.num_conjuntos)
+    print("Tamaños:", conjuntos.tamanos())
@@ -0,0 +1,247 @@
+"""
+╔════════════════════════════════════════════════════════════════════════════╗
+║                                                                            ║
+║  Conectividad en grafos dirigidos: componentes fuertes, condensación y     ║
+║  orden topológico                                                          ║
+║  Versión: 1.0.0                                                            ║
+║                                                                            ║
+║  Descripción:                                                              ║
+║  Todo trabaja sobre la versión compacta (ids enteros) en tiempo O(n + m)   ║
+║  y sin recursión, así que sirve para grafos de millones de vértices:       ║
+║     • componentes_fuertes: Tarjan iterativo con pila de llamadas           ║
+║       explícita. Las componentes se numeran en orden topológico de la      ║
+║       condensación (las fuentes primero).                                  ║
+║     • condensacion: DAG con un vértice por componente y sin aristas        ║
+║       repetidas.                                                           ║
+║     • es_fuertemente_conexo: todos alcanzables desde un vértice en el      ║
+║       grafo y en su transpuesto.                                           ║
+║     • orden_topologico: algoritmo de Kahn; ValueError si hay ciclos.       ║
+║     • componentes_debiles / es_debilmente_conexo: ignorando la dirección.  ║
+║  En un grafo no dirigido las tres nociones de conectividad coinciden.      ║
+║                                                                            ║
+╚════════════════════════════════════════════════════════════════════════════╝
+"""
+
+from array import array
+
+from grafo_compacto import GrafoCompacto, ceros, tipo_indice
+
+
+def _compacto(grafo):
+    return grafo if isinstance(grafo, GrafoCompacto) else grafo.compactar()
+
+
+# Tarjan iterativo. Devuelve (componente, k): componente[id] en 0..k-1, numeradas de modo que
+# toda arista entre componentes distintas va de un número menor a uno mayor.
+def componentes_fuertes_ids(grafo):
+    compacto = _compacto(grafo)
+    n = len(compacto)
+    offsets, destinos = compacto.offsets, compacto.vista_destinos
+    indice = array('q', [-1]) * n  # Orden de descubrimiento (-1 = sin visitar)
+    bajo = array('q', [0]) * n  # Menor índice alcanzable desde el subárbol DFS
+    siguiente = array('q', offsets[:n]) if n else array('q')  # Próxima arista por revisar de cada vértice
+    componente = array(tipo_indice(n), [-1]) * n
+    en_pila = bytearray(n)
+    pila = []  # Pila de Tarjan: vértices de componentes aún abiertas
+    contador = 0
+    k = 0
+
+    for raiz in range(n):
+        if indice[raiz] != -1:
+            continue
+        indice[raiz] = bajo[raiz] = contador
+        contador += 1
+        pila.append(raiz)
+        en_pila[raiz] = 1
+        llamadas = [raiz]  # Pila de llamadas explícita en lugar de recursión
+
+        while llamadas:
+            v = llamadas[-1]
+            posicion, fin = siguiente[v], offsets[v + 1]
+            while posicion < fin:
+                w = destinos[posicion]
+                posicion += 1
+                if indice[w] == -1:
+                    # "Llamada recursiva" sobre w: se retoma v desde `posicion` al volver
+                    siguiente[v] = posicion
+                    indice[w] = bajo[w] = contador
+                    contador += 1
+                    pila.append(w)
+                    en_pila[w] = 1
+                    llamadas.append(w)
+                    break
+                if en_pila[w] and indice[w] < bajo[v]:
+                    bajo[v] = indice[w]
+            else:
+                # Sin aristas por revisar: "retorno" de v
+                siguiente[v] = fin
+                llamadas.pop()
+                if bajo[v] == indice[v]:  # v es raíz de una componente: sacarla de la pila
+                    while True:
+                        w = pila.pop()
+                        en_pila[w] = 0
+                        componente[w] = k
+                        if w == v:
+                            break
+                    k += 1
+                if llamadas and bajo[v] < bajo[llamadas[-1]]:
+                    bajo[llamadas[-1]] = bajo[v]
+
+    # Tarjan cierra primero las componentes sumidero: invertir la numeración da orden topológico
+    for v in range(n):
+        componente[v] = k - 1 - componente[v]
+    return componente, k
+
+
+# Componentes fuertemente conexas como listas de etiquetas, en orden topológico de la condensación
+def componentes_fuertes(grafo):
+    compacto = _compacto(grafo)
+    componente, k = componentes_fuertes_ids(compacto)
+    resultado = [[] for _ in range(k)]
+    for v, c in enumerate(componente):
+        resultado[c].append(compacto.etiquetas[v])
+    return resultado
+
+
+# DAG de componentes: el vértice c representa la componente c de componentes_fuertes_ids
+# (sus etiquetas son 0..k-1). Devuelve (dag, componente) con componente[id] como arriba.
+def condensacion(grafo):
+    compacto = _compacto(grafo)
+    componente, k = componentes_fuertes_ids(compacto)
+    n = len(compacto)
+    offsets, destinos = compacto.offsets, compacto.vista_destinos
+
+    # Vértices agrupados por componente (ordenamiento por conteo)
+    inicio = array('q', [0]) * (k + 1)
+    for c in componente:
+        inicio[c + 1] += 1
+    for c in range(k):
+        inicio[c + 1] += inicio[c]
+    libre = array('q', inicio[:k])
+    por_componente = ceros(tipo_indice(n), n)
+    for v, c in enumerate(componente):
+        por_componente[libre[c]] = v
+        libre[c] += 1
+
+    # Aristas entre componentes, sin repetir: marca[d] == c si ya se agregó c -> d
+    marca = array('q', [-1]) * k
+    offsets_dag = array('q', [0]) * (k + 1)
+    destinos_dag = array(tipo_indice(k))
+    for c in range(k):
+        for posicion in range(inicio[c], inicio[c + 1]):
+            v = por_componente[posicion]
+            for w in destinos[offsets[v]:offsets[v + 1]]:
+                d = componente[w]
+                if d != c and marca[d] != c:
+                    marca[d] = c
+                    destinos_dag.append(d)
+        offsets_dag[c + 1] = len(destinos_dag)
+    pesos = array('d', [1.0]) * len(destinos_dag)
+    return GrafoCompacto(list(range(k)), offsets_dag, destinos_dag, pesos, es_dirigido=True), componente
+
+
+def es_fuertemente_conexo(grafo):
+    compacto = _compacto(grafo)
+    n = len(compacto)
+    if n <= 1:
+        return True
+    if compacto._alcanzables(0).count(1) != n:
+        return False
+    return compacto.transpuesto()._alcanzables(0).count(1) == n
+
+
+# Orden topológico (etiquetas) con el algoritmo de Kahn. Lanza ValueError si el grafo tiene ciclos.
+def orden_topologico(grafo):
+    compacto = _compacto(grafo)
+    if not compacto.es_dirigido and compacto.num_aristas:
+        raise ValueError("El orden topológico solo está definido para grafos dirigidos")
+    n = len(compacto)
+    offsets, destinos = compacto.offsets, compacto.vista_destinos
+    grado_entrada = array('q', [0]) * n
+    for w in destinos:
+        grado_entrada[w] += 1
+    orden = [v for v in range(n) if grado_entrada[v] == 0]
+    for v in orden:  # La lista crece mientras se recorre: funciona como cola FIFO
+        for w in destinos[offsets[v]:offsets[v + 1]]:
+            grado_entrada[w] -= 1
+            if grado_entrada[w] == 0:
+                orden.append(w)
+    if len(orden) != n:
+        raise ValueError("El grafo tiene ciclos: no existe un orden topológico")
+    etiquetas = compacto.etiquetas
+    return [etiquetas[v] for v in orden]
+
+
+# Componentes débilmente conexas (ignorando la dirección), como listas de etiquetas
+def componentes_debiles(grafo):
+    compacto = _compacto(grafo)
+    entrada = compacto.transpuesto()
+    n = len(compacto)
+    visitados = bytearray(n)
+    resultado = []
+    for raiz in range(n):
+        if visitados[raiz]:
+            continue
+        visitados[raiz] = 1
+        cola = [raiz]
+        for v in cola:
+            for adyacencia in (compacto, entrada):
+                for w in adyacencia.vista_destinos[adyacencia.offsets[v]:adyacencia.offsets[v + 1]]:
+                    if not visitados[w]:
+                        visitados[w] = 1
+                        cola.append(w)
+        resultado.append([compacto.etiquetas[v] for v in cola])
+    return resultado
+
+
+def es_debilmente_conexo(grafo):
+    return len(componentes_debiles(grafo)) <= 1
+
+
+# Casos de prueba y escalado
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+
+    from grafo import Grafo
+
+    grafo = Grafo(es_dirigido=True)
+    for u, v in [('A', 'B'), ('B', 'C'), ('C', 'A'), ('C', 'D'), ('D', 'E'), ('E', 'D'),
+                 ('E', 'F'), ('G', 'F')]:
+        grafo.agregar_arista(u, v)
+    print("Componentes fuertes:", componentes_fuertes(grafo))
+    dag, componente = condensacion(grafo)
+    print("Condensación:", dag.aristas)
+    print("¿Fuertemente conexo?:", es_fuertemente_conexo(grafo))
+    print("¿Débilmente conexo?:", es_debilmente_conexo(grafo))
+    print("Orden topológico de la condensación:", orden_topologico(dag))
+    try:
+        orden_topologico(grafo)
+    except ValueError as error:
+        print("Orden topológico del grafo:", error)
+
+    tareas = Grafo(es_dirigido=True)
+    for u, v in [('leer', 'analizar'), ('analizar', 'compactar'), ('leer', 'validar'),
+                 ('validar', 'compactar'), ('compactar', 'guardar')]:
+        tareas.agregar_arista(u, v)
+    print("Orden de las tareas:", orden_topologico(tareas))
+
+    # Escalado: grafo dirigido aleatorio grande y un ciclo enorme (recursión de profundidad n)
+    num_vertices = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    azar = random.Random(1)
+    n = num_vertices
+    offsets = array('q', range(0, 3 * n + 1, 3))
+    destinos = array('i', (azar.randrange(n) for _ in range(3 * n)))
+    aleatorio = GrafoCompacto(list(range(n)), offsets, destinos, array('d', [1.0]) * (3 * n), es_dirigido=True)
+    ciclo = GrafoCompacto(list(range(n)), array('q', range(n + 1)), array('i', [*range(1, n), 0]),
+                          array('d', [1.0]) * n, es_dirigido=True)
+    for nombre, compacto in [("aleatorio (grado 3)", aleatorio), ("ciclo", ciclo)]:
+        inicio = time.perf_counter()
+        _, k = componentes_fuertes_ids(compacto)
+        t_scc = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        fuerte = es_fuertemente_conexo(compacto)
+        t_fuerte = time.perf_counter() - inicio
+        print(f"{nombre}: {n} vértices, {k} componentes fuertes ({t_scc:.2f} s), "
+              f"fuertemente conexo={fuerte} ({t_fuerte:.2f} s)")
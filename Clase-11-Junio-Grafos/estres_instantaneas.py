@@ -0,0 +1,198 @@
+"""
+╔════════════════════════════════════════════════════════════════════════════╗
+║                                                                            ║
+║  Prueba de estrés: lectores y un escritor en hilos                         ║
+║                                                                            ║
+║  Un hilo escritor agrega aristas (de a `lote` por publicación) mientras    ║
+║  NUM_LECTORES hilos buscan caminos y, cada tanto, hacen un BFS completo y  ║
+║  verifican la instantánea que están leyendo:                               ║
+║     • Simetría: en un grafo no dirigido, si v es vecino de u, u debe ser   ║
+║       vecino de v (una arista a medias rompe esto).                        ║
+║     • Prefijo: si la instantánea tiene k aristas, deben ser exactamente    ║
+║       las k primeras del registro de ingesta (ni más ni menos).            ║
+║     • Versiones: cada lector ve versiones que nunca retroceden.            ║
+║  Se compara GrafoConcurrente con un Grafo compartido que se modifica en    ║
+║  su sitio (sin instantáneas), donde además se cuentan las excepciones. Ahí ║
+║  el escritor no para: al terminar la ingesta la deshace y la repite, así   ║
+║  los lectores siempre encuentran el grafo cambiando. Con instantáneas      ║
+║  cualquier violación o excepción hace fallar la prueba (AssertionError).   ║
+║  Primero se mide a los lectores solos y luego con el escritor activo.      ║
+║                                                                            ║
+║  Uso: python estres_instantaneas.py [num_vertices] [segundos] [lote]       ║
+║                                                                            ║
+╚════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import random
+import sys
+import threading
+import time
+from collections import Counter
+
+from breadth_first_search import bfs
+from generadores import erdos_renyi
+from grafo import Grafo
+from instantaneas import GrafoConcurrente
+
+NUM_LECTORES = 4
+VERIFICAR_CADA = 5  # Consultas de camino entre dos verificaciones
+BFS_CADA = 1000  # Consultas de camino entre dos BFS completos
+
+
+class Resultado:
+    def __init__(self):
+        self.consultas = 0
+        self.verificaciones = 0
+        self.asimetrias = 0
+        self.fuera_de_prefijo = 0
+        self.retrocesos = 0
+        self.excepciones = Counter()
+        self.candado = threading.Lock()
+
+    def sumar(self, consultas, verificaciones, asimetrias, fuera_de_prefijo, retrocesos, excepciones):
+        with self.candado:
+            self.consultas += consultas
+            self.verificaciones += verificaciones
+            self.asimetrias += asimetrias
+            self.fuera_de_prefijo += fuera_de_prefijo
+            self.retrocesos += retrocesos
+            self.excepciones.update(excepciones)
+
+
+# Un lector. `leer()` devuelve lo que se recorre: la instantánea vigente o el Grafo compartido.
+def lector(leer, num_vertices, ingesta, num_base, progreso, lote, detener, resultado, semilla, con_prefijo):
+    azar = random.Random(semilla)
+    consultas = verificaciones = asimetrias = fuera_de_prefijo = retrocesos = 0
+    excepciones = Counter()
+    ultima_version = -1
+    while not detener.is_set():
+        grafo = leer()
+        try:
+            grafo.encontrar_camino(azar.randrange(num_vertices), azar.randrange(num_vertices))
+            consultas += 1
+            if consultas % BFS_CADA == 0:
+                bfs(grafo, ingesta[0][0])
+            if consultas % VERIFICAR_CADA:
+                continue
+            verificaciones += 1
+            # Un vértice del lote que el escritor está por tocar: ahí es donde se vería una arista a medias
+            u = ingesta[min(progreso[0] + azar.randrange(lote), len(ingesta) - 1)][azar.randrange(2)]
+            if u in grafo and any(not grafo.existe_arista(v, u) for v in grafo.obtener_vecinos(u)):
+                asimetrias += 1
+            if con_prefijo:
+                if grafo.version < ultima_version:
+                    retrocesos += 1
+                ultima_version = grafo.version
+                k = grafo.num_aristas // 2 - num_base  # Aristas de la ingesta ya publicadas
+                if (k > 0 and not grafo.existe_arista(*ingesta[k - 1])) or \
+                        (k < len(ingesta) and grafo.existe_arista(*ingesta[k])):
+                    fuera_de_prefijo += 1
+        except Exception as error:  # Lo que sea que rompa el recorrer un grafo que cambia
+            excepciones[f"{type(error).__name__}: {error}"] += 1
+    resultado.sumar(consultas, verificaciones, asimetrias, fuera_de_prefijo, retrocesos, excepciones)
+
+
+# Escribe la ingesta de a `lote` aristas. progreso = [índice de la próxima arista que se toca,
+# aristas escritas]. Con quitar_lote, al terminar deshace la ingesta y vuelve a empezar, para que
+# el grafo no deje de cambiar mientras leen los lectores.
+def escritor(agregar_lote, ingesta, lote, detener, progreso, quitar_lote=None):
+    while True:
+        for inicio in range(0, len(ingesta), lote):
+            if detener.is_set():
+                return
+            agregar_lote(ingesta[inicio:inicio + lote])
+            progreso[0] = inicio + lote
+            progreso[1] += len(ingesta[inicio:inicio + lote])
+        if quitar_lote is None:
+            return
+        for inicio in reversed(range(0, len(ingesta), lote)):
+            if detener.is_set():
+                return
+            progreso[0] = inicio
+            quitar_lote(ingesta[inicio:inicio + lote])
+            progreso[1] += len(ingesta[inicio:inicio + lote])
+
+
+# Corre los lectores `segundos` segundos, con o sin escritor. Devuelve (Resultado, aristas escritas).
+def fase(leer, agregar_lote, num_vertices, ingesta, num_base, segundos, lote, con_escritor, con_prefijo,
+         quitar_lote=None):
+    detener = threading.Event()
+    resultado = Resultado()
+    progreso = [0, 0]
+    hilos = [threading.Thread(target=lector, args=(leer, num_vertices, ingesta, num_base, progreso, lote,
+                                                   detener, resultado, i, con_prefijo))
+             for i in range(NUM_LECTORES)]
+    if con_escritor:
+        hilos.append(threading.Thread(target=escritor, args=(agregar_lote, ingesta, lote, detener, progreso,
+                                                             quitar_lote)))
+    for hilo in hilos:
+        hilo.start()
+    time.sleep(segundos)
+    detener.set()
+    for hilo in hilos:
+        hilo.join()
+    return resultado, progreso[1]
+
+
+def informe(nombre, resultado, segundos, escritas):
+    print(f"  {nombre:22}{resultado.consultas / segundos:10.0f} consultas/s  {escritas / segundos:9.0f} aristas/s  "
+          f"verificaciones={resultado.verificaciones} asimetrías={resultado.asimetrias} "
+          f"fuera de prefijo={resultado.fuera_de_prefijo} retrocesos={resultado.retrocesos}")
+    for mensaje, veces in resultado.excepciones.most_common(3):
+        print(f"      {veces} x {mensaje}")
+
+
+if __name__ == "__main__":
+    num_vertices = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    segundos = float(sys.argv[2]) if len(sys.argv) > 2 else 5.0
+    lote = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+    sys.setswitchinterval(1e-5)  # Cambios de hilo más frecuentes: más entrelazados posibles
+
+    # La mitad de las aristas forman el grafo inicial; la otra mitad es el registro de ingesta
+    _, aristas = erdos_renyi(num_vertices, 4 * num_vertices, semilla=7)
+    base, ingesta = aristas[:len(aristas) // 2], aristas[len(aristas) // 2:]
+    print(f"{num_vertices} vértices, {len(base)} aristas iniciales, {len(ingesta)} por ingerir, "
+          f"{NUM_LECTORES} lectores, lotes de {lote}")
+
+    # Con instantáneas
+    inicial = Grafo()
+    for u, v in base:
+        inicial.agregar_arista(u, v)
+    concurrente = GrafoConcurrente.desde_grafo(inicial)
+
+    def agregar_lote(aristas):
+        with concurrente.lote() as cambios:
+            for u, v in aristas:
+                cambios.agregar_arista(u, v)
+
+    print("\nGrafoConcurrente (instantáneas):")
+    for nombre, con_escritor in [("solo lectores", False), ("lectores + escritor", True)]:
+        resultado, escritas = fase(concurrente.instantanea, agregar_lote, num_vertices, ingesta, len(base),
+                                   segundos, lote, con_escritor, con_prefijo=True)
+        informe(nombre, resultado, segundos, escritas)
+        # Con instantáneas no puede haber ninguna violación: si aparece una, la prueba falla
+        assert resultado.asimetrias == resultado.fuera_de_prefijo == resultado.retrocesos == 0, nombre
+        assert not resultado.excepciones, resultado.excepciones
+    print(f"  versión final {concurrente.version}, fusiones con la base: {concurrente.fusiones}")
+
+    # Sin instantáneas: todos comparten el mismo Grafo, que se modifica en su sitio
+    compartido = Grafo()
+    for u, v in base:
+        compartido.agregar_arista(u, v)
+
+    def agregar_en_sitio(aristas):
+        for u, v in aristas:
+            compartido.agregar_arista(u, v)
+
+    def quitar_en_sitio(aristas):
+        for u, v in aristas:
+            compartido.eliminar_arista(u, v)
+
+    # El escritor no se detiene al terminar la ingesta: la deshace y la repite durante toda la fase
+    print("\nGrafo compartido (sin instantáneas):")
+    for nombre, con_escritor in [("solo lectores", False), ("lectores + escritor", True)]:
+        resultado, escritas = fase(lambda: compartido, agregar_en_sitio, num_vertices, ingesta, len(base),
+                                   segundos, lote, con_escritor, con_prefijo=False, quitar_lote=quitar_en_sitio)
+        informe(nombre, resultado, segundos, escritas)
+    if not (resultado.asimetrias or resultado.excepciones):
+        print("  (ninguna carrera observada esta vez: pruebe con más segundos)")
@@ -0,0 +1,240 @@
+"""
+╔════════════════════════════════════════════════════════════════════════════╗
+║                                                                            ║
+║  Formato binario en disco para GrafoCompacto (apertura con mmap)           ║
+║  Versión: 1.0.0                                                            ║
+║                                                                            ║
+║  Estructura del archivo (little-endian, secciones alineadas a 8 bytes):    ║
+║     • Encabezado de 112 bytes: firma b'GRAFOCSR', versión de formato,      ║
+║       banderas (bit 0 = dirigido), n, m, tipo de los ids ('i' o 'q'),      ║
+║       posición y longitud de cada sección y CRC32 de todo el contenido     ║
+║       que sigue al encabezado.                                             ║
+║     • Tabla de etiquetas: lista JSON en UTF-8 (tuplas como {"tupla": []}). ║
+║     • offsets (n + 1 enteros de 8 bytes), destinos (m ids), pesos          ║
+║       (m flotantes de 8 bytes).                                            ║
+║                                                                            ║
+║  abrir_grafo() mapea el archivo en memoria (mmap) y construye el grafo     ║
+║  con memoryviews sobre ese mapa: no se copia la adyacencia, los recorridos ║
+║  empiezan de inmediato y varios procesos que abren el mismo archivo        ║
+║  comparten las mismas páginas físicas.                                     ║
+║                                                                            ║
+╚════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import json
+import mmap
+import struct
+import sys
+import zlib
+
+from grafo_compacto import GrafoCompacto, tipo_indice
+
+FIRMA = b'GRAFOCSR'
+VERSION = 1
+DIRIGIDO = 1  # Bandera del bit 0
+
+# firma, versión, banderas, n, m, tipo de ids, (posición, longitud) x 4 secciones, crc32
+ENCABEZADO = struct.Struct('<8sIIQQc7xQQQQQQQQI4x')
+
+
+def _alinear(posicion):
+    return (posicion + 7) & ~7
+
+
+def _compacto(grafo):
+    return grafo if isinstance(grafo, GrafoCompacto) else grafo.compactar()
+
+
+# Las tuplas (p. ej. las coordenadas (fila, columna) de una rejilla) se guardan como
+# {"tupla": [...]}: JSON las convertiría en listas, que no sirven como etiquetas.
+def _codificar_etiqueta(etiqueta):
+    if isinstance(etiqueta, tuple):
+        return {'tupla': [_codificar_etiqueta(x) for x in etiqueta]}
+    return etiqueta
+
+
+def _decodificar_objeto(objeto):
+    return tuple(objeto['tupla']) if objeto.keys() == {'tupla'} else objeto
+
+
+# Guardar un Grafo o GrafoCompacto en `ruta`
+def guardar_grafo(grafo, ruta):
+    compacto = _compacto(grafo)
+    n, m = len(compacto), len(compacto.destinos)
+    tipo = tipo_indice(n)
+    if compacto.destinos.itemsize != struct.calcsize(tipo):
+        raise ValueError("El tipo de los ids no coincide con el tamaño del grafo")
+    try:
+        texto = json.dumps([_codificar_etiqueta(e) for e in compacto.etiquetas], ensure_ascii=False)
+    except TypeError as error:
+        raise ValueError(f"Las etiquetas deben ser serializables en JSON: {error}") from None
+    # Rechazar al guardar lo que no volvería igual al abrir (p. ej. subclases de str o de int)
+    for original, leida in zip(compacto.etiquetas, json.loads(texto, object_hook=_decodificar_objeto)):
+        if type(original) is not type(leida) or original != leida:
+            raise ValueError(f"La etiqueta {original!r} no se puede guardar: al abrirla sería {leida!r}")
+    etiquetas = texto.encode('utf-8')
+
+    secciones = [etiquetas, compacto.offsets, compacto.destinos, compacto.pesos]
+    posiciones = []
+    posicion = ENCABEZADO.size
+    for seccion in secciones:
+        longitud = memoryview(seccion).nbytes
+        posiciones += [posicion, longitud]
+        posicion = _alinear(posicion + longitud)
+
+    with open(ruta, 'wb') as archivo:
+        archivo.write(bytes(ENCABEZADO.size))  # Se reescribe al final con el CRC
+        crc = 0
+        for seccion in secciones:
+            datos = memoryview(seccion).cast('B')
+            relleno = bytes(_alinear(archivo.tell() + len(datos)) - archivo.tell() - len(datos))
+            archivo.write(datos)
+            archivo.write(relleno)
+            crc = zlib.crc32(relleno, zlib.crc32(datos, crc))
+        banderas = DIRIGIDO if compacto.es_dirigido else 0
+        archivo.seek(0)
+        archivo.write(ENCABEZADO.pack(FIRMA, VERSION, banderas, n, m, tipo.encode(), *posiciones, crc))
+
+
+# Lee y valida el encabezado. Devuelve sus campos como diccionario.
+def _leer_encabezado(datos):
+    if len(datos) < ENCABEZADO.size:
+        raise ValueError("Archivo demasiado corto para ser un grafo binario")
+    campos = ENCABEZADO.unpack_from(datos)
+    firma, version, banderas, n, m, tipo = campos[:6]
+    posiciones = campos[6:14]
+    if firma != FIRMA:
+        raise ValueError("El archivo no es un grafo binario (firma inválida)")
+    if version != VERSION:
+        raise ValueError(f"Versión de formato no soportada: {version} (se esperaba {VERSION})")
+    tipo = tipo.decode()
+    tamano_id = struct.calcsize(tipo)
+    esperadas = [None, (n + 1) * 8, m * tamano_id, m * 8]
+    for i, esperada in enumerate(esperadas):
+        posicion, longitud = posiciones[2 * i], posiciones[2 * i + 1]
+        if (esperada is not None and longitud != esperada) or posicion + longitud > len(datos):
+            raise ValueError("Encabezado inconsistente con el tamaño del archivo")
+    return {
+        'es_dirigido': bool(banderas & DIRIGIDO), 'n': n, 'm': m, 'tipo': tipo,
+        'secciones': [(posiciones[2 * i], posiciones[2 * i + 1]) for i in range(4)], 'crc': campos[14],
+    }
+
+
+# Comprueba el CRC32 del contenido. Lanza ValueError si el archivo está dañado.
+def verificar_grafo(ruta):
+    with open(ruta, 'rb') as archivo, mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+        encabezado = _leer_encabezado(mapa)
+        with memoryview(mapa) as datos:
+            crc = zlib.crc32(datos[ENCABEZADO.size:])
+    if crc != encabezado['crc']:
+        raise ValueError("Suma de verificación incorrecta: el archivo está dañado")
+
+
+# Abrir un grafo guardado con guardar_grafo sin copiar la adyacencia.
+# Con verificar=True se comprueba el CRC32 (lee el archivo completo una vez).
+def abrir_grafo(ruta, verificar=False):
+    if sys.byteorder != 'little':
+        raise ValueError("El formato binario solo puede mapearse en máquinas little-endian")
+    if verificar:
+        verificar_grafo(ruta)
+    with open(ruta, 'rb') as archivo:
+        mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+    encabezado = _leer_encabezado(mapa)
+
+    datos = memoryview(mapa)  # Las vistas mantienen vivo el mapa mientras el grafo exista
+    (p_etiquetas, l_etiquetas), (p_offsets, l_offsets), (p_destinos, l_destinos), (p_pesos, l_pesos) = \
+        encabezado['secciones']
+    etiquetas = json.loads(bytes(datos[p_etiquetas:p_etiquetas + l_etiquetas]).decode('utf-8'),
+                           object_hook=_decodificar_objeto)
+    offsets = datos[p_offsets:p_offsets + l_offsets].cast('q')
+    destinos = datos[p_destinos:p_destinos + l_destinos].cast(encabezado['tipo'])
+    pesos = datos[p_pesos:p_pesos + l_pesos].cast('d')
+    return GrafoCompacto(etiquetas, offsets, destinos, pesos, encabezado['es_dirigido'])
+
+
+# Casos de prueba: ida y vuelta contra Clase-11-Junio-Grafos/grafo.py
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+
+    from grafo import Grafo
+    from breadth_first_search import bfs, dfs
+
+    for es_dirigido in (False, True):
+        grafo = Grafo(es_dirigido=es_dirigido)
+        for u, v, peso in [('A', 'B', 2), ('A', 'C', 1), ('B', 'D', 4), ('B', 'E', 1),
+                           ('C', 'D', 3), ('D', 'E', 1), ('F', 'A', 5)]:
+            grafo.agregar_arista(u, v, peso)
+
+        with tempfile.TemporaryDirectory() as carpeta:
+            ruta = os.path.join(carpeta, 'grafo.bin')
+            guardar_grafo(grafo, ruta)
+            abierto = abrir_grafo(ruta, verificar=True)
+
+            tipo = "dirigido" if es_dirigido else "no dirigido"
+            assert abierto.vertices == grafo.vertices, tipo
+            assert abierto.aristas == grafo.compactar().aristas, tipo
+            assert bfs(abierto, 'A') == bfs(grafo, 'A'), tipo
+            assert dfs(abierto, 'A') == dfs(grafo, 'A'), tipo
+            assert abierto.encontrar_camino('A', 'E') == grafo.encontrar_camino('A', 'E'), tipo
+            print(f"Grafo {tipo} ({os.path.getsize(ruta)} bytes en disco): vértices, aristas, BFS y DFS iguales")
+            print("  BFS desde A:", bfs(abierto, 'A'), " camino de A a E:", abierto.encontrar_camino('A', 'E'))
+            del abierto
+
+            # Un byte dañado en la adyacencia debe detectarse
+            with open(ruta, 'r+b') as archivo:
+                archivo.seek(-1, os.SEEK_END)
+                ultimo = archivo.read(1)
+                archivo.seek(-1, os.SEEK_END)
+                archivo.write(bytes([ultimo[0] ^ 0xFF]))
+            try:
+                verificar_grafo(ruta)
+            except ValueError as error:
+                print("  Daño detectado:", error)
+            else:
+                raise AssertionError(f"Grafo {tipo}: no se detectó el daño")
+
+    # Etiquetas tupla, como las de una rejilla: vuelven como tuplas
+    rejilla = Grafo()
+    for fila in range(3):
+        for columna in range(3):
+            if columna + 1 < 3:
+                rejilla.agregar_arista((fila, columna), (fila, columna + 1))
+            if fila + 1 < 3:
+                rejilla.agregar_arista((fila, columna), (fila + 1, columna))
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, 'rejilla.bin')
+        guardar_grafo(rejilla, ruta)
+        abierto = abrir_grafo(ruta, verificar=True)
+        assert abierto.vertices == rejilla.vertices
+        assert all(isinstance(vertice, tuple) for vertice in abierto.vertices)
+        assert abierto.aristas == rejilla.compactar().aristas
+        assert bfs(abierto, (0, 0)) == bfs(rejilla, (0, 0))
+        assert dfs(abierto, (0, 0)) == dfs(rejilla, (0, 0))
+        camino = abierto.encontrar_camino((0, 0), (2, 2))
+        assert camino == rejilla.encontrar_camino((0, 0), (2, 2))
+        print("\nRejilla 3x3: etiquetas tupla iguales, camino:", camino)
+        del abierto
+        conjuntos = Grafo()
+        conjuntos.agregar_arista(frozenset({1}), frozenset({2}))
+        try:
+            guardar_grafo(conjuntos, ruta)
+        except ValueError as error:
+            print("Etiqueta no guardable:", error)
+        else:
+            raise AssertionError("Se guardó una etiqueta frozenset")
+
+    # Tiempo de apertura frente a reconstruir el grafo
+    grafo = Grafo()
+    for i in range(200_000):
+        grafo.agregar_arista(i, (i * 7919 + 1) % 200_000)
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, 'grande.bin')
+        guardar_grafo(grafo, ruta)
+        inicio = time.perf_counter()
+        abierto = abrir_grafo(ruta)
+        print(f"\nApertura con mmap de {len(abierto)} vértices: {time.perf_counter() - inicio:.3f} s")
+        assert bfs(abierto, 0) == bfs(grafo, 0)
+        print("BFS desde 0 visita", len(bfs(abierto, 0)), "vértices")
+        del abierto
@@ -0,0 +1,100 @@
+"""
+╔════════════════════════════════════════════════════════════════════════════╗
+║                                                                            ║
+║  Generadores de grafos sintéticos reproducibles                            ║
+║  Versión: 1.0.0                                                            ║
+║                                                                            ║
+║  Descripción:                                                              ║
+║  Cada generador devuelve (num_vertices, aristas), con vértices 0..n-1 y    ║
+║  aristas como lista de pares (u, v). Con la misma semilla se obtiene       ║
+║  exactamente la misma lista, en el mismo orden.                            ║
+║     • erdos_renyi(n, m): m aristas con extremos uniformes (modelo G(n, m)) ║
+║     • barabasi_albert(n, k): cada vértice nuevo se une a k vértices        ║
+║       elegidos con probabilidad proporcional a su grado                    ║
+║     • rejilla(filas, columnas): rejilla 2D, vecinos arriba/abajo/lados     ║
+║     • camino_largo(n): 0 - 1 - 2 - ... - (n-1)                             ║
+║     • estrella(n): el vértice 0 unido a todos los demás                    ║
+║                                                                            ║
+╚════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import random
+
+
+# Modelo G(n, m): m aristas distintas sin lazos, con extremos uniformes
+def erdos_renyi(n, m, semilla=42):
+    if n < 2 and m > 0:
+        raise ValueError("Se necesitan al menos 2 vértices para tener aristas")
+    if m > n * (n - 1) // 2:
+        raise ValueError(f"Un grafo simple de {n} vértices no puede tener {m} aristas")
+    azar = random.Random(semilla)
+    vistas = set()
+    aristas = []
+    while len(aristas) < m:
+        u, v = azar.randrange(n), azar.randrange(n)
+        if u == v or (u, v) in vistas or (v, u) in vistas:
+            continue
+        vistas.add((u, v))
+        aristas.append((u, v))
+    return n, aristas
+
+
+# Enlace preferencial: se parte de un núcleo de k + 1 vértices unidos en cadena y cada
+# vértice nuevo se une a k vértices distintos, elegidos en proporción a su grado.
+def barabasi_albert(n, k=3, semilla=42):
+    if k < 1 or n <= k:
+        raise ValueError("Se necesita 1 <= k < n")
+    azar = random.Random(semilla)
+    aristas = [(i, i + 1) for i in range(k)]
+    extremos = [v for arista in aristas for v in arista]  # Cada vértice aparece tantas veces como su grado
+    for nuevo in range(k + 1, n):
+        elegidos = set()
+        while len(elegidos) < k:
+            elegidos.add(azar.choice(extremos))
+        for v in sorted(elegidos):  # Orden fijo: el resultado no depende del orden del conjunto
+            aristas.append((nuevo, v))
+            extremos += (nuevo, v)
+    return n, aristas
+
+
+# Rejilla de filas x columnas; el vértice (f, c) tiene id f * columnas + c
+def rejilla(filas, columnas):
+    aristas = []
+    for f in range(filas):
+        for c in range(columnas):
+            vertice = f * columnas + c
+            if c + 1 < columnas:
+                aristas.append((vertice, vertice + 1))
+            if f + 1 < filas:
+                aristas.append((vertice, vertice + columnas))
+    return filas * columnas, aristas
+
+
+def camino_largo(n):
+    return n, [(i, i + 1) for i in range(n - 1)]
+
+
+def estrella(n):
+    return n, [(0, hoja) for hoja in range(1, n)]
+
+
+# Generadores con un solo parámetro de tamaño (número aproximado de vértices), para los benchmarks
+GENERADORES = {
+    'erdos_renyi': lambda n, semilla: erdos_renyi(n, 4 * n, semilla),
+    'barabasi_albert': lambda n, semilla: barabasi_albert(n, 3, semilla),
+    'rejilla': lambda n, semilla: rejilla(int(n ** 0.5), int(n ** 0.5)),
+    'camino_largo': lambda n, semilla: camino_largo(n),
+    'estrella': lambda n, semilla: estrella(n),
+}
+
+
+if __name__ == "__main__":
+    for nombre, generador in GENERADORES.items():
+        n, aristas = generador(1_000, 7)
+        grados = [0] * n
+        for u, v in aristas:
+            grados[u] += 1
+            grados[v] += 1
+        print(f"{nombre:16} {n:>6} vértices {len(aristas):>6} aristas  grado máximo {max(grados):>4}")
+    assert erdos_renyi(100, 300, 1) == erdos_renyi(100, 300, 1)
+    assert barabasi_albert(100, 2, 1) == barabasi_albert(100, 2, 1)
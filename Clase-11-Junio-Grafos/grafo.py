@@ -18,17 +18,67 @@
 """
 
 from collections import deque
+from operator import itemgetter
+
+import instrumentacion
+from componentes import UnionFind
+
+# Qué hacer al agregar una arista u -> v que ya existe
+POLITICAS_ARISTAS_PARALELAS = (
+    'permitir',    # Se agrega otra arista paralela (comportamiento original)
+    'actualizar',  # Se reemplaza el peso de la arista existente
+    'rechazar',    # Se lanza ValueError
+)
 
 # Clase Grafo
 class Grafo:
-    def __init__(self, es_dirigido=False):
+    def __init__(self, es_dirigido=False, indexar_aristas=False, aristas_paralelas='permitir'):
+        if aristas_paralelas not in POLITICAS_ARISTAS_PARALELAS:
+            raise ValueError(f"Política desconocida: {aristas_paralelas}. Use una de {POLITICAS_ARISTAS_PARALELAS}")
         self.grafo = {}
         self.es_dirigido = es_dirigido
+        self.aristas_paralelas = aristas_paralelas
+        # Índice opcional {u: {v: posición de (v, peso) en self.grafo[u]}} para existe_arista en O(1).
+        # Las políticas 'actualizar' y 'rechazar' lo necesitan, así que lo activan.
+        self._indice_aristas = None
+        if indexar_aristas or aristas_paralelas != 'permitir':
+            self.indexar_aristas()
+        self._compacto = None  # Copia compacta (CSR) en caché, se invalida al modificar el grafo
+        self._entrada = None  # Adyacencia de entrada, se crea al primer uso y luego se mantiene al día
+        self._componentes = None  # Índice Union-Find; se crea en la primera consulta y luego se mantiene al día
+        self.version = 0  # Aumenta con cada cambio; las cachés de consultas la usan para invalidarse
+        self._cache_caminos = None  # CacheCaminos opcional (ver activar_cache_caminos)
+
+    def __contains__(self, vertice):
+        return vertice in self.grafo
+
+    @property
+    def vertices(self):
+        return list(self.grafo)
+
+    # Lista de aristas (u, v, peso). En grafos no dirigidos cada arista aparece una sola vez.
+    @property
+    def aristas(self):
+        resultado = []
+        vistos = set()
+        for u, vecinos in self.grafo.items():
+            vistos.add(u)
+            for v, peso in vecinos:
+                if self.es_dirigido or v not in vistos or v == u:
+                    resultado.append((u, v, peso))
+        return resultado
 
     # Agregar un vértice al grafo. Si el vértice ya existe, no hace nada.
     def agregar_vertice(self, vertice):
         if vertice not in self.grafo:
             self.grafo[vertice] = []
+            if self._indice_aristas is not None:
+                self._indice_aristas[vertice] = {}
+            if self._entrada is not None:
+                self._entrada[vertice] = []
+            if self._componentes is not None:
+                self._componentes.agregar(vertice)
+            self._invalidar_cache()
 
     # Agregar una arista entre dos vértices. Si no existe el vértice, se agrega.
     def agregar_arista(self, u, v, peso=1):
@@ -36,23 +86,262 @@ class Grafo:
             self.agregar_vertice(u)
         if v not in self.grafo:
             self.agregar_vertice(v)
+        indice = self._indice_aristas
+        if indice is not None:
+            if v in indice[u] and self.aristas_paralelas != 'permitir':
+                if self.aristas_paralelas == 'rechazar':
+                    raise ValueError(f"La arista {u} -> {v} ya existe")
+                # 'actualizar': reemplazar el peso en su posición
+                if u == v and not self.es_dirigido:
+                    # Un lazo no dirigido ocupa dos entradas de la misma lista y el índice solo
+                    # guarda la primera: se actualizan ambas
+                    self.grafo[u] = [(w, peso if w == v else anterior) for w, anterior in self.grafo[u]]
+                else:
+                    self.grafo[u][indice[u][v]] = (v, peso)
+                    if not self.es_dirigido:
+                        self.grafo[v][indice[v][u]] = (u, peso)
+                self._invalidar_cache()
+                return
+            indice[u].setdefault(v, len(self.grafo[u]))
+            if not self.es_dirigido:
+                indice[v].setdefault(u, len(self.grafo[v]) + (u == v))
         self.grafo[u].append((v, peso))
         if not self.es_dirigido:
             self.grafo[v].append((u, peso))
+        if self._entrada is not None:
+            self._entrada[v].append(u)
+            if not self.es_dirigido:
+                self._entrada[u].append(v)
+        if self._componentes is not None:
+            self._componentes.unir(u, v)
+        self._invalidar_cache()
+
+    # Eliminar una arista u -> v (en grafos no dirigidos, también v -> u). Si hay aristas
+    # paralelas, se elimina solo una. Lanza ValueError si la arista no existe.
+    def eliminar_arista(self, u, v):
+        # Se comprueban las dos entradas antes de tocar nada, para no dejar la arista a medias
+        if not self.existe_arista(u, v) or (not self.es_dirigido and not self.existe_arista(v, u)):
+            raise ValueError(f"La arista {u} -> {v} no existe")
+        peso = self._quitar_entrada(u, v)
+        if not self.es_dirigido:
+            self._quitar_entrada(v, u, peso)
+        if self._entrada is not None:
+            self._entrada[v].remove(u)
+            if not self.es_dirigido:
+                self._entrada[u].remove(v)
+        # Si queda una arista paralela, las componentes no cambian; si no, pueden partirse en dos
+        # y Union-Find no sabe separar conjuntos: el índice se reconstruye en la próxima consulta.
+        if self._componentes is not None and not (self.existe_arista(u, v) or self.existe_arista(v, u)):
+            self._componentes = None
+        self._invalidar_cache()
+
+    # Eliminar un vértice junto con todas sus aristas (de salida y de entrada).
+    # Lanza ValueError si el vértice no existe.
+    def eliminar_vertice(self, vertice):
+        if vertice not in self.grafo:
+            raise ValueError(f"El vértice {vertice} no existe en el grafo")
+        salientes = self.grafo[vertice]
+        # Vértices con aristas hacia `vertice`: en un grafo no dirigido son sus propios vecinos
+        origenes = self._adyacencia_entrada()[vertice] if self.es_dirigido else [w for w, _ in salientes]
+        aislado = not salientes and not origenes
+        for w in set(origenes) - {vertice}:
+            self.grafo[w] = [par for par in self.grafo[w] if par[0] != vertice]
+            if self._indice_aristas is not None:
+                self._indice_aristas[w] = self._posiciones(self.grafo[w])
+        if self._entrada is not None:
+            for w in {w for w, _ in salientes}:
+                self._entrada[w] = [x for x in self._entrada[w] if x != vertice]
+            del self._entrada[vertice]
+        del self.grafo[vertice]
+        if self._indice_aristas is not None:
+            del self._indice_aristas[vertice]
+        if self._componentes is not None:
+            if aislado:
+                self._componentes.quitar(vertice)  # Conjunto unitario: se quita sin tocar los demás
+            else:
+                self._componentes = None
+        self._invalidar_cache()
+
+    # Quita una entrada (v, peso) de la lista de u en O(1): la última entrada ocupa su hueco,
+    # así que el orden de los vecinos de u cambia. Con `peso`, quita una entrada con ese peso
+    # (la pareja de la arista no dirigida ya quitada). Devuelve el peso de la entrada quitada.
+    def _quitar_entrada(self, u, v, peso=None):
+        vecinos = self.grafo[u]
+        posiciones = None if self._indice_aristas is None else self._indice_aristas[u]
+        posicion = None if posiciones is None else posiciones.get(v)
+        if posicion is None or (peso is not None and vecinos[posicion][1] != peso):
+            candidatas = [i for i, (w, _) in enumerate(vecinos) if w == v]
+            if not candidatas:
+                raise ValueError(f"La arista {u} -> {v} no existe")
+            # La pareja con el mismo peso si la hay; si no, cualquier entrada de v
+            posicion = next((i for i in candidatas if peso is None or vecinos[i][1] == peso), candidatas[0])
+        quitado = vecinos[posicion][1]
+        ultimo = vecinos.pop()
+        if posicion < len(vecinos):
+            vecinos[posicion] = ultimo
+        if posiciones is not None:
+            # Solo pueden haber quedado desactualizadas las posiciones de v y del último vecino
+            for w in (v, ultimo[0]):
+                p = posiciones.get(w)
+                if p is None or (p < len(vecinos) and vecinos[p][0] == w):
+                    continue
+                if w == ultimo[0] and posicion < len(vecinos):
+                    posiciones[w] = posicion
+                elif self.aristas_paralelas == 'permitir' or u == v:  # Puede quedar otra entrada de w
+                    otra = next((i for i, (x, _) in enumerate(vecinos) if x == w), None)
+                    if otra is None:
+                        del posiciones[w]
+                    else:
+                        posiciones[w] = otra
+                else:
+                    del posiciones[w]
+        return quitado
+
+    # Activa el índice de aristas (si no estaba activo) construyéndolo a partir de las listas actuales.
+    def indexar_aristas(self):
+        if self._indice_aristas is None:
+            self._indice_aristas = {u: self._posiciones(vecinos) for u, vecinos in self.grafo.items()}
+
+    # {v: posición de la primera entrada de v} para una lista de vecinos
+    @staticmethod
+    def _posiciones(vecinos):
+        posiciones = {}
+        for posicion, (v, _) in enumerate(vecinos):
+            posiciones.setdefault(v, posicion)
+        return posiciones
+
+    # Descarta las estructuras derivadas; se reconstruyen la próxima vez que se necesiten.
+    # (La adyacencia de entrada no: cada cambio la actualiza en su sitio.)
+    def _invalidar_cache(self):
+        self._compacto = None
+        self.version += 1
+
+    # Aplica un registro de cambios: tuplas como ('agregar_arista', u, v, peso) o
+    # ('eliminar_vertice', v). Ver cambios.py. Devuelve cuántos cambios se aplicaron.
+    def aplicar_cambios(self, cambios):
+        from cambios import ELIMINACIONES, aplicar_cambios
+        cambios = list(cambios)
+        if self._componentes is not None and any(cambio[0] in ELIMINACIONES for cambio in cambios):
+            # Se reconstruirá una sola vez en la próxima consulta, en vez de mantenerlo cambio a cambio
+            self._componentes = None
+        return aplicar_cambios(self, cambios)
+
+    # Guarda los resultados de encontrar_camino (y el árbol BFS de cada origen) en una caché LRU
+    # limitada a memoria_maxima bytes. Devuelve la caché, que lleva contadores de aciertos y fallos.
+    def activar_cache_caminos(self, memoria_maxima=None):
+        from cache_caminos import MEMORIA_MAXIMA, CacheCaminos
+        self._cache_caminos = CacheCaminos(MEMORIA_MAXIMA if memoria_maxima is None else memoria_maxima)
+        return self._cache_caminos
+
+    def desactivar_cache_caminos(self):
+        self._cache_caminos = None
+
+    # Índice de componentes (Union-Find). Si no existe o fue descartado (self._componentes = None,
+    # p. ej. tras un cambio que no se puede aplicar de forma incremental), se reconstruye aquí.
+    # En grafos dirigidos las componentes son las débilmente conexas.
+    def _indice_componentes(self):
+        if self._componentes is None:
+            componentes = UnionFind(self.grafo)
+            for u, vecinos in self.grafo.items():
+                for v, _ in vecinos:
+                    componentes.unir(u, v)
+            self._componentes = componentes
+        return self._componentes
+
+    # ¿Hay un camino entre u y v (ignorando la dirección de las aristas)? O(α(n)).
+    def conectados(self, u, v):
+        if u not in self.grafo or v not in self.grafo:
+            return False
+        return self._indice_componentes().conectados(u, v)
+
+    def num_componentes(self):
+        return self._indice_componentes().num_conjuntos
+
+    # Tamaño de la componente que contiene al vértice
+    def tamano_componente(self, vertice):
+        if vertice not in self.grafo:
+            raise ValueError(f"El vértice {vertice} no existe en el grafo")
+        return self._indice_componentes().tamano_conjunto(vertice)
+
+    # Tamaños de todas las componentes, de mayor a menor
+    def tamanos_componentes(self):
+        return self._indice_componentes().tamanos()
+
+    # Devuelve una versión congelada (CSR) del grafo para recorridos de solo lectura.
+    # Se construye una sola vez y se reutiliza mientras el grafo no cambie.
+    def compactar(self):
+        if self._compacto is None:
+            from grafo_compacto import GrafoCompacto
+            self._compacto = GrafoCompacto.desde_grafo(self)
+        return self._compacto
 
     # Obtener los vecinos de un vertice. 
     def obtener_vecinos(self, vertice):
         return [v[0] for v in self.grafo.get(vertice, [])] # Si el vertice no existe, devuelve una lista vacia
     
+    # Vecinos de un vértice sin construir una lista: recorre las tuplas (v, peso) en su sitio.
+    # Con invertido=True los entrega del último al primero (lo que necesita el DFS con pila).
+    # Es una vista de solo lectura: no se debe modificar el grafo mientras se recorre.
+    def iterar_vecinos(self, vertice, invertido=False):
+        vecinos = self.grafo.get(vertice, ())
+        return map(itemgetter(0), reversed(vecinos) if invertido else vecinos)
+    
+    # Vértices con una arista hacia `vertice`. En un grafo no dirigido coinciden con los vecinos.
+    def obtener_vecinos_entrada(self, vertice):
+        if not self.es_dirigido:
+            return self.obtener_vecinos(vertice)
+        return list(self._adyacencia_entrada().get(vertice, []))
+    
+    # Igual que obtener_vecinos_entrada, pero sin copiar la lista
+    def iterar_vecinos_entrada(self, vertice):
+        if not self.es_dirigido:
+            return self.iterar_vecinos(vertice)
+        return iter(self._adyacencia_entrada().get(vertice, ()))
+    
+    def _adyacencia_entrada(self):
+        if self._entrada is None:
+            self._entrada = {u: [] for u in self.grafo}
+            for u, vecinos in self.grafo.items():
+                for v, _ in vecinos:
+                    self._entrada[v].append(u)
+        return self._entrada
+    
     def existe_arista(self, u, v):
+        if self._indice_aristas is not None:  # O(1) con el índice de aristas
+            return v in self._indice_aristas.get(u, ())
         return any(v == vecino[0] for vecino in self.grafo.get(u, [])) # Si existe una arista entre u y v, devuelve True
     
-    def es_conexo(self):
+    # Consulta de muchas aristas a la vez: lista de booleanos, uno por par (u, v)
+    def existen_aristas(self, pares):
+        if self._indice_aristas is None:
+            self.indexar_aristas()  # Para un lote grande, construir el índice una vez sale más barato
+        indice = self._indice_aristas
+        return [v in indice.get(u, ()) for u, v in pares]
+    
+    # Camino de menor peso total entre inicio y fin: (camino, costo). Con heurística usa A*.
+    # radio acota el costo explorado y espacio reutiliza un EspacioTrabajo entre consultas
+    # (ver caminos_ponderados.py)
+    def camino_mas_corto(self, inicio, fin, heuristica=None, radio=None, espacio=None):
+        from caminos_ponderados import camino_mas_corto
+        return camino_mas_corto(self, inicio, fin, heuristica, radio, espacio)
+    
+    # estrategia: None para el BFS clásico, o 'top-down', 'bottom-up' o 'hibrida' para
+    # recorrer la versión compacta con el BFS de dirección optimizada (bfs_direccional.py)
+    # estadisticas: la pasa instrumentacion.medir (igual en encontrar_camino)
+    def es_conexo(self, estrategia=None, estadisticas=None):
+        if instrumentacion.activa is not None:  # Ver instrumentacion.py
+            return instrumentacion.medir(Grafo.es_conexo, self, estrategia)
         # Casos especiales
         if not self.grafo:  # Grafo vacío
             return True
         if len(self.grafo) == 1:  # Un solo vértice
             return True
+        if estrategia is not None:
+            return self.compactar().es_conexo(estrategia)
+        
+        # En grafos no dirigidos basta con el índice de componentes: O(1) tras construirlo
+        if not self.es_dirigido:
+            return self.num_componentes() == 1
             
         # Seleccionar un vértice inicial arbitrario
         vertice_inicial = next(iter(self.grafo))
@@ -64,7 +353,9 @@ class Grafo:
         
         while cola:
             vertice_actual = cola.popleft()
-            for vecino in self.obtener_vecinos(vertice_actual):
+            if estadisticas is not None:  # Ver instrumentacion.py
+                estadisticas.expandir_en_cola(vertice_actual, len(self.grafo[vertice_actual]), len(visitados))
+            for vecino in self.iterar_vecinos(vertice_actual):
                 if vecino not in visitados:
                     visitados.add(vecino)
                     cola.append(vecino)
@@ -72,7 +363,29 @@ class Grafo:
         # El grafo es conexo si todos los vértices fueron visitados
         return len(visitados) == len(self.grafo)
     
-    def encontrar_camino(self, inicio, fin):
+    # Conectividad en grafos dirigidos (ver conectividad_dirigida.py). En un grafo no dirigido
+    # equivalen a es_conexo. es_conexo en un grafo dirigido solo comprueba que todo sea
+    # alcanzable desde el primer vértice.
+    def es_fuertemente_conexo(self):
+        from conectividad_dirigida import es_fuertemente_conexo
+        return es_fuertemente_conexo(self)
+    
+    def es_debilmente_conexo(self):
+        return self.num_componentes() <= 1  # El índice Union-Find ya ignora la dirección
+    
+    # Componentes fuertemente conexas (listas de vértices), en orden topológico de la condensación
+    def componentes_fuertemente_conexas(self):
+        from conectividad_dirigida import componentes_fuertes
+        return componentes_fuertes(self)
+    
+    # Orden topológico de un grafo dirigido acíclico. Lanza ValueError si hay ciclos.
+    def orden_topologico(self):
+        from conectividad_dirigida import orden_topologico
+        return orden_topologico(self)
+    
+    def encontrar_camino(self, inicio, fin, estrategia=None, estadisticas=None):
+        if instrumentacion.activa is not None:
+            return instrumentacion.medir(Grafo.encontrar_camino, self, inicio, fin, estrategia)
         # Verificar que los vértices existen
         if inicio not in self.grafo or fin not in self.grafo:
             return []
@@ -80,38 +393,71 @@ class Grafo:
         # Si inicio y fin son el mismo vértice
         if inicio == fin:
             return [inicio]
-            
-        # Inicializar estructuras de datos
-        visitados = set()
-        cola = deque([inicio])
-        padres = {inicio: None}  # Diccionario para almacenar los padres de cada vértice
         
-        # Marcar el vértice inicial como visitado
-        visitados.add(inicio)
+        if estrategia is not None:
+            return self.compactar().encontrar_camino(inicio, fin, estrategia)
+        if self._cache_caminos is not None:
+            return self._cache_caminos.encontrar_camino(self, inicio, fin)
+            
+        # Búsqueda bidireccional: un BFS desde inicio (aristas de salida) y otro desde fin
+        # (aristas de entrada). En cada paso se expande un nivel completo de la frontera más pequeña.
+        padres_inicio = {inicio: None}
+        padres_fin = {fin: None}
+        frontera_inicio = [inicio]
+        frontera_fin = [fin]
+        grado_salida = grado_entrada = None
+        if estadisticas is not None:  # Ver instrumentacion.py
+            grado_salida = lambda vertice: len(self.grafo[vertice])
+            entrada = self._adyacencia_entrada() if self.es_dirigido else None
+            grado_entrada = (lambda vertice: len(entrada[vertice])) if self.es_dirigido else grado_salida
         
-        # BFS para encontrar el camino
-        while cola:
-            vertice_actual = cola.popleft()
+        while frontera_inicio and frontera_fin:
+            if len(frontera_inicio) <= len(frontera_fin):
+                if estadisticas is not None:
+                    estadisticas.nivel('adelante', len(frontera_inicio))
+                frontera_inicio, encuentro = self._expandir_nivel(
+                    frontera_inicio, padres_inicio, padres_fin, self.iterar_vecinos, estadisticas, grado_salida)
+            else:
+                if estadisticas is not None:
+                    estadisticas.nivel('atras', len(frontera_fin))
+                frontera_fin, encuentro = self._expandir_nivel(
+                    frontera_fin, padres_fin, padres_inicio, self.iterar_vecinos_entrada, estadisticas, grado_entrada)
             
-            # Si encontramos el vértice final
-            if vertice_actual == fin:
-                # Reconstruir el camino
+            # Las dos búsquedas se tocaron: unir ambos árboles de padres
+            if encuentro is not None:
                 camino = []
+                vertice_actual = encuentro
                 while vertice_actual is not None:
                     camino.append(vertice_actual)
-                    vertice_actual = padres[vertice_actual]
-                return camino[::-1]  # Invertir el camino para que vaya de inicio a fin
-            
-            # Explorar vecinos
-            for vecino in self.obtener_vecinos(vertice_actual):
-                if vecino not in visitados:
-                    visitados.add(vecino)
-                    padres[vecino] = vertice_actual
-                    cola.append(vecino)
+                    vertice_actual = padres_inicio[vertice_actual]
+                camino.reverse()  # Invertir para que vaya de inicio al punto de encuentro
+                vertice_actual = padres_fin[encuentro]
+                while vertice_actual is not None:
+                    camino.append(vertice_actual)
+                    vertice_actual = padres_fin[vertice_actual]
+                return camino
         
         # Si no se encontró camino
         return []
     
+    # Expande un nivel completo de una de las búsquedas de encontrar_camino.
+    # Devuelve la nueva frontera y el primer vértice ya visitado por la otra búsqueda (o None).
+    # Al terminar de expandir niveles completos, el primer encuentro da un camino mínimo.
+    # Con estadisticas (instrumentacion.py), grado(vertice) da las aristas de cada vértice expandido.
+    @staticmethod
+    def _expandir_nivel(frontera, padres, padres_otro, vecinos, estadisticas=None, grado=None):
+        siguiente = []
+        for vertice_actual in frontera:
+            if estadisticas is not None:
+                estadisticas.expandir(vertice_actual, grado(vertice_actual))
+            for vecino in vecinos(vertice_actual):
+                if vecino not in padres:
+                    padres[vecino] = vertice_actual
+                    if vecino in padres_otro:
+                        return siguiente, vecino
+                    siguiente.append(vecino)
+        return siguiente, None
+    
 if __name__ == "__main__":
     # Crear el grafo del Ejercicio 1
     grafo = Grafo(es_dirigido=False)
@@ -135,7 +481,33 @@ if __name__ == "__main__":
     print("Aristas:", grafo.aristas)
     print("\nPruebas de conectividad:")
     print(f"¿El grafo es conexo?: {grafo.es_conexo()}")
+    grafo.agregar_arista('F', 'G')
+    print(f"Tras agregar la arista F-G: conexo={grafo.es_conexo()}, componentes={grafo.num_componentes()}, "
+          f"tamaños={grafo.tamanos_componentes()}, ¿A y G conectados?={grafo.conectados('A', 'G')}")
     
     print("\nPruebas de caminos:")
     print(f"Camino de A a E: {grafo.encontrar_camino('A', 'E')}")
-    print(f"Camino de A a F (vértice inexistente): {grafo.encontrar_camino('A', 'F')}")
\ No newline at end of file
+    print(f"Camino de A a F (otra componente): {grafo.encontrar_camino('A', 'F')}")
+    print(f"Camino de A a H (vértice inexistente): {grafo.encontrar_camino('A', 'H')}")    
+    
+    print("\nEliminación:")
+    grafo.eliminar_arista('B', 'D')
+    grafo.eliminar_vertice('C')
+    print(f"Sin B-D ni C: aristas={grafo.aristas}, camino de A a E={grafo.encontrar_camino('A', 'E')}")
+    grafo.eliminar_arista('F', 'G')
+    print(f"Sin F-G: componentes={grafo.num_componentes()}, tamaños={grafo.tamanos_componentes()}")
+    print("\nÍndice de aristas:")
+    rutas = Grafo(aristas_paralelas='actualizar')
+    rutas.agregar_arista('Managua', 'Masaya', 30)
+    rutas.agregar_arista('Masaya', 'Managua', 28)  # Ya existe: se actualiza el peso
+    print(f"Aristas con política 'actualizar': {rutas.aristas}")
+    rutas.agregar_arista('Granada', 'Granada', 5)
+    rutas.agregar_arista('Granada', 'Granada', 2)  # Lazo: se actualizan sus dos entradas
+    print(f"Lazo actualizado: {rutas.grafo['Granada']}")
+    print(f"¿Existen Managua-Masaya, Masaya-Granada?: {rutas.existen_aristas([('Managua', 'Masaya'), ('Masaya', 'Granada')])}")
+    try:
+        unicas = Grafo(aristas_paralelas='rechazar')
+        unicas.agregar_arista('A', 'B')
+        unicas.agregar_arista('B', 'A')
+    except ValueError as error:
+        print(f"Política 'rechazar': {error}")
@@ -0,0 +1,336 @@
+"""
+╔════════════════════════════════════════════════════════════════════════════╗
+║                                                                            ║
+║  Grafo compacto (CSR - Compressed Sparse Row)                              ║
+║  Versión: 1.0.0                                                            ║
+║                                                                            ║
+║  Descripción:                                                              ║
+║  Representación congelada (solo lectura) de un Grafo. Las etiquetas de     ║
+║  los vértices se internan a identificadores enteros densos 0..n-1 y la     ║
+║  adyacencia se guarda en tres buffers contiguos de `array`:                ║
+║     • offsets[i]..offsets[i+1]  -> rango de aristas del vértice i          ║
+║     • destinos[k]               -> id del vértice destino de la arista k   ║
+║     • pesos[k]                  -> peso de la arista k                     ║
+║                                                                            ║
+║  Ofrece la misma interfaz de consulta que Grafo (vertices, aristas,        ║
+║  obtener_vecinos, existe_arista, es_conexo, encontrar_camino) pero usa     ║
+║  unos pocos bytes por arista en lugar de una tupla de Python por arista.   ║
+║                                                                            ║
+╚════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import sys
+from array import array
+from bisect import bisect_left
+
+import instrumentacion
+
+
+# Tipo de entero más pequeño capaz de guardar ids de 0..n-1
+def tipo_indice(n):
+    return 'i' if n < 2**31 else 'q'
+
+
+# array del tipo dado con `longitud` ceros, reservado de una sola vez
+def ceros(tipo, longitud):
+    return array(tipo, bytes(longitud * array(tipo).itemsize))
+
+
+# Clase GrafoCompacto
+class GrafoCompacto:
+    def __init__(self, etiquetas, offsets, destinos, pesos, es_dirigido=False, indices=None):
+        self.etiquetas = etiquetas  # id -> etiqueta
+        if indices is None:
+            indices = {etiqueta: i for i, etiqueta in enumerate(etiquetas)}
+        self.indices = indices  # etiqueta -> id
+        # Buffers de enteros/flotantes: array, o memoryview si el grafo se abrió con mmap
+        self.offsets = offsets  # n + 1 posiciones
+        self.destinos = destinos  # m posiciones (ids de destino)
+        self.pesos = pesos  # m posiciones
+        # Vista de solo lectura sobre destinos: sus rebanadas no copian los ids (ver vecinos_id)
+        self.vista_destinos = memoryview(destinos).toreadonly()
+        self.es_dirigido = es_dirigido
+        self._transpuesto = None
+        self._claves_aristas = None  # Índice ordenado de aristas (ver indexar_aristas)
+        self._peso_minimo = None  # Se calcula al primer uso (ver peso_minimo)
+
+    # Construir la versión compacta a partir de un Grafo basado en diccionario.
+    # El orden de los vecinos se conserva, por lo que BFS y DFS visitan en el mismo orden.
+    @classmethod
+    def desde_grafo(cls, grafo):
+        return cls.desde_adyacencia(grafo.grafo, grafo.es_dirigido)
+
+    # Igual, a partir de un diccionario vértice -> lista de (vecino, peso)
+    @classmethod
+    def desde_adyacencia(cls, adyacencia, es_dirigido=False):
+        etiquetas = list(adyacencia)
+        indices = {etiqueta: i for i, etiqueta in enumerate(etiquetas)}
+        n = len(etiquetas)
+
+        offsets = array('q', [0]) * (n + 1)
+        total = 0
+        for i, etiqueta in enumerate(etiquetas):
+            total += len(adyacencia[etiqueta])
+            offsets[i + 1] = total
+
+        destinos = ceros(tipo_indice(n), total)
+        pesos = ceros('d', total)
+        k = 0
+        for etiqueta in etiquetas:
+            for v, peso in adyacencia[etiqueta]:
+                destinos[k] = indices[v]
+                pesos[k] = peso
+                k += 1
+
+        return cls(etiquetas, offsets, destinos, pesos, es_dirigido, indices)
+
+    def __len__(self):
+        return len(self.etiquetas)
+
+    def __contains__(self, vertice):
+        return vertice in self.indices
+
+    @property
+    def vertices(self):
+        return list(self.etiquetas)
+
+    @property
+    def num_aristas(self):
+        return len(self.destinos)
+
+    # Lista de aristas (u, v, peso). En grafos no dirigidos cada arista aparece una sola vez.
+    @property
+    def aristas(self):
+        resultado = []
+        for i in range(len(self.etiquetas)):
+            for k in range(self.offsets[i], self.offsets[i + 1]):
+                j = self.destinos[k]
+                if self.es_dirigido or i <= j:
+                    resultado.append((self.etiquetas[i], self.etiquetas[j], self.pesos[k]))
+        return resultado
+
+    # Grafo con todas las aristas invertidas (adyacencia de entrada), comparte la tabla de etiquetas.
+    # En un grafo no dirigido la adyacencia ya es simétrica y se devuelve el mismo grafo.
+    def transpuesto(self):
+        if not self.es_dirigido:
+            return self
+        if self._transpuesto is None:
+            n = len(self.etiquetas)
+            offsets = array('q', [0]) * (n + 1)
+            for j in self.destinos:
+                offsets[j + 1] += 1
+            for i in range(n):
+                offsets[i + 1] += offsets[i]
+            siguiente = array('q', offsets[:n])  # Próxima posición libre de cada fila
+            destinos = ceros(tipo_indice(n), len(self.destinos))
+            pesos = ceros('d', len(self.pesos))
+            for i in range(n):
+                for k in range(self.offsets[i], self.offsets[i + 1]):
+                    j = self.destinos[k]
+                    destinos[siguiente[j]] = i
+                    pesos[siguiente[j]] = self.pesos[k]
+                    siguiente[j] += 1
+            transpuesto = GrafoCompacto(self.etiquetas, offsets, destinos, pesos, True, self.indices)
+            transpuesto._transpuesto = self
+            self._transpuesto = transpuesto
+        return self._transpuesto
+
+    # Id entero de una etiqueta. Lanza KeyError si el vértice no existe.
+    # Menor peso de arista (inf si no hay aristas). Los buffers no cambian: se calcula una vez.
+    def peso_minimo(self):
+        if self._peso_minimo is None:
+            self._peso_minimo = min(self.pesos, default=float('inf'))
+        return self._peso_minimo
+
+    def id_de(self, vertice):
+        return self.indices[vertice]
+
+    # Ids de los vecinos del vértice con id i: una vista de solo lectura sobre destinos, sin copia
+    def vecinos_id(self, i):
+        return self.vista_destinos[self.offsets[i]:self.offsets[i + 1]]
+
+    # Vecinos (como etiquetas) sin construir una lista; invertido=True los entrega del último al primero
+    def iterar_vecinos(self, vertice, invertido=False):
+        i = self.indices.get(vertice)
+        if i is None:
+            return iter(())
+        vista = self.vecinos_id(i)
+        return map(self.etiquetas.__getitem__, reversed(vista) if invertido else vista)
+
+    # Vértices con una arista hacia `vertice` (los vecinos en el transpuesto)
+    def iterar_vecinos_entrada(self, vertice):
+        return self.transpuesto().iterar_vecinos(vertice)
+
+    # Obtener los vecinos de un vertice (como etiquetas).
+    def obtener_vecinos(self, vertice):
+        i = self.indices.get(vertice)
+        if i is None:
+            return []  # Si el vertice no existe, devuelve una lista vacia
+        etiquetas = self.etiquetas
+        return [etiquetas[j] for j in self.vecinos_id(i)]
+
+    def existe_arista(self, u, v):
+        i = self.indices.get(u)
+        j = self.indices.get(v)
+        if i is None or j is None:
+            return False
+        if self._claves_aristas is not None:
+            return self._buscar_clave(i * len(self.etiquetas) + j)
+        return j in self.vecinos_id(i)
+
+    # Índice de aristas: claves i * n + j de todas las aristas, ordenadas, en un array('q').
+    # Con él existe_arista es una búsqueda binaria O(log m) en lugar de recorrer la fila.
+    # No cambia el orden de destinos, así BFS y DFS siguen visitando en el mismo orden.
+    def indexar_aristas(self):
+        if self._claves_aristas is None:
+            n = len(self.etiquetas)
+            offsets, destinos = self.offsets, self.destinos
+            claves = array('q')
+            for i in range(n):
+                base = i * n
+                fila = sorted(destinos[offsets[i]:offsets[i + 1]])  # Las filas quedan en orden de i
+                claves.extend(base + j for j in fila)
+            self._claves_aristas = claves
+        return self._claves_aristas
+
+    def _buscar_clave(self, clave):
+        claves = self._claves_aristas
+        posicion = bisect_left(claves, clave)
+        return posicion < len(claves) and claves[posicion] == clave
+
+    # Consulta de muchas aristas a la vez: lista de booleanos, uno por par (u, v)
+    def existen_aristas(self, pares):
+        self.indexar_aristas()
+        indices, n = self.indices, len(self.etiquetas)
+        resultado = []
+        for u, v in pares:
+            i, j = indices.get(u), indices.get(v)
+            resultado.append(i is not None and j is not None and self._buscar_clave(i * n + j))
+        return resultado
+
+    # BFS sobre ids enteros. Devuelve un bytearray con 1 en los vértices alcanzados.
+    # Con estadisticas (instrumentacion.py) anota cada vértice expandido.
+    def _alcanzables(self, origen, estadisticas=None):
+        offsets, destinos = self.offsets, self.vista_destinos
+        visitados = bytearray(len(self.etiquetas))
+        visitados[origen] = 1
+        cola = [origen]
+        for actual in cola:  # La lista crece mientras se recorre: funciona como cola FIFO
+            if estadisticas is not None:
+                estadisticas.expandir_en_cola(actual, offsets[actual + 1] - offsets[actual], len(cola))
+            for vecino in destinos[offsets[actual]:offsets[actual + 1]]:
+                if not visitados[vecino]:
+                    visitados[vecino] = 1
+                    cola.append(vecino)
+        return visitados
+
+    # estrategia: None (BFS clásico), 'top-down', 'bottom-up' o 'hibrida' (ver bfs_direccional.py)
+    # estadisticas: la pasa instrumentacion.medir (igual en encontrar_camino)
+    def es_conexo(self, estrategia=None, estadisticas=None):
+        if instrumentacion.activa is not None:  # Ver instrumentacion.py
+            return instrumentacion.medir(GrafoCompacto.es_conexo, self, estrategia)
+        # Casos especiales
+        if len(self.etiquetas) <= 1:
+            return True
+        if estrategia is not None:
+            from bfs_direccional import bfs_direccional
+            padres, _ = bfs_direccional(self, 0, estrategia)
+            return padres.count(-1) == 0
+        visitados = self._alcanzables(0, estadisticas)
+        return visitados.count(1) == len(self.etiquetas)
+
+    def encontrar_camino(self, inicio, fin, estrategia=None, estadisticas=None):
+        if instrumentacion.activa is not None:
+            return instrumentacion.medir(GrafoCompacto.encontrar_camino, self, inicio, fin, estrategia)
+        # Verificar que los vértices existen
+        if inicio not in self.indices or fin not in self.indices:
+            return []
+        if inicio == fin:
+            return [inicio]
+
+        origen, destino = self.indices[inicio], self.indices[fin]
+        if estrategia is not None:
+            from bfs_direccional import bfs_direccional
+            padres, _ = bfs_direccional(self, origen, estrategia, destino=destino)
+            if padres[destino] == -1:
+                return []
+            return self._reconstruir_camino(padres, origen, destino)
+
+        # Búsqueda bidireccional: hacia adelante por destinos y hacia atrás por el transpuesto.
+        # Los padres se guardan en diccionarios porque solo se toca una parte pequeña del grafo.
+        entrada = self.transpuesto()
+        padres_inicio = {origen: origen}
+        padres_fin = {destino: destino}
+        frontera_inicio = [origen]
+        frontera_fin = [destino]
+        while frontera_inicio and frontera_fin:
+            if len(frontera_inicio) <= len(frontera_fin):
+                if estadisticas is not None:  # Ver instrumentacion.py
+                    estadisticas.nivel('adelante', len(frontera_inicio))
+                frontera_inicio, encuentro = self._expandir_nivel(
+                    self.offsets, self.vista_destinos, frontera_inicio, padres_inicio, padres_fin, estadisticas)
+            else:
+                if estadisticas is not None:
+                    estadisticas.nivel('atras', len(frontera_fin))
+                frontera_fin, encuentro = self._expandir_nivel(
+                    entrada.offsets, entrada.vista_destinos, frontera_fin, padres_fin, padres_inicio, estadisticas)
+            if encuentro is not None:
+                camino = self._reconstruir_camino(padres_inicio, origen, encuentro)
+                while encuentro != destino:
+                    encuentro = padres_fin[encuentro]
+                    camino.append(self.etiquetas[encuentro])
+                return camino
+
+        # Si no se encontró camino
+        return []
+
+    # Expande un nivel completo de la búsqueda bidireccional (ver Grafo._expandir_nivel)
+    @staticmethod
+    def _expandir_nivel(offsets, destinos, frontera, padres, padres_otro, estadisticas=None):
+        siguiente = []
+        for actual in frontera:
+            if estadisticas is not None:
+                estadisticas.expandir(actual, offsets[actual + 1] - offsets[actual])
+            for vecino in destinos[offsets[actual]:offsets[actual + 1]]:
+                if vecino not in padres:
+                    padres[vecino] = actual
+                    if vecino in padres_otro:
+                        return siguiente, vecino
+                    siguiente.append(vecino)
+        return siguiente, None
+
+    def _reconstruir_camino(self, padres, origen, destino):
+        camino = [destino]
+        while camino[-1] != origen:
+            camino.append(padres[camino[-1]])
+        camino.reverse()
+        return [self.etiquetas[i] for i in camino]
+
+    # Memoria aproximada (bytes) de la representación: buffers + tabla de etiquetas.
+    def memoria_bytes(self):
+        total = sum(buffer.itemsize * len(buffer) for buffer in (self.offsets, self.destinos, self.pesos))
+        total += sys.getsizeof(self.etiquetas) + sys.getsizeof(self.indices)
+        if self._claves_aristas is not None:
+            total += self._claves_aristas.itemsize * len(self._claves_aristas)
+        return total
+
+
+if __name__ == "__main__":
+    from grafo import Grafo
+
+    grafo = Grafo()
+    for origen, destino in [('A', 'B'), ('A', 'C'), ('B', 'D'), ('B', 'E'), ('C', 'D'), ('D', 'E')]:
+        grafo.agregar_arista(origen, destino)
+    grafo.agregar_vertice('F')
+
+    compacto = GrafoCompacto.desde_grafo(grafo)
+    print("Vértices:", compacto.vertices)
+    print("Aristas:", compacto.aristas)
+    print("Vecinos de B:", compacto.obtener_vecinos('B'))
+    print("¿Existe arista A-D?:", compacto.existe_arista('A', 'D'))
+    compacto.indexar_aristas()
+    print("¿Existen B-D, D-B, A-F? (con índice):", compacto.existen_aristas([('B', 'D'), ('D', 'B'), ('A', 'F')]))
+    print("¿El grafo es conexo?:", compacto.es_conexo())
+    print("Camino de A a E:", compacto.encontrar_camino('A', 'E'))
+    print("Camino de A a F:", compacto.encontrar_camino('A', 'F'))
+    print("Memoria (bytes):", compacto.memoria_bytes())
@@ -0,0 +1,512 @@
+"""
+╔════════════════════════════════════════════════════════════════════════════╗
+║                                                                            ║
+║  Grafo con etiquetas internadas y almacenamiento en arrays (__slots__)     ║
+║  Versión: 1.0.0                                                            ║
+║                                                                            ║
+║  Descripción:                                                              ║
+║  Misma interfaz que Grafo (agregar_vertice, agregar_arista,                ║
+║  obtener_vecinos, existe_arista, es_conexo, encontrar_camino), que sigue   ║
+║  recibiendo y devolviendo etiquetas, pero por dentro:                      ║
+║     • Cada etiqueta se interna al insertarla: recibe un id entero denso    ║
+║       0..n-1 (etiquetas[id] y indices[etiqueta]).                          ║
+║     • Las aristas viven en unos pocos arrays globales ("estrella           ║
+║       directa"): la arista k va a destinos[k] con peso pesos[k] y la       ║
+║       siguiente arista del mismo vértice es siguientes[k] (-1 al final).   ║
+║       primera[i] y ultima[i] son la primera y la última arista de i.       ║
+║       No hay ningún objeto de Python por vértice ni por arista.            ║
+║     • Los recorridos marcan visitados en un bytearray indexado por id,     ║
+║       sin calcular el hash de ninguna etiqueta.                            ║
+║  A diferencia de GrafoCompacto, admite agregar y eliminar vértices y       ║
+║  aristas. Las aristas de cada vértice se recorren en el orden en que se    ║
+║  agregaron, así BFS y DFS visitan en el mismo orden que con Grafo.         ║
+║  Eliminar deja lápidas: la arista se desenlaza de su cadena y queda con    ║
+║  destinos[k] = -1; el vértice conserva su id con la etiqueta _ELIMINADO.   ║
+║  Cuando las lápidas superan la mitad de los arrays, purgar() los reescribe ║
+║  sin ellas y renumera los ids: eliminar cuesta O(grado) amortizado.        ║
+║                                                                            ║
+╚════════════════════════════════════════════════════════════════════════════╝
+"""
+
+from array import array
+
+import instrumentacion
+from grafo_compacto import GrafoCompacto, tipo_indice
+
+_ELIMINADO = object()  # Lápida en etiquetas para el id de un vértice eliminado
+
+
+# Clase GrafoInternado
+class GrafoInternado:
+    __slots__ = ('es_dirigido', 'etiquetas', 'indices', 'primera', 'ultima', 'destinos', 'pesos',
+                 'siguientes', '_entrada', '_compacto', '_aristas_eliminadas', '_vertices_eliminados',
+                 '_purga_automatica')
+
+    def __init__(self, es_dirigido=False):
+        self.es_dirigido = es_dirigido
+        self.etiquetas = []  # id -> etiqueta
+        self.indices = {}  # etiqueta -> id
+        self.primera = array('i')  # id -> primera arista del vértice (-1 si no tiene)
+        self.ultima = array('i')  # id -> última arista del vértice, para agregar al final en O(1)
+        self.destinos = array('i')  # arista -> id del destino
+        self.pesos = array('d')  # arista -> peso
+        self.siguientes = array('i')  # arista -> siguiente arista del mismo vértice (-1 al final)
+        self._entrada = None  # Adyacencia de entrada por id; se crea al primer uso y luego se mantiene al día
+        self._compacto = None  # Copia CSR en caché, se invalida al modificar el grafo
+        self._aristas_eliminadas = 0  # Lápidas en destinos
+        self._vertices_eliminados = 0  # Lápidas en etiquetas
+        self._purga_automatica = True  # aplicar_cambios la suspende hasta terminar el lote
+
+    def __contains__(self, vertice):
+        return vertice in self.indices
+
+    def __len__(self):
+        return len(self.indices)
+
+    @property
+    def vertices(self):
+        return list(self.indices)  # En orden de id, sin los eliminados
+
+    # Lista de aristas (u, v, peso). En grafos no dirigidos cada arista aparece una sola vez.
+    @property
+    def aristas(self):
+        resultado = []
+        etiquetas, destinos, pesos, siguientes = self.etiquetas, self.destinos, self.pesos, self.siguientes
+        for i in range(len(etiquetas)):
+            k = self.primera[i]
+            while k >= 0:
+                j = destinos[k]
+                if self.es_dirigido or i <= j:
+                    resultado.append((etiquetas[i], etiquetas[j], pesos[k]))
+                k = siguientes[k]
+        return resultado
+
+    # Id de la etiqueta, creando el vértice si no existe
+    def _internar(self, vertice):
+        i = self.indices.get(vertice)
+        if i is None:
+            i = self.indices[vertice] = len(self.etiquetas)
+            self.etiquetas.append(vertice)
+            self.primera.append(-1)
+            self.ultima.append(-1)
+            if self._entrada is not None:
+                self._entrada.append([])
+            self._invalidar_cache()
+        return i
+
+    # Enlaza una arista nueva i -> j al final de la cadena de i
+    def _enlazar(self, i, j, peso):
+        k = len(self.destinos)
+        self.destinos.append(j)
+        self.pesos.append(peso)
+        self.siguientes.append(-1)
+        if self.ultima[i] < 0:
+            self.primera[i] = k
+        else:
+            self.siguientes[self.ultima[i]] = k
+        self.ultima[i] = k
+        if self._entrada is not None:
+            self._entrada[j].append(i)
+
+    # Desenlaza la arista k, que sigue a la arista `anterior` en la cadena de i (-1 si es la
+    # primera), y deja una lápida en su lugar
+    def _desenlazar(self, i, k, anterior):
+        siguiente = self.siguientes[k]
+        if anterior < 0:
+            self.primera[i] = siguiente
+        else:
+            self.siguientes[anterior] = siguiente
+        if self.ultima[i] == k:
+            self.ultima[i] = anterior
+        if self._entrada is not None:
+            self._entrada[self.destinos[k]].remove(i)
+        self.destinos[k] = -1
+        self._aristas_eliminadas += 1
+
+    # Quita de la cadena de i la primera arista hacia j (con ese peso, si se indica).
+    # Devuelve el peso de la arista quitada, o None si no había ninguna.
+    def _quitar(self, i, j, peso=None):
+        destinos, pesos, siguientes = self.destinos, self.pesos, self.siguientes
+        anterior, k = -1, self.primera[i]
+        while k >= 0:
+            if destinos[k] == j and (peso is None or pesos[k] == peso):
+                quitado = pesos[k]
+                self._desenlazar(i, k, anterior)
+                return quitado
+            anterior, k = k, siguientes[k]
+        return None
+
+    # Quita de la cadena de i todas las aristas hacia j
+    def _quitar_todas(self, i, j):
+        destinos, siguientes = self.destinos, self.siguientes
+        anterior, k = -1, self.primera[i]
+        while k >= 0:
+            siguiente = siguientes[k]
+            if destinos[k] == j:
+                self._desenlazar(i, k, anterior)
+            else:
+                anterior = k
+            k = siguiente
+
+    def agregar_vertice(self, vertice):
+        self._internar(vertice)
+
+    def agregar_arista(self, u, v, peso=1):
+        i, j = self._internar(u), self._internar(v)
+        self._enlazar(i, j, peso)
+        if not self.es_dirigido:
+            self._enlazar(j, i, peso)
+        self._invalidar_cache()
+
+    # Eliminar una arista u -> v (en grafos no dirigidos, también v -> u). Si hay aristas
+    # paralelas, se elimina solo la primera. Lanza ValueError si la arista no existe.
+    def eliminar_arista(self, u, v):
+        i, j = self.indices.get(u), self.indices.get(v)
+        peso = None if i is None or j is None else self._quitar(i, j)
+        if peso is None:
+            raise ValueError(f"La arista {u} -> {v} no existe")
+        if not self.es_dirigido:
+            self._quitar(j, i, peso)
+        self._invalidar_cache()
+        self._purgar_si_conviene()
+
+    # Eliminar un vértice junto con todas sus aristas. Su id queda libre hasta la próxima purga.
+    # Lanza ValueError si el vértice no existe.
+    def eliminar_vertice(self, vertice):
+        i = self.indices.get(vertice)
+        if i is None:
+            raise ValueError(f"El vértice {vertice} no existe en el grafo")
+        # Vértices con aristas hacia i: en un grafo no dirigido son sus propios vecinos
+        origenes = self._adyacencia_entrada()[i] if self.es_dirigido else self.vecinos_id(i)
+        for j in set(origenes) - {i}:
+            self._quitar_todas(j, i)
+        k = self.primera[i]
+        while k >= 0:
+            siguiente = self.siguientes[k]
+            self._desenlazar(i, k, -1)  # Siempre es la primera de lo que queda de la cadena
+            k = siguiente
+        del self.indices[vertice]
+        self.etiquetas[i] = _ELIMINADO
+        self._vertices_eliminados += 1
+        self._invalidar_cache()
+        self._purgar_si_conviene()
+
+    # Aplica un registro de cambios (ver cambios.py). La purga de lápidas se hace una sola vez,
+    # al final del lote. Devuelve cuántos cambios se aplicaron.
+    def aplicar_cambios(self, cambios):
+        from cambios import aplicar_cambios
+        self._purga_automatica = False
+        try:
+            return aplicar_cambios(self, cambios)
+        finally:
+            self._purga_automatica = True
+            self._purgar_si_conviene()
+
+    def _purgar_si_conviene(self):
+        if self._purga_automatica and (2 * self._aristas_eliminadas > len(self.destinos)
+                                       or 2 * self._vertices_eliminados > len(self.etiquetas)):
+            self.purgar()
+
+    # Reescribe los arrays sin lápidas: los vértices vivos reciben ids 0..n-1 (en el mismo orden
+    # relativo) y las aristas de cada vértice quedan contiguas. Los ids obtenidos antes con
+    # id_de dejan de ser válidos.
+    def purgar(self):
+        if not self._aristas_eliminadas and not self._vertices_eliminados:
+            return
+        nuevo_id = array('i', [-1]) * len(self.etiquetas)
+        etiquetas = []
+        for i, etiqueta in enumerate(self.etiquetas):
+            if etiqueta is not _ELIMINADO:
+                nuevo_id[i] = len(etiquetas)
+                etiquetas.append(etiqueta)
+        primera, ultima = array('i', [-1]) * len(etiquetas), array('i', [-1]) * len(etiquetas)
+        destinos, pesos, siguientes = array('i'), array('d'), array('i')
+        for i, etiqueta in enumerate(self.etiquetas):
+            if etiqueta is _ELIMINADO:
+                continue
+            nuevo = nuevo_id[i]
+            k = self.primera[i]
+            while k >= 0:
+                if ultima[nuevo] < 0:
+                    primera[nuevo] = len(destinos)
+                else:
+                    siguientes[ultima[nuevo]] = len(destinos)
+                ultima[nuevo] = len(destinos)
+                destinos.append(nuevo_id[self.destinos[k]])
+                pesos.append(self.pesos[k])
+                siguientes.append(-1)
+                k = self.siguientes[k]
+        self.etiquetas, self.primera, self.ultima = etiquetas, primera, ultima
+        self.destinos, self.pesos, self.siguientes = destinos, pesos, siguientes
+        self.indices = {etiqueta: i for i, etiqueta in enumerate(etiquetas)}
+        self._aristas_eliminadas = self._vertices_eliminados = 0
+        self._entrada = None  # Estaba indexada con los ids viejos
+        self._invalidar_cache()
+
+    # Descarta la copia compacta. (La adyacencia de entrada no: cada cambio la actualiza en su sitio.)
+    def _invalidar_cache(self):
+        self._compacto = None
+
+    # Id entero de una etiqueta. Lanza KeyError si el vértice no existe.
+    def id_de(self, vertice):
+        return self.indices[vertice]
+
+    # Ids de los vecinos del vértice con id i, en orden de inserción
+    def vecinos_id(self, i):
+        destinos, siguientes = self.destinos, self.siguientes
+        fila = []
+        k = self.primera[i]
+        while k >= 0:
+            fila.append(destinos[k])
+            k = siguientes[k]
+        return fila
+
+    # Ids de los vecinos del vértice con id i, recorriendo la cadena sin construir una lista
+    def iterar_vecinos_id(self, i):
+        destinos, siguientes = self.destinos, self.siguientes
+        k = self.primera[i]
+        while k >= 0:
+            yield destinos[k]
+            k = siguientes[k]
+
+    # Número de aristas de salida del id i (recorre su cadena)
+    def grado_id(self, i):
+        grado = 0
+        siguientes = self.siguientes
+        k = self.primera[i]
+        while k >= 0:
+            grado += 1
+            k = siguientes[k]
+        return grado
+
+    # Vecinos (como etiquetas) sin construir una lista. La cadena solo se recorre hacia
+    # adelante, así que con invertido=True sí se copian los ids de la fila.
+    def iterar_vecinos(self, vertice, invertido=False):
+        i = self.indices.get(vertice)
+        if i is None:
+            return iter(())
+        ids = reversed(self.vecinos_id(i)) if invertido else self.iterar_vecinos_id(i)
+        return map(self.etiquetas.__getitem__, ids)
+
+    # Vértices con una arista hacia `vertice`. En un grafo no dirigido coinciden con los vecinos.
+    def iterar_vecinos_entrada(self, vertice):
+        if not self.es_dirigido:
+            return self.iterar_vecinos(vertice)
+        i = self.indices.get(vertice)
+        if i is None:
+            return iter(())
+        return map(self.etiquetas.__getitem__, self._adyacencia_entrada()[i])
+
+    # Obtener los vecinos de un vertice (como etiquetas).
+    def obtener_vecinos(self, vertice):
+        i = self.indices.get(vertice)
+        if i is None:
+            return []  # Si el vertice no existe, devuelve una lista vacia
+        etiquetas = self.etiquetas
+        return [etiquetas[j] for j in self.vecinos_id(i)]
+
+    def existe_arista(self, u, v):
+        i = self.indices.get(u)
+        j = self.indices.get(v)
+        if i is None or j is None:
+            return False
+        destinos, siguientes = self.destinos, self.siguientes
+        k = self.primera[i]
+        while k >= 0:
+            if destinos[k] == j:
+                return True
+            k = siguientes[k]
+        return False
+
+    # Adyacencia por id (lista de listas) para encontrar_camino; la de entrada solo en grafos dirigidos
+    def _adyacencia_entrada(self):
+        if self._entrada is None:
+            entrada = [[] for _ in self.etiquetas]
+            for i in range(len(self.etiquetas)):
+                for j in self.vecinos_id(i):
+                    entrada[j].append(i)
+            self._entrada = entrada
+        return self._entrada
+
+    # Versión congelada (CSR), con los vecinos de cada vértice en el mismo orden.
+    # Si hay vértices eliminados, antes se purga (la copia compacta no admite huecos en los ids).
+    def compactar(self):
+        if self._compacto is None:
+            if self._vertices_eliminados:
+                self.purgar()
+            n = len(self.etiquetas)
+            offsets = array('q', [0]) * (n + 1)
+            destinos = array(tipo_indice(n))
+            pesos = array('d')
+            for i in range(n):
+                k = self.primera[i]
+                while k >= 0:
+                    destinos.append(self.destinos[k])
+                    pesos.append(self.pesos[k])
+                    k = self.siguientes[k]
+                offsets[i + 1] = len(destinos)
+            self._compacto = GrafoCompacto(list(self.etiquetas), offsets, destinos, pesos,
+                                           self.es_dirigido, dict(self.indices))
+        return self._compacto
+
+    # BFS sobre ids desde origen. Devuelve la lista de ids en orden de visita.
+    # Con estadisticas (instrumentacion.py) anota cada vértice expandido.
+    def _recorrer_bfs(self, origen, estadisticas=None):
+        primera, destinos, siguientes = self.primera, self.destinos, self.siguientes
+        visitados = bytearray(len(self.etiquetas))
+        visitados[origen] = 1
+        cola = [origen]
+        for actual in cola:  # La lista crece mientras se recorre: funciona como cola FIFO
+            if estadisticas is not None:
+                estadisticas.expandir_en_cola(actual, self.grado_id(actual), len(cola))
+            k = primera[actual]
+            while k >= 0:
+                vecino = destinos[k]
+                if not visitados[vecino]:
+                    visitados[vecino] = 1
+                    cola.append(vecino)
+                k = siguientes[k]
+        return cola
+
+    # estadisticas: la pasa instrumentacion.medir (igual en encontrar_camino)
+    def es_conexo(self, estadisticas=None):
+        if instrumentacion.activa is not None:  # Ver instrumentacion.py
+            return instrumentacion.medir(GrafoInternado.es_conexo, self)
+        # Casos especiales
+        if len(self.indices) <= 1:
+            return True
+        return len(self._recorrer_bfs(next(iter(self.indices.values())), estadisticas)) == len(self.indices)
+
+    def encontrar_camino(self, inicio, fin, estadisticas=None):
+        if instrumentacion.activa is not None:
+            return instrumentacion.medir(GrafoInternado.encontrar_camino, self, inicio, fin)
+        # Verificar que los vértices existen
+        if inicio not in self.indices or fin not in self.indices:
+            return []
+        if inicio == fin:
+            return [inicio]
+
+        # Búsqueda bidireccional sobre ids (ver Grafo.encontrar_camino)
+        origen, destino = self.indices[inicio], self.indices[fin]
+        salida = self.iterar_vecinos_id
+        entrada = self._adyacencia_entrada().__getitem__ if self.es_dirigido else salida
+        grado_salida = grado_entrada = None
+        if estadisticas is not None:  # Ver instrumentacion.py
+            grado_salida = self.grado_id
+            grado_entrada = (lambda i: len(entrada(i))) if self.es_dirigido else grado_salida
+        padres_inicio = {origen: None}
+        padres_fin = {destino: None}
+        frontera_inicio = [origen]
+        frontera_fin = [destino]
+        while frontera_inicio and frontera_fin:
+            if len(frontera_inicio) <= len(frontera_fin):
+                if estadisticas is not None:
+                    estadisticas.nivel('adelante', len(frontera_inicio))
+                frontera_inicio, encuentro = self._expandir_nivel(
+                    frontera_inicio, padres_inicio, padres_fin, salida, estadisticas, grado_salida)
+            else:
+                if estadisticas is not None:
+                    estadisticas.nivel('atras', len(frontera_fin))
+                frontera_fin, encuentro = self._expandir_nivel(
+                    frontera_fin, padres_fin, padres_inicio, entrada, estadisticas, grado_entrada)
+            if encuentro is not None:
+                camino = []
+                actual = encuentro
+                while actual is not None:
+                    camino.append(actual)
+                    actual = padres_inicio[actual]
+                camino.reverse()
+                actual = padres_fin[encuentro]
+                while actual is not None:
+                    camino.append(actual)
+                    actual = padres_fin[actual]
+                etiquetas = self.etiquetas
+                return [etiquetas[i] for i in camino]
+
+        # Si no se encontró camino
+        return []
+
+    # Expande un nivel completo de la búsqueda bidireccional (ver Grafo._expandir_nivel)
+    @staticmethod
+    def _expandir_nivel(frontera, padres, padres_otro, vecinos, estadisticas=None, grado=None):
+        siguiente = []
+        for actual in frontera:
+            if estadisticas is not None:
+                estadisticas.expandir(actual, grado(actual))
+            for vecino in vecinos(actual):
+                if vecino not in padres:
+                    padres[vecino] = actual
+                    if vecino in padres_otro:
+                        return siguiente, vecino
+                    siguiente.append(vecino)
+        return siguiente, None
+
+
+# Casos de prueba y medición de memoria/tiempo frente a Grafo
+if __name__ == "__main__":
+    import random
+    import sys
+    import time
+    import tracemalloc
+
+    from grafo import Grafo
+    from breadth_first_search import bfs, dfs
+    # La clase que reconoce breadth_first_search es la del módulo importado, no la de __main__
+    from grafo_internado import GrafoInternado
+
+    grafo = GrafoInternado()
+    for u, v, km in [('Managua', 'Masaya', 28), ('Managua', 'León', 93), ('Masaya', 'Granada', 17),
+                     ('Granada', 'Rivas', 69), ('Managua', 'Granada', 45)]:
+        grafo.agregar_arista(u, v, km)
+    grafo.agregar_vertice('Bluefields')
+    print("Vértices:", grafo.vertices)
+    print("Aristas:", grafo.aristas)
+    print("Vecinos de Managua:", grafo.obtener_vecinos('Managua'))
+    print("¿Existe arista Masaya-Granada?:", grafo.existe_arista('Masaya', 'Granada'))
+    print("¿El grafo es conexo?:", grafo.es_conexo())
+    print("Camino de León a Rivas:", grafo.encontrar_camino('León', 'Rivas'))
+    print("BFS desde Managua:", bfs(grafo, 'Managua'))
+    print("DFS desde Managua:", dfs(grafo, 'Managua'))
+
+    # Medición: el mismo grafo aleatorio con etiquetas de texto en ambas representaciones
+    num_vertices = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    num_aristas = int(sys.argv[2]) if len(sys.argv) > 2 else 500_000
+    azar = random.Random(42)
+    etiquetas = [f"ciudad-{i}" for i in range(num_vertices)]
+    pares = [(azar.choice(etiquetas), azar.choice(etiquetas), azar.randint(1, 100)) for _ in range(num_aristas)]
+
+    def construir(clase):
+        tracemalloc.start()
+        inicio = time.perf_counter()
+        nuevo = clase()
+        for u, v, peso in pares:
+            nuevo.agregar_arista(u, v, peso)
+        segundos = time.perf_counter() - inicio
+        memoria, _ = tracemalloc.get_traced_memory()  # Memoria que sigue viva: la del grafo
+        tracemalloc.stop()
+        return nuevo, segundos, memoria
+
+    # Mejor de tres ejecuciones, para que la primera (cachés frías) no domine
+    def cronometrar(funcion):
+        tiempos = []
+        for _ in range(3):
+            inicio = time.perf_counter()
+            funcion()
+            tiempos.append(time.perf_counter() - inicio)
+        return min(tiempos)
+
+    diccionario, t_dict, mem_dict = construir(Grafo)
+    internado, t_int, mem_int = construir(GrafoInternado)
+    origen, destino = pares[0][0], pares[-1][1]
+
+    print(f"\nGrafo aleatorio: {num_vertices} vértices, {num_aristas} aristas (etiquetas de texto)\n")
+    print(f"{'':22}{'Grafo':>12}{'Internado':>12}{'relación':>10}")
+    print(f"{'memoria (MB)':22}{mem_dict / 2**20:12.1f}{mem_int / 2**20:12.1f}{mem_dict / mem_int:9.1f}x")
+    print(f"{'construcción (s)':22}{t_dict:12.3f}{t_int:12.3f}{t_dict / t_int:9.1f}x")
+    for nombre, funcion in [
+        ("bfs (s)", lambda g: bfs(g, origen)),
+        ("dfs (s)", lambda g: dfs(g, origen)),
+        ("encontrar_camino (s)", lambda g: g.encontrar_camino(origen, destino)),
+    ]:
+        a, b = cronometrar(lambda: funcion(diccionario)), cronometrar(lambda: funcion(internado))
+        print(f"{nombre:22}{a:12.3f}{b:12.3f}{a / max(b, 1e-9):9.1f}x")
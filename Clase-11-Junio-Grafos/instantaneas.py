@@ -0,0 +1,287 @@
+"""
+╔════════════════════════════════════════════════════════════════════════════╗
+║                                                                            ║
+║  Instantáneas inmutables y versionadas (read-copy-update)                  ║
+║  Versión: 1.0.0                                                            ║
+║                                                                            ║
+║  Descripción:                                                              ║
+║  GrafoConcurrente permite que un hilo agregue aristas mientras otros       ║
+║  recorren el grafo, sin candados para los lectores:                        ║
+║     • Una Instantanea nunca se modifica. Es una base GrafoCompacto (CSR)   ║
+║       más un delta pequeño: {vértice: tupla de (vecino, peso) nuevos}.     ║
+║     • El escritor copia el delta, le aplica sus cambios y publica una      ║
+║       Instantanea nueva (versión + 1) con una sola asignación, que es      ║
+║       atómica. Una arista no dirigida aparece en ambas direcciones en la   ║
+║       misma versión, nunca a medias.                                       ║
+║     • Cada lector toma la instantánea actual UNA vez y la recorre entera;  ║
+║       los cambios posteriores no la afectan. Las versiones viejas se       ║
+║       liberan solas cuando ningún lector las usa (conteo de referencias).  ║
+║     • Cuando el delta supera limite_delta vértices, el escritor lo funde   ║
+║       con la base en un CSR nuevo, así copiar el delta sigue siendo        ║
+║       barato y los recorridos leen casi todo de arrays.                    ║
+║  Los escritores se ordenan con un threading.Lock. Para ingerir muchas      ║
+║  aristas, lote() o aplicar_cambios() publican una sola versión al final.   ║
+║  Solo admite agregar: las eliminaciones no pasan por el delta.             ║
+║                                                                            ║
+╚════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import threading
+from array import array
+from contextlib import contextmanager
+from operator import itemgetter
+
+from grafo import Grafo
+from grafo_compacto import GrafoCompacto, tipo_indice
+
+LIMITE_DELTA = 4096  # Vértices con aristas nuevas antes de fundir el delta con la base
+
+_VACIO = GrafoCompacto([], array('q', [0]), array('i'), array('d'))
+
+
+# Clase Instantanea: vista inmutable del grafo en una versión
+class Instantanea:
+    __slots__ = ('base', 'delta', 'delta_entrada', 'nuevos', 'version', 'num_aristas', 'es_dirigido')
+
+    def __init__(self, base, delta, delta_entrada, nuevos, version, num_aristas, es_dirigido):
+        self.base = base  # GrafoCompacto
+        self.delta = delta  # vértice -> tupla de (vecino, peso) agregados después de la base
+        self.delta_entrada = delta_entrada  # Solo grafos dirigidos: vértice -> tupla de orígenes nuevos
+        self.nuevos = nuevos  # {vértice: None} con los que no están en la base, en orden de llegada
+        self.version = version
+        self.num_aristas = num_aristas  # Entradas de adyacencia, como GrafoCompacto.num_aristas
+        self.es_dirigido = es_dirigido
+
+    def __contains__(self, vertice):
+        return vertice in self.base.indices or vertice in self.nuevos
+
+    def __len__(self):
+        return len(self.base) + len(self.nuevos)
+
+    @property
+    def vertices(self):
+        return self.base.etiquetas + list(self.nuevos)
+
+    # Vecinos sin construir una lista: primero los de la base, luego los del delta
+    def iterar_vecinos(self, vertice, invertido=False):
+        base = self.base
+        i = base.indices.get(vertice)
+        extra = self.delta.get(vertice, ())
+        if i is None:
+            vecinos = list(map(itemgetter(0), extra))
+        elif not extra:
+            return base.iterar_vecinos(vertice, invertido)
+        else:
+            vecinos = base.obtener_vecinos(vertice) + [v for v, _ in extra]
+        return reversed(vecinos) if invertido else iter(vecinos)
+
+    def obtener_vecinos(self, vertice):
+        return list(self.iterar_vecinos(vertice))
+
+    # Vértices con una arista hacia `vertice`. En un grafo no dirigido coinciden con los vecinos.
+    def iterar_vecinos_entrada(self, vertice):
+        if not self.es_dirigido:
+            return self.iterar_vecinos(vertice)
+        anteriores = self.base.transpuesto().iterar_vecinos(vertice) if vertice in self.base.indices else ()
+        extra = self.delta_entrada.get(vertice, ())
+        return iter([*anteriores, *extra]) if extra else iter(anteriores)
+
+    def existe_arista(self, u, v):
+        return self.base.existe_arista(u, v) or any(w == v for w, _ in self.delta.get(u, ()))
+
+    # Búsqueda bidireccional, igual que Grafo.encontrar_camino pero sobre esta versión
+    def encontrar_camino(self, inicio, fin):
+        if inicio not in self or fin not in self:
+            return []
+        if inicio == fin:
+            return [inicio]
+        padres_inicio = {inicio: None}
+        padres_fin = {fin: None}
+        frontera_inicio = [inicio]
+        frontera_fin = [fin]
+        while frontera_inicio and frontera_fin:
+            if len(frontera_inicio) <= len(frontera_fin):
+                frontera_inicio, encuentro = Grafo._expandir_nivel(
+                    frontera_inicio, padres_inicio, padres_fin, self.iterar_vecinos)
+            else:
+                frontera_fin, encuentro = Grafo._expandir_nivel(
+                    frontera_fin, padres_fin, padres_inicio, self.iterar_vecinos_entrada)
+            if encuentro is not None:
+                camino = []
+                actual = encuentro
+                while actual is not None:
+                    camino.append(actual)
+                    actual = padres_inicio[actual]
+                camino.reverse()
+                actual = padres_fin[encuentro]
+                while actual is not None:
+                    camino.append(actual)
+                    actual = padres_fin[actual]
+                return camino
+        return []
+
+    # CSR con la base y el delta fundidos: ids de la base, luego los vértices nuevos. Los tramos
+    # de la base entre dos vértices con delta se copian de un solo golpe (frombytes).
+    def fundir(self):
+        base = self.base
+        etiquetas = base.etiquetas + list(self.nuevos)
+        indices = dict(base.indices)
+        for vertice in self.nuevos:
+            indices[vertice] = len(indices)
+        n, n_base = len(etiquetas), len(base)
+        destinos, pesos = array(tipo_indice(n)), array('d')
+        vista_pesos = memoryview(base.pesos)
+        agregadas = array('q', [0]) * n  # Entradas del delta de cada id
+
+        def copiar_base(desde, hasta):
+            tramo = base.vista_destinos[desde:hasta]
+            if destinos.itemsize == tramo.itemsize:
+                destinos.frombytes(tramo.cast('B'))
+            else:  # La base usaba ids de 32 bits y el grafo fundido ya necesita 64
+                destinos.extend(tramo)
+            pesos.frombytes(vista_pesos[desde:hasta].cast('B'))
+
+        copiado = 0  # Entradas de la base ya copiadas
+        for i in sorted(indices[vertice] for vertice in self.delta):
+            hasta = base.offsets[min(i + 1, n_base)]
+            copiar_base(copiado, hasta)
+            copiado = hasta
+            for v, peso in self.delta[etiquetas[i]]:
+                destinos.append(indices[v])
+                pesos.append(peso)
+            agregadas[i] = len(self.delta[etiquetas[i]])
+        copiar_base(copiado, base.num_aristas)
+        offsets = array('q', [0]) * (n + 1)
+        acumulado = 0
+        for i in range(n):
+            acumulado += agregadas[i]
+            offsets[i + 1] = base.offsets[min(i + 1, n_base)] + acumulado
+        return GrafoCompacto(etiquetas, offsets, destinos, pesos, self.es_dirigido, indices)
+
+
+# Cambios de un escritor que todavía no se publicaron (ver GrafoConcurrente.lote)
+class Lote:
+    def __init__(self, instantanea):
+        self._anterior = instantanea
+        self.delta = dict(instantanea.delta)  # Copia superficial: las tuplas se reemplazan, no se modifican
+        self.delta_entrada = dict(instantanea.delta_entrada)
+        self.nuevos = dict(instantanea.nuevos)
+        self.num_aristas = instantanea.num_aristas
+
+    def __contains__(self, vertice):
+        return vertice in self._anterior.base.indices or vertice in self.nuevos
+
+    def agregar_vertice(self, vertice):
+        if vertice not in self:
+            self.nuevos[vertice] = None
+
+    def agregar_arista(self, u, v, peso=1):
+        self.agregar_vertice(u)
+        self.agregar_vertice(v)
+        self._agregar_entrada(u, v, peso)
+        if not self._anterior.es_dirigido:
+            self._agregar_entrada(v, u, peso)
+
+    def _agregar_entrada(self, u, v, peso):
+        self.delta[u] = self.delta.get(u, ()) + ((v, peso),)
+        if self._anterior.es_dirigido:
+            self.delta_entrada[v] = self.delta_entrada.get(v, ()) + (u,)
+        self.num_aristas += 1
+
+    def eliminar_arista(self, u, v):
+        raise ValueError("GrafoConcurrente solo admite agregar vértices y aristas")
+
+    eliminar_vertice = eliminar_arista
+
+    def instantanea(self):
+        anterior = self._anterior
+        return Instantanea(anterior.base, self.delta, self.delta_entrada, self.nuevos,
+                           anterior.version + 1, self.num_aristas, anterior.es_dirigido)
+
+
+# Clase GrafoConcurrente
+class GrafoConcurrente:
+    def __init__(self, es_dirigido=False, limite_delta=LIMITE_DELTA):
+        self.es_dirigido = es_dirigido
+        self.limite_delta = limite_delta
+        self._actual = Instantanea(_VACIO, {}, {}, {}, 0, 0, es_dirigido)
+        self._escritura = threading.Lock()
+        self.fusiones = 0
+
+    @classmethod
+    def desde_grafo(cls, grafo, limite_delta=LIMITE_DELTA):
+        concurrente = cls(grafo.es_dirigido, limite_delta)
+        base = grafo.compactar()
+        concurrente._actual = Instantanea(base, {}, {}, {}, 0, base.num_aristas, grafo.es_dirigido)
+        return concurrente
+
+    # Versión actual. Leer un atributo es atómico: no hace falta ningún candado.
+    def instantanea(self):
+        return self._actual
+
+    @property
+    def version(self):
+        return self._actual.version
+
+    # Agrupa escrituras: se publican juntas, en una sola versión, al salir del bloque.
+    # Si el bloque lanza una excepción no se publica nada.
+    @contextmanager
+    def lote(self):
+        with self._escritura:
+            lote = Lote(self._actual)
+            yield lote
+            nueva = lote.instantanea()
+            if len(nueva.delta) + len(nueva.nuevos) > self.limite_delta:
+                base = nueva.fundir()
+                nueva = Instantanea(base, {}, {}, {}, nueva.version, nueva.num_aristas, self.es_dirigido)
+                self.fusiones += 1
+            self._actual = nueva  # Publicación: a partir de aquí los lectores ven la versión nueva
+
+    def agregar_vertice(self, vertice):
+        with self.lote() as lote:
+            lote.agregar_vertice(vertice)
+
+    def agregar_arista(self, u, v, peso=1):
+        with self.lote() as lote:
+            lote.agregar_arista(u, v, peso)
+
+    # Aplica un registro de cambios (ver cambios.py) y lo publica como una sola versión
+    def aplicar_cambios(self, cambios):
+        from cambios import aplicar_cambios
+        with self.lote() as lote:
+            return aplicar_cambios(lote, cambios)
+
+    # Lecturas: cada una trabaja sobre la instantánea vigente al empezar
+    def __contains__(self, vertice):
+        return vertice in self._actual
+
+    def iterar_vecinos(self, vertice, invertido=False):
+        return self._actual.iterar_vecinos(vertice, invertido)
+
+    def obtener_vecinos(self, vertice):
+        return self._actual.obtener_vecinos(vertice)
+
+    def existe_arista(self, u, v):
+        return self._actual.existe_arista(u, v)
+
+    def encontrar_camino(self, inicio, fin):
+        return self._actual.encontrar_camino(inicio, fin)
+
+
+# Casos de prueba
+if __name__ == "__main__":
+    from breadth_first_search import bfs
+
+    grafo = GrafoConcurrente()
+    for u, v in [('A', 'B'), ('A', 'C'), ('B', 'D')]:
+        grafo.agregar_arista(u, v)
+    vieja = grafo.instantanea()
+    with grafo.lote() as lote:
+        lote.agregar_arista('D', 'E')
+        lote.agregar_arista('C', 'E')
+    nueva = grafo.instantanea()
+    print(f"Versión {vieja.version}: BFS desde A = {bfs(vieja, 'A')}, camino A-E = {vieja.encontrar_camino('A', 'E')}")
+    print(f"Versión {nueva.version}: BFS desde A = {bfs(nueva, 'A')}, camino A-E = {nueva.encontrar_camino('A', 'E')}")
+    fundida = nueva.fundir()
+    print("Fundida en CSR:", fundida.aristas)
+    print("(Ver estres_instantaneas.py para la prueba con hilos)")
@@ -0,0 +1,265 @@
+"""
+╔════════════════════════════════════════════════════════════════════════════╗
+║                                                                            ║
+║  Instrumentación de recorridos: contadores y perfil de una consulta        ║
+║  Versión: 1.1.0                                                            ║
+║                                                                            ║
+║  Descripción:                                                              ║
+║  Dentro de un bloque `with instrumentar() as medicion:` cada llamada a     ║
+║  bfs, dfs, es_conexo o encontrar_camino (Grafo, GrafoCompacto y            ║
+║  GrafoInternado) deja en medicion.consultas unas EstadisticasRecorrido:    ║
+║     • vértices expandidos, aristas examinadas (la suma de sus grados),     ║
+║       frontera (o pila) máxima y el vértice de mayor grado (los "hubs");   ║
+║     • por nivel: sentido, tamaño de la frontera, aristas y tiempo;         ║
+║     • tiempo, bloques netos y recolecciones del gc de la consulta y,       ║
+║       con asignaciones=True, el pico de bytes (tracemalloc).               ║
+║  La consulta se ejecuta una sola vez, por su camino normal: medir() le     ║
+║  pasa las estadísticas y los propios recorridos las van llenando (cada     ║
+║  uno comprueba `estadisticas is not None` por vértice expandido). Nada     ║
+║  se repite, así que las cachés (p. ej. la de caminos) cuentan una sola     ║
+║  consulta. Las llamadas que no recorren (índice de componentes, caché      ║
+║  de caminos, una `estrategia`) quedan con ruta 'directa' y solo tiempo     ║
+║  y memoria.                                                                ║
+║                                                                            ║
+║  tracemalloc es opcional (asignaciones=True) porque encarece cada          ║
+║  asignación: con él activo, `segundos` incluye ese costo.                  ║
+║  Con perfil='archivo.prof' la primera consulta (de `operacion_perfil`,     ║
+║  si se indica) corre bajo cProfile y se guarda en formato pstats           ║
+║  (python -m pstats, snakeviz, flameprof); su tiempo incluye el perfil.     ║
+║                                                                            ║
+║  Desactivada, el costo es leer `instrumentacion.activa` una vez por        ║
+║  llamada. El estado es global: pensada para medir desde un solo hilo.      ║
+║                                                                            ║
+║  Uso: python instrumentacion.py [num_vertices] [archivo.prof]              ║
+║                                                                            ║
+╚════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import cProfile
+import gc
+import sys
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+
+activa = None  # Medicion en curso, o None (ver instrumentar)
+
+
+# Contadores de una consulta. Los recorridos los llenan con nivel(), expandir(),
+# expandir_en_cola() y expandir_en_pila().
+class EstadisticasRecorrido:
+    __slots__ = ('operacion', 'ruta', 'vertices_visitados', 'aristas_examinadas', 'frontera_maxima',
+                 'grado_maximo', 'vertice_grado_maximo', 'niveles', 'segundos', 'bytes_pico',
+                 'bloques_netos', 'recolecciones_gc', '_nivel', '_fin_nivel')
+
+    def __init__(self, operacion, ruta='directa'):
+        self.operacion = operacion
+        self.ruta = ruta  # 'bfs', 'dfs', 'bidireccional' o 'directa' (sin contadores de recorrido)
+        self.vertices_visitados = 0  # Vértices expandidos (en bfs y dfs, todos los alcanzados)
+        self.aristas_examinadas = 0
+        self.frontera_maxima = 0  # En dfs, el tamaño máximo de la pila
+        self.grado_maximo = 0
+        self.vertice_grado_maximo = None
+        self.niveles = []  # [(sentido, tamaño de la frontera, aristas, segundos), ...]
+        self.segundos = 0.0
+        self.bytes_pico = None  # Solo con asignaciones=True
+        self.bloques_netos = 0
+        self.recolecciones_gc = 0
+        self._nivel = None  # [sentido, frontera, aristas, inicio] del nivel abierto
+        self._fin_nivel = 0  # En expandir_en_cola: vértices expandidos al cerrar el nivel abierto
+
+    # Abre un nivel (y cierra el anterior) con una frontera de `frontera` vértices
+    def nivel(self, sentido, frontera):
+        self.cerrar_nivel()
+        self._nivel = [sentido, frontera, 0, time.perf_counter()]
+        if frontera > self.frontera_maxima:
+            self.frontera_maxima = frontera
+
+    def cerrar_nivel(self):
+        if self._nivel is not None:
+            sentido, frontera, aristas, inicio = self._nivel
+            self.niveles.append((sentido, frontera, aristas, time.perf_counter() - inicio))
+            self._nivel = None
+
+    # Un vértice expandido, con `grado` aristas por examinar
+    def expandir(self, vertice, grado):
+        self.vertices_visitados += 1
+        self.aristas_examinadas += grado
+        if self._nivel is not None:
+            self._nivel[2] += grado
+        if grado > self.grado_maximo:
+            self.grado_maximo, self.vertice_grado_maximo = grado, vertice
+
+    # BFS con cola: `descubiertos` son los vértices encolados alguna vez antes de expandir este.
+    # Un nivel termina cuando se expandió todo lo descubierto al empezarlo.
+    def expandir_en_cola(self, vertice, grado, descubiertos):
+        if self.vertices_visitados == self._fin_nivel:
+            self.nivel('adelante', descubiertos - self._fin_nivel)
+            self._fin_nivel = descubiertos
+        self.expandir(vertice, grado)
+
+    # DFS con pila: `pila` es su tamaño al sacar este vértice
+    def expandir_en_pila(self, vertice, grado, pila):
+        if pila > self.frontera_maxima:
+            self.frontera_maxima = pila
+        self.expandir(vertice, grado)
+
+    def como_dict(self):
+        return {nombre: getattr(self, nombre) for nombre in self.__slots__ if not nombre.startswith('_')}
+
+    def __repr__(self):
+        return (f"EstadisticasRecorrido({self.operacion}, ruta={self.ruta}, visitados={self.vertices_visitados}, "
+                f"aristas={self.aristas_examinadas}, frontera_maxima={self.frontera_maxima}, "
+                f"niveles={len(self.niveles)}, segundos={self.segundos:.6f})")
+
+
+# Lo que acumula un bloque `with instrumentar()`
+class Medicion:
+    def __init__(self, asignaciones=False, perfil=None, operacion_perfil=None, maximo_consultas=1000):
+        self.asignaciones = asignaciones
+        self.perfil = perfil
+        self.operacion_perfil = operacion_perfil
+        self.perfilada = None  # Estadísticas de la consulta que se perfiló
+        self.consultas = deque(maxlen=maximo_consultas)  # Las más recientes
+        self.totales = {}  # operacion -> {'consultas', 'segundos', 'vertices_visitados', 'aristas_examinadas'}
+
+    def _registrar(self, estadisticas):
+        self.consultas.append(estadisticas)
+        total = self.totales.setdefault(estadisticas.operacion, {
+            'consultas': 0, 'segundos': 0.0, 'vertices_visitados': 0, 'aristas_examinadas': 0})
+        total['consultas'] += 1
+        total['segundos'] += estadisticas.segundos
+        total['vertices_visitados'] += estadisticas.vertices_visitados
+        total['aristas_examinadas'] += estadisticas.aristas_examinadas
+
+    def _toca_perfil(self, operacion):
+        return (self.perfil is not None and self.perfilada is None
+                and self.operacion_perfil in (None, operacion))
+
+    # Las k consultas más lentas entre las guardadas
+    def mas_lentas(self, k=5):
+        return sorted(self.consultas, key=lambda e: e.segundos, reverse=True)[:k]
+
+    def resumen(self):
+        return {operacion: dict(total) for operacion, total in self.totales.items()}
+
+
+# Activa la instrumentación dentro del bloque. Devuelve la Medicion.
+@contextmanager
+def instrumentar(asignaciones=False, perfil=None, operacion_perfil=None, maximo_consultas=1000):
+    global activa
+    anterior = activa
+    medicion = Medicion(asignaciones, perfil, operacion_perfil, maximo_consultas)
+    activa = medicion
+    try:
+        yield medicion
+    finally:
+        activa = anterior
+
+
+# Ruta que siguió cada operación cuando expandió algún vértice
+RUTAS = {'bfs': 'bfs', 'dfs': 'dfs', 'es_conexo': 'bfs', 'encontrar_camino': 'bidireccional'}
+
+
+# Punto de entrada desde las operaciones instrumentadas: `funcion` es la implementación normal
+# (p. ej. Grafo.encontrar_camino), que se llama una sola vez con estadisticas=..., y con la
+# instrumentación apagada para que sus llamadas internas no se midan por separado.
+def medir(funcion, grafo, *argumentos):
+    global activa
+    medicion = activa
+    activa = None
+    try:
+        operacion = funcion.__name__
+        estadisticas = EstadisticasRecorrido(operacion)
+        perfilador = cProfile.Profile() if medicion._toca_perfil(operacion) else None
+
+        trazando = medicion.asignaciones and not tracemalloc.is_tracing()
+        if trazando:
+            tracemalloc.start()
+        elif medicion.asignaciones:
+            tracemalloc.reset_peak()
+        memoria_inicial = tracemalloc.get_traced_memory()[0] if medicion.asignaciones else 0
+        recolecciones = sum(generacion['collections'] for generacion in gc.get_stats())
+        bloques = sys.getallocatedblocks()
+        inicio = time.perf_counter()
+        try:
+            if perfilador is None:
+                return funcion(grafo, *argumentos, estadisticas=estadisticas)
+            return perfilador.runcall(funcion, grafo, *argumentos, estadisticas=estadisticas)
+        finally:
+            estadisticas.segundos = time.perf_counter() - inicio
+            estadisticas.bloques_netos = sys.getallocatedblocks() - bloques
+            estadisticas.recolecciones_gc = sum(generacion['collections'] for generacion in gc.get_stats()) \
+                - recolecciones
+            if medicion.asignaciones:
+                estadisticas.bytes_pico = tracemalloc.get_traced_memory()[1] - memoria_inicial
+            if trazando:
+                tracemalloc.stop()
+            estadisticas.cerrar_nivel()
+            if estadisticas.vertices_visitados:
+                estadisticas.ruta = RUTAS[operacion]
+            etiquetas = getattr(grafo, 'etiquetas', None)  # GrafoCompacto y GrafoInternado recorren ids
+            if etiquetas is not None and estadisticas.vertice_grado_maximo is not None:
+                estadisticas.vertice_grado_maximo = etiquetas[estadisticas.vertice_grado_maximo]
+            if perfilador is not None:
+                perfilador.dump_stats(medicion.perfil)
+                medicion.perfilada = estadisticas
+            medicion._registrar(estadisticas)
+    finally:
+        activa = medicion
+
+
+# Casos de prueba
+if __name__ == "__main__":
+    # Como script este archivo es __main__: hay que usar el módulo que importan los grafos
+    from instrumentacion import instrumentar
+    from breadth_first_search import bfs, dfs
+    from generadores import barabasi_albert, erdos_renyi
+    from grafo import Grafo
+
+    grafo = Grafo()
+    for u, v in [('A', 'B'), ('A', 'C'), ('B', 'D'), ('B', 'E'), ('C', 'D'), ('D', 'E')]:
+        grafo.agregar_arista(u, v)
+    with instrumentar(asignaciones=True) as medicion:
+        print("BFS desde 'A':", bfs(grafo, 'A'))
+        print("DFS desde 'A':", dfs(grafo, 'A'))
+        print("¿Conexo?:", grafo.es_conexo())
+        print("Camino de A a E en el compacto:", grafo.compactar().encontrar_camino('A', 'E'))
+    for estadisticas in medicion.consultas:
+        print(" ", estadisticas, f"pico={estadisticas.bytes_pico} bytes")
+    print("Niveles del BFS:", medicion.consultas[0].niveles)
+
+    # Con la caché de caminos la consulta medida es la única que la toca
+    cache = grafo.activar_cache_caminos()
+    with instrumentar():
+        grafo.encontrar_camino('A', 'E')
+    assert (cache.aciertos, cache.fallos) == (0, 1), (cache.aciertos, cache.fallos)
+    grafo.desactivar_cache_caminos()
+
+    # Un grafo sin hubs frente a uno con hubs: mismo tamaño, fronteras y grados muy distintos
+    num_vertices = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    archivo_perfil = sys.argv[2] if len(sys.argv) > 2 else None
+    for nombre, (n, aristas) in [("Erdős–Rényi", erdos_renyi(num_vertices, 3 * num_vertices, semilla=1)),
+                                 ("Barabási-Albert", barabasi_albert(num_vertices, 3, semilla=1))]:
+        grande = Grafo()
+        for u, v in aristas:
+            grande.agregar_arista(u, v)
+        compacto = grande.compactar()
+        inicio = time.perf_counter()
+        bfs(compacto, 0)
+        desactivada = time.perf_counter() - inicio
+        with instrumentar(perfil=archivo_perfil, operacion_perfil='bfs') as medicion:
+            bfs(compacto, 0)
+            compacto.encontrar_camino(0, n - 1)
+        recorrido, camino = medicion.consultas
+        print(f"\n{nombre} ({n} vértices): bfs sin instrumentar {desactivada:.3f} s, "
+              f"instrumentado {recorrido.segundos:.3f} s")
+        print(f"  visitados={recorrido.vertices_visitados} aristas={recorrido.aristas_examinadas} "
+              f"frontera máxima={recorrido.frontera_maxima} grado máximo={recorrido.grado_maximo} "
+              f"(vértice {recorrido.vertice_grado_maximo}) gc={recorrido.recolecciones_gc}")
+        for sentido, frontera, aristas_nivel, segundos in recorrido.niveles:
+            print(f"    {sentido:9}{frontera:9}{aristas_nivel:10}{segundos * 1e3:9.2f} ms")
+        print(f"  camino 0 -> {n - 1}: {camino}")
+    if archivo_perfil:
+        print(f"\nPerfil del primer bfs instrumentado en {archivo_perfil}")
@@ -0,0 +1,431 @@
+"""
+╔════════════════════════════════════════════════════════════════════════════╗
+║                                                                            ║
+║  Servidor asíncrono de consultas de caminos (micro-lotes)                  ║
+║  Versión: 1.0.0                                                            ║
+║                                                                            ║
+║  Descripción:                                                              ║
+║  Protocolo: una línea JSON por consulta y otra por respuesta, sobre TCP.   ║
+║     {"id": 7, "tipo": "camino", "inicio": "A", "fin": "E"}                 ║
+║        -> {"id": 7, "camino": ["A", "B", "E"]}                             ║
+║     {"id": 8, "tipo": "alcanzable", "inicio": "A", "fin": "F"}             ║
+║        -> {"id": 8, "alcanzable": false}                                   ║
+║     {"id": 9, "tipo": "estadisticas"}  -> {"id": 9, "estadisticas": {...}} ║
+║  Las respuestas de una conexión pueden llegar en otro orden (usar "id").   ║
+║                                                                            ║
+║  Las consultas se acumulan en una cola y se agrupan en micro-lotes. Cada   ║
+║  consulta usa la búsqueda bidireccional, salvo que su inicio tenga al      ║
+║  menos DESTINOS_POR_ARBOL destinos en el lote: entonces comparten un solo  ║
+║  BFS, que se detiene al alcanzar todos sus destinos. Los lotes corren en   ║
+║  un ProcessPoolExecutor cuyos procesos leen la adyacencia desde memoria    ║
+║  compartida (ver bfs_paralelo.py), así el bucle de eventos nunca se        ║
+║  bloquea.                                                                  ║
+║     • Contrapresión: la cola es acotada y hay como mucho un lote en vuelo  ║
+║       por proceso. Con la cola llena, las conexiones dejan de leer (TCP    ║
+║       frena a los clientes) y cada conexión admite un número limitado de   ║
+║       consultas pendientes.                                                ║
+║     • Tiempo límite por consulta (modo 'lotes'): vencido, se responde      ║
+║       {"error": "tiempo agotado"} y la consulta no se calcula si todavía   ║
+║       no se había hecho.                                                   ║
+║     • Si un lote falla (p. ej. muere un proceso del pool), cada una de sus ║
+║       consultas recibe {"error": "error interno"}.                         ║
+║  Con modo='directo' cada consulta llama a encontrar_camino en el propio    ║
+║  bucle de eventos (como el servicio actual), para comparar.                ║
+║                                                                            ║
+║  Uso: python servidor_caminos.py [--vertices N] [--puerto P] ...           ║
+║  (carga_caminos.py arranca el servidor y mide rendimiento y latencias)     ║
+║                                                                            ║
+╚════════════════════════════════════════════════════════════════════════════╝
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from bfs_paralelo import compartir_adyacencia
+from grafo_compacto import GrafoCompacto
+
+LOTE_MAXIMO = 512  # Consultas por lote
+ESPERA_LOTE = 0.001  # Segundos que se espera a que lleguen más consultas antes de cerrar un lote
+COLA_MAXIMA = 4096  # Consultas en espera antes de dejar de leer de las conexiones
+PENDIENTES_POR_CONEXION = 256
+TIEMPO_LIMITE = 2.0  # Segundos por consulta, desde que se lee hasta que se responde
+# Un BFS completo cuesta cientos de búsquedas bidireccionales en un grafo aleatorio: solo conviene
+# compartirlo cuando un mismo inicio tiene muchos destinos en el lote
+DESTINOS_POR_ARBOL = 64
+VENCIDA = False  # Resultado de una consulta que venció antes de calcularse (None = no hay camino)
+
+# Estado de cada proceso trabajador (se llena en _inicializar_trabajador)
+_memorias = []
+_adelante = None  # (offsets, destinos) de la adyacencia de salida
+_atras = None  # (offsets, destinos) de la de entrada; la misma en grafos no dirigidos
+
+
+def _conectar(descripcion):
+    nombre, tamano_offsets, tamano_destinos, tipo = descripcion
+    memoria = shared_memory.SharedMemory(name=nombre)
+    _memorias.append(memoria)
+    return (memoria.buf[:tamano_offsets].cast('q'),
+            memoria.buf[tamano_offsets:tamano_offsets + tamano_destinos].cast(tipo))
+
+
+def _inicializar_trabajador(descripcion_adelante, descripcion_atras):
+    global _adelante, _atras
+    _adelante = _conectar(descripcion_adelante)
+    _atras = _conectar(descripcion_atras) if descripcion_atras is not None else _adelante
+
+
+# Camino (lista de ids) de origen a destino con búsqueda bidireccional, o None si no hay
+def _camino_bidireccional(origen, destino):
+    if origen == destino:
+        return [origen]
+    padres_inicio = {origen: origen}
+    padres_fin = {destino: destino}
+    frontera_inicio = [origen]
+    frontera_fin = [destino]
+    while frontera_inicio and frontera_fin:
+        if len(frontera_inicio) <= len(frontera_fin):
+            frontera_inicio, encuentro = GrafoCompacto._expandir_nivel(
+                *_adelante, frontera_inicio, padres_inicio, padres_fin)
+        else:
+            frontera_fin, encuentro = GrafoCompacto._expandir_nivel(
+                *_atras, frontera_fin, padres_fin, padres_inicio)
+        if encuentro is not None:
+            camino = [encuentro]
+            while camino[-1] != origen:
+                camino.append(padres_inicio[camino[-1]])
+            camino.reverse()
+            while encuentro != destino:
+                encuentro = padres_fin[encuentro]
+                camino.append(encuentro)
+            return camino
+    return None
+
+
+# Caminos (listas de ids, o None) desde origen a cada destino, con un solo BFS que se
+# detiene en cuanto alcanzó todos los destinos
+def _caminos_desde(origen, destinos):
+    offsets, adyacencia = _adelante
+    padres = array('q', [-1]) * (len(offsets) - 1)
+    padres[origen] = origen
+    faltan = set(destinos)
+    faltan.discard(origen)
+    cola = [origen]
+    for actual in cola:  # La lista crece mientras se recorre: funciona como cola FIFO
+        if not faltan:
+            break
+        for vecino in adyacencia[offsets[actual]:offsets[actual + 1]]:
+            if padres[vecino] == -1:
+                padres[vecino] = actual
+                cola.append(vecino)
+                faltan.discard(vecino)
+    caminos = []
+    for destino in destinos:
+        if padres[destino] == -1:
+            caminos.append(None)
+            continue
+        camino = [destino]
+        while camino[-1] != origen:
+            camino.append(padres[camino[-1]])
+        camino.reverse()
+        caminos.append(camino)
+    return caminos
+
+
+# Tarea de un trabajador: un lote como lista de (origen, [destinos], [límites]); devuelve, por
+# cada elemento, la lista de caminos correspondiente. Los límites son instantes de time.monotonic()
+# (el mismo reloj que el bucle de eventos): lo que ya venció no se calcula y queda como VENCIDA.
+def _resolver_lote(grupos):
+    resultados = []
+    for origen, destinos, limites in grupos:
+        if time.monotonic() > max(limites):
+            resultados.append([VENCIDA] * len(destinos))
+        elif len(destinos) >= DESTINOS_POR_ARBOL:
+            resultados.append(_caminos_desde(origen, destinos))
+        else:
+            resultados.append([VENCIDA if time.monotonic() > limite else _camino_bidireccional(origen, destino)
+                               for destino, limite in zip(destinos, limites)])
+    return resultados
+
+
+# Consulta en espera: ids de inicio y fin, el futuro que recibe el camino y el instante límite
+class _Consulta:
+    __slots__ = ('origen', 'destino', 'futuro', 'limite')
+
+    def __init__(self, origen, destino, futuro, limite):
+        self.origen = origen
+        self.destino = destino
+        self.futuro = futuro
+        self.limite = limite
+
+
+# Clase ServidorCaminos
+class ServidorCaminos:
+    def __init__(self, grafo, procesos=None, modo='lotes', lote_maximo=LOTE_MAXIMO, espera_lote=ESPERA_LOTE,
+                 cola_maxima=COLA_MAXIMA, tiempo_limite=TIEMPO_LIMITE,
+                 pendientes_por_conexion=PENDIENTES_POR_CONEXION):
+        if modo not in ('lotes', 'directo'):
+            raise ValueError(f"Modo desconocido: {modo}. Use 'lotes' o 'directo'")
+        self.compacto = grafo if isinstance(grafo, GrafoCompacto) else grafo.compactar()
+        self.procesos = procesos or os.cpu_count() or 1
+        self.modo = modo
+        self.lote_maximo = lote_maximo
+        self.espera_lote = espera_lote
+        self.cola_maxima = cola_maxima
+        self.tiempo_limite = tiempo_limite
+        self.pendientes_por_conexion = pendientes_por_conexion
+        self.respondidas = 0
+        self.vencidas = 0  # Consultas que agotaron su tiempo
+        self.descartadas = 0  # Vencidas antes de calcularse
+        self.fallidas = 0  # Consultas cuyo lote falló (p. ej. un proceso del pool murió)
+        self.lotes = 0
+        self.consultas_en_lotes = 0
+        self._cola = None
+        self._trabajadores = None  # Semáforo: un lote en vuelo por proceso
+        self._ejecutor = None
+        self._bloques = []
+        self._servidor = None
+        self._tareas = set()
+        self._conexiones = {}  # Tarea que atiende cada conexión -> su escritor
+
+    def estadisticas(self):
+        return {
+            'respondidas': self.respondidas, 'vencidas': self.vencidas, 'descartadas': self.descartadas,
+            'fallidas': self.fallidas,
+            'lotes': self.lotes, 'consultas_por_lote': self.consultas_en_lotes / self.lotes if self.lotes else 0.0,
+            'en_cola': self._cola.qsize() if self._cola is not None else 0,
+        }
+
+    # Arranca el pool y el servidor TCP. Devuelve el puerto (útil con puerto=0).
+    async def iniciar(self, host='127.0.0.1', puerto=0):
+        if self.modo == 'lotes':
+            bloque, adelante = compartir_adyacencia(self.compacto)
+            self._bloques.append(bloque)
+            atras = None
+            if self.compacto.es_dirigido:
+                bloque, atras = compartir_adyacencia(self.compacto.transpuesto())
+                self._bloques.append(bloque)
+            self._ejecutor = ProcessPoolExecutor(self.procesos, initializer=_inicializar_trabajador,
+                                                 initargs=(adelante, atras))
+            self._cola = asyncio.Queue(self.cola_maxima)
+            self._trabajadores = asyncio.Semaphore(self.procesos)
+            self._lanzar(self._formar_lotes())
+        self._servidor = await asyncio.start_server(self._atender, host, puerto)
+        return self._servidor.sockets[0].getsockname()[1]
+
+    async def cerrar(self):
+        if self._servidor is not None:
+            self._servidor.close()
+            # Cerrar las conexiones abiertas: su lectura termina (EOF) y los manejadores salen solos
+            for escritor in self._conexiones.values():
+                escritor.close()
+            if self._conexiones:
+                await asyncio.wait(list(self._conexiones), timeout=1.0)
+            await self._servidor.wait_closed()
+        for tarea in list(self._tareas):
+            tarea.cancel()
+        if self._ejecutor is not None:
+            self._ejecutor.shutdown(cancel_futures=True)
+        for bloque in self._bloques:
+            bloque.close()
+            bloque.unlink()
+        self._bloques.clear()
+
+    def _lanzar(self, corrutina):
+        tarea = asyncio.create_task(corrutina)
+        self._tareas.add(tarea)  # Referencia fuerte hasta que termine
+        tarea.add_done_callback(self._tareas.discard)
+        return tarea
+
+    # Camino mínimo (lista de etiquetas, [] si no hay) de inicio a fin.
+    # Lanza TimeoutError si no se pudo responder dentro del tiempo límite.
+    async def encontrar_camino(self, inicio, fin):
+        compacto = self.compacto
+        if inicio not in compacto or fin not in compacto:
+            return []
+        if self.modo == 'directo':
+            return compacto.encontrar_camino(inicio, fin)
+        bucle = asyncio.get_running_loop()
+        limite = bucle.time() + self.tiempo_limite
+        consulta = _Consulta(compacto.id_de(inicio), compacto.id_de(fin), bucle.create_future(), limite)
+        try:
+            async with asyncio.timeout_at(limite):
+                await self._cola.put(consulta)  # Con la cola llena, espera aquí: contrapresión
+                camino = await consulta.futuro
+        except TimeoutError:
+            self.vencidas += 1
+            consulta.futuro.cancel()  # Si sigue en la cola, el lote la descarta
+            raise
+        etiquetas = compacto.etiquetas
+        return [etiquetas[i] for i in camino] if camino is not None else []
+
+    async def _formar_lotes(self):
+        bucle = asyncio.get_running_loop()
+        while True:
+            # Primero un proceso libre: mientras todos están ocupados, las consultas se acumulan
+            # en la cola y el próximo lote sale más grande
+            await self._trabajadores.acquire()
+            lote = [await self._cola.get()]
+            cierre = bucle.time() + self.espera_lote
+            while len(lote) < self.lote_maximo:
+                if self._cola.empty():
+                    restante = cierre - bucle.time()
+                    if restante <= 0:
+                        break
+                    try:
+                        async with asyncio.timeout(restante):
+                            lote.append(await self._cola.get())
+                    except TimeoutError:
+                        break
+                else:
+                    lote.append(self._cola.get_nowait())
+            self._lanzar(self._ejecutar_lote(lote))
+
+    async def _ejecutar_lote(self, lote):
+        try:
+            ahora = asyncio.get_running_loop().time()
+            vivas = []
+            for consulta in lote:
+                if consulta.futuro.done() or consulta.limite <= ahora:
+                    self.descartadas += 1
+                else:
+                    vivas.append(consulta)
+            if not vivas:
+                return
+            grupos = {}  # origen -> {destino: límite más lejano}, en orden de llegada
+            for consulta in vivas:
+                destinos = grupos.setdefault(consulta.origen, {})
+                destinos[consulta.destino] = max(destinos.get(consulta.destino, 0), consulta.limite)
+            grupos = [(origen, list(destinos), list(destinos.values())) for origen, destinos in grupos.items()]
+            self.lotes += 1
+            self.consultas_en_lotes += len(vivas)
+            try:
+                resultados = await asyncio.get_running_loop().run_in_executor(
+                    self._ejecutor, _resolver_lote, grupos)
+            except Exception as error:
+                for consulta in vivas:
+                    if not consulta.futuro.done():
+                        consulta.futuro.set_exception(error)
+                return
+            caminos = {}
+            for (origen, destinos, _), encontrados in zip(grupos, resultados):
+                for destino, camino in zip(destinos, encontrados):
+                    caminos[origen, destino] = camino
+            for consulta in vivas:
+                camino = caminos[consulta.origen, consulta.destino]
+                if camino is VENCIDA:
+                    self.descartadas += 1  # Su espera ya terminó (o está por terminar) con TimeoutError
+                elif not consulta.futuro.done():
+                    consulta.futuro.set_result(camino)
+        finally:
+            self._trabajadores.release()
+
+    # Una conexión: lee consultas mientras tenga cupo y responde cada una al terminar
+    async def _atender(self, lector, escritor):
+        cupo = asyncio.Semaphore(self.pendientes_por_conexion)
+        escritura = asyncio.Lock()
+        pendientes = set()
+        self._conexiones[asyncio.current_task()] = escritor
+        try:
+            while True:
+                await cupo.acquire()  # Sin cupo no se lee más: el cliente se frena (contrapresión)
+                linea = await lector.readline()
+                if not linea:
+                    break
+                tarea = self._lanzar(self._responder(linea, escritor, escritura, cupo))
+                pendientes.add(tarea)
+                tarea.add_done_callback(pendientes.discard)
+            if pendientes:
+                await asyncio.wait(pendientes)
+        except ConnectionError:
+            pass
+        finally:
+            del self._conexiones[asyncio.current_task()]
+            escritor.close()
+
+    async def _responder(self, linea, escritor, escritura, cupo):
+        try:
+            respuesta = await self._resolver(linea)
+            async with escritura:
+                escritor.write(json.dumps(respuesta, ensure_ascii=False).encode('utf-8') + b"\n")
+                await escritor.drain()
+        except ConnectionError:
+            pass
+        finally:
+            cupo.release()
+
+    async def _resolver(self, linea):
+        try:
+            consulta = json.loads(linea)
+            identificador = consulta.get('id')
+            tipo = consulta.get('tipo')
+        except (ValueError, AttributeError):
+            return {'id': None, 'error': "consulta mal formada"}
+        try:
+            if tipo == 'estadisticas':
+                return {'id': identificador, 'estadisticas': self.estadisticas()}
+            if tipo not in ('camino', 'alcanzable'):
+                return {'id': identificador, 'error': f"tipo desconocido: {tipo}"}
+            camino = await self.encontrar_camino(consulta.get('inicio'), consulta.get('fin'))
+        except TimeoutError:
+            return {'id': identificador, 'error': "tiempo agotado"}
+        except TypeError:  # Etiqueta no hashable (p. ej. una lista JSON)
+            return {'id': identificador, 'error': "consulta mal formada"}
+        except Exception:  # Lo que _ejecutar_lote pasó al futuro (BrokenProcessPool, etc.)
+            self.fallidas += 1
+            return {'id': identificador, 'error': "error interno"}
+        self.respondidas += 1
+        if tipo == 'alcanzable':
+            return {'id': identificador, 'alcanzable': bool(camino)}
+        return {'id': identificador, 'camino': camino}
+
+
+async def _servir(grafo, opciones):
+    servidor = ServidorCaminos(grafo, opciones.procesos, opciones.modo, opciones.lote_maximo,
+                               opciones.espera_lote, opciones.cola_maxima, opciones.tiempo_limite)
+    puerto = await servidor.iniciar(opciones.host, opciones.puerto)
+    print(f"Escuchando en {opciones.host}:{puerto}", flush=True)  # carga_caminos.py lee esta línea
+    detener = asyncio.Event()
+    for senal in (signal.SIGINT, signal.SIGTERM):  # Cerrar en orden: libera la memoria compartida
+        asyncio.get_running_loop().add_signal_handler(senal, detener.set)
+    try:
+        await detener.wait()
+    finally:
+        await servidor.cerrar()
+
+
+def main(argumentos=None):
+    from generadores import GENERADORES
+    from grafo import Grafo
+
+    parser = argparse.ArgumentParser(description="Servidor de consultas de caminos con micro-lotes")
+    parser.add_argument('--vertices', type=int, default=100_000)
+    parser.add_argument('--generador', default='erdos_renyi', choices=sorted(GENERADORES))
+    parser.add_argument('--semilla', type=int, default=42)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--puerto', type=int, default=0)
+    parser.add_argument('--modo', default='lotes', choices=('lotes', 'directo'))
+    parser.add_argument('--procesos', type=int, default=None)
+    parser.add_argument('--lote-maximo', type=int, default=LOTE_MAXIMO)
+    parser.add_argument('--espera-lote', type=float, default=ESPERA_LOTE)
+    parser.add_argument('--cola-maxima', type=int, default=COLA_MAXIMA)
+    parser.add_argument('--tiempo-limite', type=float, default=TIEMPO_LIMITE)
+    opciones = parser.parse_args(argumentos)
+
+    n, aristas = GENERADORES[opciones.generador](opciones.vertices, opciones.semilla)
+    grafo = Grafo()
+    for vertice in range(n):
+        grafo.agregar_vertice(vertice)
+    for u, v in aristas:
+        grafo.agregar_arista(u, v)
+    asyncio.run(_servir(grafo, opciones))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# Rendimiento de grafos.py con el rastreo desactivado y activado.
+# Uso: python bench_rastreo.py [num_aristas]
+import itertools
+import logging
+import os
+import random
+import sys
+import time
+
+import grafos
+
+
+def medir(num_aristas, rastreo=None):
+    azar = random.Random(42)
+    num_vertices = max(num_aristas // 5, 1)
+    aristas = [(azar.randrange(num_vertices), azar.randrange(num_vertices)) for _ in range(num_aristas)]
+
+    inicio = time.perf_counter()
+    grafo = grafos.Grafo(rastreo=rastreo)
+    for u, v in aristas:
+        grafo.agregar_arista(u, v)
+    construccion = time.perf_counter() - inicio
+
+    origen = aristas[0][0]
+    inicio = time.perf_counter()
+    visitados = len(grafo.bfs(origen))
+    bfs = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    grafo.dfs(origen)
+    dfs = time.perf_counter() - inicio
+    return num_aristas / construccion, visitados / bfs, visitados / dfs
+
+
+if __name__ == "__main__":
+    num_aristas = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    eventos = itertools.count()  # Contador entero: la función de rastreo no guarda nada
+
+    print(f"{num_aristas} aristas")
+    print(f"{'modo':34}{'aristas/s (construir)':>24}{'vértices/s (bfs)':>20}{'vértices/s (dfs)':>20}")
+    modos = [
+        ("silencioso (por defecto)", None, None),
+        ("rastreo (función que cuenta)", lambda evento, datos: next(eventos), None),
+        ("logging DEBUG -> /dev/null", None, logging.DEBUG),
+    ]
+    for nombre, rastreo, nivel in modos:
+        manejador = None
+        if nivel is not None:
+            manejador = logging.StreamHandler(open(os.devnull, 'w'))
+            grafos.logger.addHandler(manejador)
+            grafos.logger.setLevel(nivel)
+        try:
+            construir, bfs, dfs = medir(num_aristas, rastreo)
+        finally:
+            if manejador is not None:
+                grafos.logger.removeHandler(manejador)
+                grafos.logger.setLevel(logging.NOTSET)
+                manejador.stream.close()
+        print(f"{nombre:34}{construir:>24,.0f}{bfs:>20,.0f}{dfs:>20,.0f}")
+    print(f"\nEventos recibidos por la función de rastreo: {next(eventos):,}")
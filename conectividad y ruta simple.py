@@ -1,5 +1,16 @@
+import importlib
+import os
+import sys
 from collections import deque
 
+CARPETA_CLASE_11 = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Clase-11-Junio-Grafos')
+
+def _importar_clase_11(nombre):
+    # Se importa solo al cargar un archivo: el modo interactivo no depende de esa carpeta
+    if CARPETA_CLASE_11 not in sys.path:
+        sys.path.append(CARPETA_CLASE_11)
+    return importlib.import_module(nombre)
+
 class Grafo:
     def __init__(self):
         self.adjacencias = {}
@@ -40,24 +51,44 @@ class Grafo:
         if inicio not in self.adjacencias or fin not in self.adjacencias:
             return []  # Devuelve lista vacía si el vértice no existe.
 
-        padres = {inicio: None}
-        visitados = set()
-        cola = deque([inicio])
-        visitados.add(inicio)
-
-        while cola:
-            vertice = cola.popleft()
+        if inicio == fin:
+            return [inicio]
+
+        # Búsqueda bidireccional: BFS desde ambos extremos, expandiendo siempre
+        # un nivel completo de la frontera más pequeña. Como el grafo es no
+        # dirigido, la búsqueda desde 'fin' usa las mismas adyacencias.
+        padres_inicio = {inicio: None}
+        padres_fin = {fin: None}
+        frontera_inicio = [inicio]
+        frontera_fin = [fin]
+
+        while frontera_inicio and frontera_fin:
+            if len(frontera_inicio) <= len(frontera_fin):
+                frontera_inicio, encuentro = self._expandir_nivel(frontera_inicio, padres_inicio, padres_fin)
+            else:
+                frontera_fin, encuentro = self._expandir_nivel(frontera_fin, padres_fin, padres_inicio)
+
+            if encuentro is not None:
+                camino = self._reconstruir_camino(padres_inicio, inicio, encuentro)
+                actual = padres_fin[encuentro]
+                while actual is not None:
+                    camino.append(actual)
+                    actual = padres_fin[actual]
+                return camino
 
-            if vertice == fin:
-                return self._reconstruir_camino(padres, inicio, fin)
+        return []  # Si no se encuentra el camino, devuelve lista vacía.
 
+    def _expandir_nivel(self, frontera, padres, padres_otro):
+        # Devuelve la siguiente frontera y el vértice donde se tocan ambas búsquedas (o None).
+        siguiente = []
+        for vertice in frontera:
             for vecino in self.adjacencias[vertice]:
-                if vecino not in visitados:
-                    visitados.add(vecino)
+                if vecino not in padres:
                     padres[vecino] = vertice
-                    cola.append(vecino)
-
-        return []  # Si no se encuentra el camino, devuelve lista vacía.
+                    if vecino in padres_otro:
+                        return siguiente, vecino
+                    siguiente.append(vecino)
+        return siguiente, None
 
     def _reconstruir_camino(self, padres, inicio, fin):
         camino = []
@@ -70,7 +101,7 @@ class Grafo:
         camino.reverse()  # Invertimos el camino para que esté en orden de inicio a fin.
         return camino
 
-def main():
+def leer_grafo_interactivo():
     grafo = Grafo()
     
     # Ingreso de vértices
@@ -85,13 +116,30 @@ def main():
             break
         v1, v2 = arista.split(',')
         grafo.agregar_arista(v1.strip(), v2.strip())
+    return grafo
+
+def main(argumentos=None):
+    # Uso: python "conectividad y ruta simple.py" [aristas.csv|.tsv|.gz [inicio fin]]
+    # Con archivo no se pregunta nada: cargador.py lo lee (texto o .gz, progreso en stderr) y
+    # el camino solo se busca si se indican inicio y fin. Sin archivo, todo es interactivo.
+    argumentos = sys.argv[1:] if argumentos is None else argumentos
+    if argumentos:
+        cargador = _importar_clase_11('cargador')
+        grafo = cargador.cargar_lista_aristas(argumentos[0])
+    else:
+        grafo = leer_grafo_interactivo()
 
     # Verificar si el grafo es conexo
     print("El grafo es conexo:", grafo.es_conexo())
 
     # Encontrar caminos
-    inicio = input("Ingrese el vértice de inicio: ")
-    fin = input("Ingrese el vértice de fin: ")
+    if len(argumentos) >= 3:
+        inicio, fin = argumentos[1], argumentos[2]
+    elif argumentos:
+        return
+    else:
+        inicio = input("Ingrese el vértice de inicio: ")
+        fin = input("Ingrese el vértice de fin: ")
     camino = grafo.encontrar_camino(inicio.strip(), fin.strip())
     if camino:
         print(f"Camino de '{inicio}' a '{fin}':", camino)
@@ -1,18 +1,55 @@
 import collections
+import importlib
+import logging
+import os
+import sys
+
+# Los eventos del grafo (vértices/aristas agregados, visitas) se emiten a nivel DEBUG.
+# Por defecto no se muestra nada; para verlos: logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+# Los caminos ponderados reutilizan caminos_ponderados.py y grafo_compacto.py de esta carpeta
+CARPETA_CLASE_11 = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Clase-11-Junio-Grafos')
+
+def _importar_clase_11(nombre):
+    # Se importan al primer uso: el resto del módulo no depende de esa carpeta
+    if CARPETA_CLASE_11 not in sys.path:
+        sys.path.append(CARPETA_CLASE_11)
+    return importlib.import_module(nombre)
+
+class RecorridoDFS:
+    # Resultado de Grafo.recorrer_dfs
+    def __init__(self):
+        self.orden = []  # Vértices en orden de descubrimiento
+        self.descubrimiento = {}  # vertice -> tiempo de descubrimiento
+        self.finalizacion = {}  # vertice -> tiempo de finalización
+        self.padres = {}  # vertice -> padre en el árbol DFS (None para las raíces)
+        self.aristas = {'arbol': [], 'retroceso': [], 'avance': [], 'cruce': []}
 
 class Grafo:
-    def __init__(self, es_dirigido=False):
+    def __init__(self, es_dirigido=False, rastreo=None):
         self.grafo = {}
         self.es_dirigido = es_dirigido
+        # Función opcional rastreo(evento, datos) que recibe cada evento del grafo,
+        # p. ej. rastreo('arista_agregada', {'u': 'A', 'v': 'B'})
+        self.rastreo = rastreo
+        # Adyacencia de entrada (grafo dirigido): se construye al necesitarla y, desde
+        # entonces, se mantiene al día en cada alta o baja en lugar de reconstruirse
+        self._entrada = None
+        self.pesos = {}  # Peso de cada arista: pesos[(u, v)]
+        self._compacto = None  # Copia CSR con los pesos (ver compactar), se invalida al modificar el grafo
 
     def agregar_vertice(self, vertice):
     # Si el vértice no está en el diccionario, lo añade con un conjunto vacío de vecinos
         if vertice not in self.grafo:
             self.grafo[vertice] = set()
-            print(f"Vértice '{vertice}' agregado.")
+            self._compacto = None
+            if self._entrada is not None:
+                self._entrada[vertice] = set()
+            self._emitir('vertice_agregado', "Vértice '%s' agregado.", vertice=vertice)
             # Obtener vecinos de los vértices en el grafo dirigido
         else:
-            print(f"Vértice '{vertice}' ya existe.")
+            self._emitir('vertice_existente', "Vértice '%s' ya existe.", vertice=vertice)
     def agregar_arista(self, u, v, peso=1):
         # Asegurarse de que ambos vértices existan en el grafo
         self.agregar_vertice(u)
@@ -20,16 +57,103 @@ class Grafo:
     
         # Añadir la arista
         self.grafo[u].add(v)
-        print(f"Arista {u} -> {v} agregada.")
+        self.pesos[(u, v)] = peso
+        self._compacto = None
+        if self._entrada is not None:
+            self._entrada[v].add(u)
+        self._emitir('arista_agregada', "Arista %s -> %s agregada.", u=u, v=v)
     
         # Si no es dirigido, añadir la arista en la dirección opuesta también
         if not self.es_dirigido:
             self.grafo[v].add(u)
-            print(f"Arista {v} -> {u} (bidireccional) agregada.")
+            self.pesos[(v, u)] = peso
+            if self._entrada is not None:
+                self._entrada[u].add(v)
+            self._emitir('arista_agregada', "Arista %s -> %s (bidireccional) agregada.", u=v, v=u)
+    def eliminar_arista(self, u, v):
+        # Quita la arista u -> v (y v -> u si el grafo no es dirigido). Con conjuntos es O(1)
+        if not self.existe_arista(u, v):
+            raise ValueError(f"La arista {u} -> {v} no existe")
+        self.grafo[u].discard(v)
+        self.pesos.pop((u, v), None)
+        self._compacto = None
+        if self._entrada is not None:
+            self._entrada[v].discard(u)
+        if not self.es_dirigido:
+            self.grafo[v].discard(u)
+            self.pesos.pop((v, u), None)
+            if self._entrada is not None:
+                self._entrada[u].discard(v)
+        self._emitir('arista_eliminada', "Arista %s -> %s eliminada.", u=u, v=v)
+    def eliminar_vertice(self, vertice):
+        # Quita el vértice con todas sus aristas de salida y de entrada
+        if vertice not in self.grafo:
+            raise ValueError(f"El vértice {vertice} no existe en el grafo")
+        self._compacto = None
+        # Vértices con aristas hacia 'vertice' (en un grafo no dirigido, sus propios vecinos)
+        origenes = self._adyacencia_entrada()[vertice] if self.es_dirigido else self.grafo[vertice]
+        for u in list(origenes):  # Copia: con un lazo, origenes es el mismo conjunto que se modifica
+            self.grafo[u].discard(vertice)
+            self.pesos.pop((u, vertice), None)
+        for v in self.grafo.pop(vertice):
+            self.pesos.pop((vertice, v), None)
+            if self._entrada is not None and v != vertice:
+                self._entrada[v].discard(vertice)
+        if self._entrada is not None:
+            del self._entrada[vertice]
+        self._emitir('vertice_eliminado', "Vértice '%s' eliminado.", vertice=vertice)
+    def _rastreando(self):
+        return self.rastreo is not None or logger.isEnabledFor(logging.DEBUG)
+    def _emitir(self, evento, mensaje, **datos):
+        # Envía el evento al rastreo y/o al logger. El mensaje solo se formatea si el
+        # nivel DEBUG está activo, así que con todo desactivado el costo es mínimo
+        if self.rastreo is not None:
+            self.rastreo(evento, datos)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(mensaje, *datos.values())
     def obtener_vecinos(self, vertice):
         if vertice in self.grafo:
             return list(self.grafo[vertice])  # Convertir a lista para devolver
         return []  # Si el vértice no existe, no tiene vecinos
+    def iterar_vecinos(self, vertice):
+        # Recorre los vecinos en su sitio, sin copiarlos a una lista nueva.
+        # Es de solo lectura: no se debe modificar el grafo mientras se recorre
+        return iter(self.grafo.get(vertice, ()))
+    def obtener_vecinos_entrada(self, vertice):
+        # Vértices con una arista hacia 'vertice'. En un grafo no dirigido son los mismos vecinos
+        if not self.es_dirigido:
+            return self.obtener_vecinos(vertice)
+        return list(self._adyacencia_entrada().get(vertice, []))
+    def iterar_vecinos_entrada(self, vertice):
+        # Igual que obtener_vecinos_entrada, pero sin copiar la lista
+        if not self.es_dirigido:
+            return self.iterar_vecinos(vertice)
+        return iter(self._adyacencia_entrada().get(vertice, ()))
+    def _adyacencia_entrada(self):
+        if self._entrada is None:
+            # Conjuntos, como la adyacencia de salida: quitar un origen es O(1)
+            self._entrada = {u: set() for u in self.grafo}
+            for u, vecinos in self.grafo.items():
+                for v in vecinos:
+                    self._entrada[v].add(u)
+        return self._entrada
+    def obtener_peso(self, u, v):
+        # Peso de la arista u -> v, o None si la arista no existe
+        return self.pesos.get((u, v))
+    def compactar(self):
+        # Copia congelada (GrafoCompacto, CSR) con los pesos guardados. Se construye una sola
+        # vez y se reutiliza mientras el grafo no cambie
+        if self._compacto is None:
+            adyacencia = {u: [(v, self.pesos[(u, v)]) for v in vecinos] for u, vecinos in self.grafo.items()}
+            GrafoCompacto = _importar_clase_11('grafo_compacto').GrafoCompacto
+            self._compacto = GrafoCompacto.desde_adyacencia(adyacencia, self.es_dirigido)
+        return self._compacto
+    def camino_mas_corto(self, inicio, fin, heuristica=None, radio=None, espacio=None):
+        # Camino de menor peso total: (camino, costo), ([], inf) si no hay camino. Con heurística
+        # usa A*; radio y espacio como en caminos_ponderados.camino_mas_corto, que hace la búsqueda.
+        # Lanza ValueError si algún peso es negativo
+        caminos_ponderados = _importar_clase_11('caminos_ponderados')
+        return caminos_ponderados.camino_mas_corto(self.compactar(), inicio, fin, heuristica, radio, espacio)
     def existe_arista(self, u, v):
         # Verifica si ambos vértices existen y si 'v' está en la lista de adyacencia de 'u'
         return u in self.grafo and v in self.grafo[u]
@@ -44,37 +168,98 @@ class Grafo:
         visitados.add(inicio)
     
         recorrido = []  # Lista para almacenar el orden de visita
+        emitir = self._rastreando()  # Se consulta una sola vez, no en cada vértice
     
         while cola:
             # Sacar el primer elemento de la cola
             vertice_actual = cola.popleft()
             # Añadir el vértice actual al recorrido
             recorrido.append(vertice_actual)
-            print(f"Visitando: {vertice_actual}")
+            if emitir:
+                self._emitir('visita', "Visitando: %s", vertice=vertice_actual)
     
             # Añadir a la cola los vecinos no visitados
-            for vecino in self.obtener_vecinos(vertice_actual):
+            for vecino in self.iterar_vecinos(vertice_actual):
                 if vecino not in visitados:
                     visitados.add(vecino)
                     cola.append(vecino)
     
         return recorrido
-    def dfs(self, inicio):
-        visitados = set()
-        recorrido = []
+    def dfs(self, inicio, al_descubrir=None, al_terminar=None):
+        # DFS iterativo con pila explícita: no tiene límite de recursión.
+        # Visita en el mismo orden que la versión recursiva (y que dfs() de breadth_first_search.py).
+        # Con al_descubrir/al_terminar se usa el motor completo (recorrer_dfs)
+        if al_descubrir is None and self._rastreando():
+            al_descubrir = lambda vertice: self._emitir('visita', "Visitando: %s", vertice=vertice)
+        if al_descubrir is not None or al_terminar is not None:
+            return self.recorrer_dfs(inicio, al_descubrir, al_terminar).orden
     
-        def _dfs_recursivo(vertice):
-            visitados.add(vertice)
-            recorrido.append(vertice)
-            print(f"Visitando: {vertice}")
-    
-            for vecino in self.obtener_vecinos(vertice):
+        # Camino rápido sin callbacks: la pila guarda un iterador de vecinos por vértice
+        visitados = {inicio}
+        recorrido = [inicio]
+        pila = [iter(self.grafo.get(inicio, ()))]
+        while pila:
+            for vecino in pila[-1]:
                 if vecino not in visitados:
-                    _dfs_recursivo(vecino)
-    
-        # Iniciar el DFS desde el vértice dado
-        _dfs_recursivo(inicio)
+                    visitados.add(vecino)
+                    recorrido.append(vecino)
+                    pila.append(iter(self.grafo[vecino]))
+                    break
+            else:
+                pila.pop()  # Sin vecinos por visitar: retroceder
         return recorrido
+    def recorrer_dfs(self, inicio=None, al_descubrir=None, al_terminar=None):
+        # Motor DFS iterativo. Si inicio es None recorre todo el grafo (bosque DFS).
+        # al_descubrir(vertice) se llama al entrar a un vértice y al_terminar(vertice) al salir.
+        # Devuelve un RecorridoDFS con orden, tiempos de descubrimiento/finalización,
+        # padres y clasificación de aristas (arbol, retroceso, avance, cruce).
+        resultado = RecorridoDFS()
+        descubrimiento, finalizacion = resultado.descubrimiento, resultado.finalizacion
+        tiempo = 0
+        raices = self.grafo if inicio is None else [inicio]
+    
+        for raiz in raices:
+            if raiz in descubrimiento:
+                continue
+            tiempo += 1
+            descubrimiento[raiz] = tiempo
+            resultado.padres[raiz] = None
+            resultado.orden.append(raiz)
+            if al_descubrir:
+                al_descubrir(raiz)
+            pila = [(raiz, iter(self.grafo.get(raiz, ())))]
+    
+            while pila:
+                vertice, vecinos = pila[-1]
+                for vecino in vecinos:
+                    if vecino not in descubrimiento:
+                        # Blanco: arista de árbol
+                        resultado.aristas['arbol'].append((vertice, vecino))
+                        tiempo += 1
+                        descubrimiento[vecino] = tiempo
+                        resultado.padres[vecino] = vertice
+                        resultado.orden.append(vecino)
+                        if al_descubrir:
+                            al_descubrir(vecino)
+                        pila.append((vecino, iter(self.grafo[vecino])))
+                        break
+                    if vecino not in finalizacion:
+                        # Gris (en la pila): arista de retroceso. En un grafo no dirigido
+                        # la arista hacia el padre es la misma arista de árbol vista al revés
+                        if self.es_dirigido or vecino != resultado.padres[vertice]:
+                            resultado.aristas['retroceso'].append((vertice, vecino))
+                    elif self.es_dirigido:
+                        # Negro: de avance si es descendiente, de cruce en otro caso.
+                        # (En un grafo no dirigido ya se clasificó desde el otro extremo)
+                        tipo = 'avance' if descubrimiento[vertice] < descubrimiento[vecino] else 'cruce'
+                        resultado.aristas[tipo].append((vertice, vecino))
+                else:
+                    pila.pop()
+                    tiempo += 1
+                    finalizacion[vertice] = tiempo
+                    if al_terminar:
+                        al_terminar(vertice)
+        return resultado
     def imprimir_grafo(self):
         print("\n--- Representación del Grafo ---")
         for vertice, vecinos in self.grafo.items():
@@ -89,113 +274,199 @@ class Grafo:
     
         # Realizar un BFS desde el primer vértice
         recorrido_bfs = self.bfs(primer_vertice)
+        # Es conexo si el recorrido alcanzó todos los vértices
+        return len(recorrido_bfs) == len(self.grafo)
     def encontrar_camino(self, inicio, fin):
         # Verificar si los vértices de inicio y fin existen en el grafo
         if inicio not in self.grafo or fin not in self.grafo:
-            print(f"Error: '{inicio}' o '{fin}' no existen en el grafo.")
+            self._emitir('vertice_inexistente', "Error: '%s' o '%s' no existen en el grafo.", inicio=inicio, fin=fin)
             return []
     
-        # Inicializar la cola, el conjunto de vértices visitados y el diccionario de padres
-        cola = collections.deque()
-        visitados = set()
-        padres = {}  # Para reconstruir el camino: padres[hijo] = padre
+        if inicio == fin:
+            return [inicio]
     
-        # Agregar el vértice de inicio a la cola y al conjunto de visitados
-        cola.append(inicio)
-        visitados.add(inicio)
-        padres[inicio] = None  # El vértice de inicio no tiene padre
+        # Búsqueda bidireccional: un BFS hacia adelante desde inicio y otro hacia atrás desde fin.
+        # Siempre se expande un nivel completo de la frontera más pequeña.
+        padres_inicio = {inicio: None}  # padres_inicio[hijo] = padre
+        padres_fin = {fin: None}  # padres_fin[v] = siguiente vértice hacia fin
+        frontera_inicio = [inicio]
+        frontera_fin = [fin]
     
-        while cola:
-            vertice_actual = cola.popleft()
+        while frontera_inicio and frontera_fin:
+            if len(frontera_inicio) <= len(frontera_fin):
+                frontera_inicio, encuentro = self._expandir_nivel(
+                    frontera_inicio, padres_inicio, padres_fin, self.iterar_vecinos)
+            else:
+                frontera_fin, encuentro = self._expandir_nivel(
+                    frontera_fin, padres_fin, padres_inicio, self.iterar_vecinos_entrada)
     
-            # Si hemos llegado al vértice de destino, reconstruir el camino
-            if vertice_actual == fin:
+            # Si las dos búsquedas se encontraron, unir ambos lados para reconstruir el camino
+            if encuentro is not None:
                 camino = []
-                temp = fin
+                temp = encuentro
                 while temp is not None:
                     camino.append(temp)
-                    temp = padres[temp]
-                return camino[::-1]  # Invertir el camino para que vaya de inicio a fin
+                    temp = padres_inicio[temp]
+                camino.reverse()  # Invertir para que vaya de inicio al punto de encuentro
+                temp = padres_fin[encuentro]
+                while temp is not None:
+                    camino.append(temp)
+                    temp = padres_fin[temp]
+                return camino
     
-            # Explorar los vecinos del vértice actual
-            for vecino in self.obtener_vecinos(vertice_actual):
+        # Si llegamos aquí, no se encontró un camino
+        return []
+    @staticmethod
+    def _expandir_nivel(frontera, padres, padres_otro, vecinos):
+        # Expande un nivel completo de una de las dos búsquedas. Devuelve la nueva frontera
+        # y el primer vértice que ya había alcanzado la otra búsqueda (None si no hubo encuentro)
+        siguiente = []
+        for vertice_actual in frontera:
+            for vecino in vecinos(vertice_actual):
+                if vecino not in padres:
+                    padres[vecino] = vertice_actual
+                    if vecino in padres_otro:
+                        return siguiente, vecino
+                    siguiente.append(vecino)
+        return siguiente, None
+    def componentes_fuertemente_conexas(self):
+        # Kosaraju, sin recursión: 1) recorrer_dfs sobre todo el grafo anota el orden de
+        # finalización; 2) en orden inverso de finalización, cada BFS por las aristas de entrada
+        # alcanza exactamente una componente. Las componentes salen en orden topológico
+        # de la condensación (fuentes primero). O(n + m).
+        finalizados = []
+        self.recorrer_dfs(al_terminar=finalizados.append)
+        asignados = set()
+        componentes = []
+        for raiz in reversed(finalizados):
+            if raiz in asignados:
+                continue
+            asignados.add(raiz)
+            componente = [raiz]
+            for vertice in componente:
+                for vecino in self.iterar_vecinos_entrada(vertice):
+                    if vecino not in asignados:
+                        asignados.add(vecino)
+                        componente.append(vecino)
+            componentes.append(componente)
+        return componentes
+    def es_fuertemente_conexo(self):
+        # Todo vértice alcanzable desde el primero, siguiendo las aristas y en sentido contrario
+        if not self.grafo:
+            return True
+        primer_vertice = next(iter(self.grafo))
+        if len(self.bfs(primer_vertice)) != len(self.grafo):
+            return False
+        visitados = {primer_vertice}
+        cola = [primer_vertice]
+        for vertice in cola:
+            for vecino in self.iterar_vecinos_entrada(vertice):
                 if vecino not in visitados:
                     visitados.add(vecino)
-                    padres[vecino] = vertice_actual  # Guardar el padre
                     cola.append(vecino)
-    
-        # Si llegamos aquí, no se encontró un camino
-        return []
+        return len(visitados) == len(self.grafo)
+    def orden_topologico(self):
+        # Orden inverso de finalización del DFS. Lanza ValueError si hay una arista de retroceso (ciclo)
+        if not self.es_dirigido and any(self.grafo.values()):
+            raise ValueError("El orden topológico solo está definido para grafos dirigidos")
+        finalizados = []
+        recorrido = self.recorrer_dfs(al_terminar=finalizados.append)
+        if recorrido.aristas['retroceso']:
+            u, v = recorrido.aristas['retroceso'][0]
+            raise ValueError(f"El grafo tiene un ciclo (arista {u} -> {v}): no existe un orden topológico")
+        finalizados.reverse()
+        return finalizados
 # --- EJECUCIÓN DEL EJEMPLO COMPLETO ---
-print(" --- Creación de Grafo No Dirigido --- ")
-mi_grafo = Grafo(es_dirigido=False)
-
-# Agregar aristas al grafo
-mi_grafo.agregar_arista('Managua', 'Masaya')
-mi_grafo.agregar_arista('Managua', 'León')
-mi_grafo.agregar_arista('Masaya', 'Granada')
-mi_grafo.agregar_arista('Granada', 'Rivas')
-mi_grafo.agregar_arista('Managua', 'Granada')  # Arista adicional para mayor conectividad
-
-# Imprimir el grafo
-mi_grafo.imprimir_grafo()
-
-print("\n --- Operaciones Básicas --- ")
-# Obtener vecinos de un vértice
-print(f"Vecinos de Managua: {mi_grafo.obtener_vecinos('Managua')}")
-
-# Verificar existencia de arista
-print(f"¿Existe arista entre Managua y Masaya? {mi_grafo.existe_arista('Managua', 'Masaya')}")
-print(f"¿Existe arista entre Managua y Rivas? {mi_grafo.existe_arista('Managua', 'Rivas')}")
-
-print("\n --- Recorridos --- ")
-# Recorrido BFS y DFS desde Managua
-print(f"Orden de recorrido BFS desde Managua: {mi_grafo.bfs('Managua')}")
-print(f"Orden de recorrido DFS desde Managua: {mi_grafo.dfs('Managua')}")
-
-print("\n --- Conectividad y Caminos --- ")
-# Verificar si el grafo es conexo
-print(f"¿Es el grafo conexo? {mi_grafo.es_conexo()}")
-# Encontrar camino entre dos vértices
-camino = mi_grafo.encontrar_camino('Managua', 'Rivas')
-print(f"Camino de Managua a Rivas: {camino}")
-
-# Intentar encontrar un camino entre vértices que no tienen conexión
-camino_inexistente = mi_grafo.encontrar_camino('Managua', 'Juigalpa')
-print(f"Camino de Managua a Juigalpa: {camino_inexistente}")
-
-# --- Probar con un grafo dirigido ---
-print("\n --- Creación de Grafo Dirigido ---")
-grafo_dirigido = Grafo(es_dirigido=True)
-
-# Agregar aristas al grafo dirigido
-grafo_dirigido.agregar_arista('Inicio', 'A')
-grafo_dirigido.agregar_arista('A', 'B')
-grafo_dirigido.agregar_arista('B', 'C')
-grafo_dirigido.agregar_arista('C', 'Fin')
-grafo_dirigido.agregar_arista('Inicio', 'D')
-grafo_dirigido.agregar_arista('D', 'Fin')
-
-# Imprimir el grafo dirigido
-grafo_dirigido.imprimir_grafo()
-# Obtener vecinos de los vértices en el grafo dirigido
-print(f"Vecinos de Inicio (dirigido): {grafo_dirigido.obtener_vecinos('Inicio')}")
-print(f"Vecinos de Fin (dirigido): {grafo_dirigido.obtener_vecinos('Fin')}") # Debería ser vacío
-
-# Verificar existencia de aristas en el grafo dirigido
-print(f"¿Existe arista de A a B? {grafo_dirigido.existe_arista('A', 'B')}")
-print(f"¿Existe arista de B a A? {grafo_dirigido.existe_arista('B', 'A')}") # Debería ser False
-
-print("\n --- Recorridos en Grafo Dirigido ---")
-# Realizar recorridos BFS y DFS en el grafo dirigido
-print(f"Orden de recorrido BFS desde Inicio: {grafo_dirigido.bfs('Inicio')}")
-print(f"Orden de recorrido DFS desde Inicio: {grafo_dirigido.dfs('Inicio')}")
-
-print("\n --- Conectividad y Caminos en Grafo Dirigido ---")
-# La conectividad no es tan directamente aplicable a grafos dirigidos sin modificar la definición
-# pero podemos encontrar caminos entre vértices
-camino_dirigido = grafo_dirigido.encontrar_camino('Inicio', 'Fin')
-print(f"Camino dirigido de Inicio a Fin: {camino_dirigido}")
-
-camino_dirigido_no_existente = grafo_dirigido.encontrar_camino('Fin', 'Inicio')
-print(f"Camino dirigido de Fin a Inicio: {camino_dirigido_no_existente}")
+# Solo al ejecutar el archivo directamente; importar el módulo no tiene efectos secundarios
+if __name__ == "__main__":
+    # Mostrar los eventos del grafo (vértices, aristas, visitas) como en la versión original
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+
+    print(" --- Creación de Grafo No Dirigido --- ")
+    mi_grafo = Grafo(es_dirigido=False)
+
+    # Agregar aristas al grafo
+    mi_grafo.agregar_arista('Managua', 'Masaya')
+    mi_grafo.agregar_arista('Managua', 'León')
+    mi_grafo.agregar_arista('Masaya', 'Granada')
+    mi_grafo.agregar_arista('Granada', 'Rivas')
+    mi_grafo.agregar_arista('Managua', 'Granada')  # Arista adicional para mayor conectividad
+
+    # Imprimir el grafo
+    mi_grafo.imprimir_grafo()
+
+    print("\n --- Operaciones Básicas --- ")
+    # Obtener vecinos de un vértice
+    print(f"Vecinos de Managua: {mi_grafo.obtener_vecinos('Managua')}")
+
+    # Verificar existencia de arista
+    print(f"¿Existe arista entre Managua y Masaya? {mi_grafo.existe_arista('Managua', 'Masaya')}")
+    print(f"¿Existe arista entre Managua y Rivas? {mi_grafo.existe_arista('Managua', 'Rivas')}")
+
+    print("\n --- Recorridos --- ")
+    # Recorrido BFS y DFS desde Managua
+    print(f"Orden de recorrido BFS desde Managua: {mi_grafo.bfs('Managua')}")
+    print(f"Orden de recorrido DFS desde Managua: {mi_grafo.dfs('Managua')}")
+
+    print("\n --- Conectividad y Caminos --- ")
+    # Verificar si el grafo es conexo
+    print(f"¿Es el grafo conexo? {mi_grafo.es_conexo()}")
+    # Encontrar camino entre dos vértices
+    camino = mi_grafo.encontrar_camino('Managua', 'Rivas')
+    print(f"Camino de Managua a Rivas: {camino}")
+
+    # Intentar encontrar un camino entre vértices que no tienen conexión
+    camino_inexistente = mi_grafo.encontrar_camino('Managua', 'Juigalpa')
+    print(f"Camino de Managua a Juigalpa: {camino_inexistente}")
+
+    # Con pesos (km aproximados), el camino más corto no siempre es el de menos aristas
+    carreteras = Grafo(es_dirigido=False)
+    carreteras.agregar_arista('Managua', 'Granada', peso=60)
+    carreteras.agregar_arista('Managua', 'Masaya', peso=28)
+    carreteras.agregar_arista('Masaya', 'Granada', peso=17)
+    carreteras.agregar_arista('Granada', 'Rivas', peso=70)
+    print(f"Camino más corto de Managua a Rivas (km): {carreteras.camino_mas_corto('Managua', 'Rivas')}")
+    print(f"Con radio de 50 km: {carreteras.camino_mas_corto('Managua', 'Rivas', radio=50)}")
+
+    # --- Probar con un grafo dirigido ---
+    print("\n --- Creación de Grafo Dirigido ---")
+    grafo_dirigido = Grafo(es_dirigido=True)
+
+    # Agregar aristas al grafo dirigido
+    grafo_dirigido.agregar_arista('Inicio', 'A')
+    grafo_dirigido.agregar_arista('A', 'B')
+    grafo_dirigido.agregar_arista('B', 'C')
+    grafo_dirigido.agregar_arista('C', 'Fin')
+    grafo_dirigido.agregar_arista('Inicio', 'D')
+    grafo_dirigido.agregar_arista('D', 'Fin')
+
+    # Imprimir el grafo dirigido
+    grafo_dirigido.imprimir_grafo()
+    # Obtener vecinos de los vértices en el grafo dirigido
+    print(f"Vecinos de Inicio (dirigido): {grafo_dirigido.obtener_vecinos('Inicio')}")
+    print(f"Vecinos de Fin (dirigido): {grafo_dirigido.obtener_vecinos('Fin')}") # Debería ser vacío
+
+    # Verificar existencia de aristas en el grafo dirigido
+    print(f"¿Existe arista de A a B? {grafo_dirigido.existe_arista('A', 'B')}")
+    print(f"¿Existe arista de B a A? {grafo_dirigido.existe_arista('B', 'A')}") # Debería ser False
+
+    print("\n --- Recorridos en Grafo Dirigido ---")
+    # Realizar recorridos BFS y DFS en el grafo dirigido
+    print(f"Orden de recorrido BFS desde Inicio: {grafo_dirigido.bfs('Inicio')}")
+    print(f"Orden de recorrido DFS desde Inicio: {grafo_dirigido.dfs('Inicio')}")
+    recorrido_dfs = grafo_dirigido.recorrer_dfs('Inicio')
+    print(f"Tiempos (descubrimiento/finalización): "
+          f"{ {v: (recorrido_dfs.descubrimiento[v], recorrido_dfs.finalizacion[v]) for v in recorrido_dfs.orden} }")
+    print(f"Clasificación de aristas: {recorrido_dfs.aristas}")
+
+    print("\n --- Conectividad y Caminos en Grafo Dirigido ---")
+    # En un grafo dirigido la conectividad se mide como conectividad fuerte
+    print(f"¿Fuertemente conexo?: {grafo_dirigido.es_fuertemente_conexo()}")
+    print(f"Componentes fuertemente conexas: {grafo_dirigido.componentes_fuertemente_conexas()}")
+    print(f"Orden topológico: {grafo_dirigido.orden_topologico()}")
+    # Y podemos encontrar caminos entre vértices
+    camino_dirigido = grafo_dirigido.encontrar_camino('Inicio', 'Fin')
+    print(f"Camino dirigido de Inicio a Fin: {camino_dirigido}")
+
+    camino_dirigido_no_existente = grafo_dirigido.encontrar_camino('Fin', 'Inicio')
+    print(f"Camino dirigido de Fin a Inicio: {camino_dirigido_no_existente}")